@@ -3,6 +3,8 @@
 This module contains the core agent infrastructure for LurkBot:
 - types.py: Core data types (AgentContext, AgentRunResult, etc.)
 - runtime.py: PydanticAI Agent runtime (run_embedded_agent)
+- enrichment.py: Concurrent pre-LLM enrichment pipeline
+- pool.py: Reusable agent/provider pool
 - api.py: FastAPI HTTP/SSE endpoints
 - bootstrap.py: Bootstrap file system (8 files)
 - system_prompt.py: System prompt generator (23 sections)
@@ -15,6 +17,7 @@ from lurkbot.agents.types import (
     AgentRunResult,
     PromptMode,
     SessionType,
+    StageTiming,
     StreamEvent,
     ThinkLevel,
     ToolResultFormat,
@@ -26,12 +29,26 @@ from lurkbot.agents.types import (
 from lurkbot.agents.runtime import (
     AgentDependencies,
     create_agent,
+    resolve_agent_model,
     resolve_model_id,
     run_embedded_agent,
     run_embedded_agent_events,
     run_embedded_agent_stream,
 )
 
+from lurkbot.agents.enrichment import (
+    DEFAULT_ENRICHMENT_BUDGET_MS,
+    EnrichmentPipeline,
+    EnrichmentResult,
+)
+
+from lurkbot.agents.pool import (
+    DEFAULT_AGENT_POOL_SIZE,
+    AgentPool,
+    AgentPoolStats,
+    get_agent_pool,
+)
+
 from lurkbot.agents.api import (
     ChatRequest,
     ChatResponse,
@@ -104,6 +121,7 @@ __all__ = [
     "AgentRunResult",
     "PromptMode",
     "SessionType",
+    "StageTiming",
     "StreamEvent",
     "ThinkLevel",
     "ToolResultFormat",
@@ -113,10 +131,20 @@ __all__ = [
     "parse_session_key",
     # Runtime functions
     "create_agent",
+    "resolve_agent_model",
     "resolve_model_id",
     "run_embedded_agent",
     "run_embedded_agent_events",
     "run_embedded_agent_stream",
+    # Enrichment pipeline
+    "DEFAULT_ENRICHMENT_BUDGET_MS",
+    "EnrichmentPipeline",
+    "EnrichmentResult",
+    # Agent pool
+    "DEFAULT_AGENT_POOL_SIZE",
+    "AgentPool",
+    "AgentPoolStats",
+    "get_agent_pool",
     # API
     "ChatRequest",
     "ChatResponse",
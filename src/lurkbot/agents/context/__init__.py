@@ -4,15 +4,20 @@ This module provides context storage and retrieval functionality
 using ChromaDB as the vector database backend.
 """
 
+from .async_storage import AsyncContextStorage, WriteBehindStats
+from .history import ContextHistoryIndex
 from .manager import ContextManager
 from .models import ContextRecord, RetrievedContext
 from .retrieval import ContextRetrieval
 from .storage import ContextStorage
 
 __all__ = [
+    "AsyncContextStorage",
+    "ContextHistoryIndex",
     "ContextManager",
     "ContextRecord",
     "ContextRetrieval",
     "ContextStorage",
     "RetrievedContext",
+    "WriteBehindStats",
 ]
@@ -0,0 +1,253 @@
+"""Non-blocking wrapper around ContextStorage.
+
+ChromaDB embeds documents and runs HNSW queries synchronously, which blocks
+the event loop (and every WebSocket served by it) while one user's context is
+processed. ``AsyncContextStorage`` runs those calls in a bounded thread pool
+and routes interaction writes through a write-behind queue that coalesces
+many interactions into a single ``save_contexts_batch`` call.
+"""
+
+import asyncio
+import contextlib
+import functools
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from lurkbot.logging import get_logger
+
+from .storage import ContextStorage
+
+logger = get_logger("context.async_storage")
+
+T = TypeVar("T")
+
+
+@dataclass
+class WriteBehindStats:
+    """Write-behind queue metrics."""
+
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    enqueued: int = 0
+    flushed: int = 0
+    flush_count: int = 0
+    failed_flushes: int = 0
+    last_flush_latency_ms: float = 0.0
+    total_flush_latency_ms: float = 0.0
+
+    @property
+    def avg_flush_latency_ms(self) -> float:
+        """Average flush latency in milliseconds."""
+        return self.total_flush_latency_ms / self.flush_count if self.flush_count else 0.0
+
+    @property
+    def avg_batch_size(self) -> float:
+        """Average number of records per flush."""
+        return self.flushed / self.flush_count if self.flush_count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "enqueued": self.enqueued,
+            "flushed": self.flushed,
+            "flush_count": self.flush_count,
+            "failed_flushes": self.failed_flushes,
+            "last_flush_latency_ms": self.last_flush_latency_ms,
+            "avg_flush_latency_ms": self.avg_flush_latency_ms,
+            "avg_batch_size": self.avg_batch_size,
+        }
+
+
+class AsyncContextStorage:
+    """Async facade over :class:`ContextStorage`.
+
+    Reads run in a bounded thread pool. Writes submitted with
+    :meth:`enqueue` are buffered and flushed in the background, either every
+    ``flush_interval`` seconds or as soon as ``max_batch_size`` records are
+    pending. When ``max_queue_size`` records are pending, :meth:`enqueue`
+    flushes inline, which applies backpressure to producers.
+    """
+
+    def __init__(
+        self,
+        storage: ContextStorage,
+        max_workers: int = 4,
+        flush_interval: float = 0.5,
+        max_batch_size: int = 128,
+        max_queue_size: int = 2048,
+    ):
+        """Initialize the async storage.
+
+        Args:
+            storage: Underlying synchronous storage
+            max_workers: Thread pool size for ChromaDB calls
+            flush_interval: Maximum delay before queued writes are flushed (seconds)
+            max_batch_size: Pending record count that triggers an early flush
+            max_queue_size: Pending record count at which producers flush inline
+        """
+        self.storage = storage
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.max_queue_size = max_queue_size
+        self.stats = WriteBehindStats()
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="context-storage"
+        )
+        self._pending: list[dict[str, Any]] = []
+        self._flush_lock: asyncio.Lock | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of records waiting to be written."""
+        return len(self._pending)
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable in the storage thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def query_raw(
+        self,
+        query_texts: list[str] | None = None,
+        query_embeddings: list[list[float]] | None = None,
+        n_results: int = 5,
+        where: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Run a ChromaDB query without blocking the event loop."""
+        return await self.run(
+            self.storage.query_raw,
+            query_texts=query_texts,
+            query_embeddings=query_embeddings,
+            n_results=n_results,
+            where=where,
+        )
+
+    async def save_contexts_batch(self, contexts: list[dict[str, Any]]) -> None:
+        """Write contexts immediately, bypassing the write-behind queue."""
+        await self.run(self.storage.save_contexts_batch, contexts)
+
+    async def delete_session_contexts(self, session_id: str) -> None:
+        """Delete all contexts for a session, including queued writes."""
+        self._pending = [c for c in self._pending if c["metadata"].get("session_id") != session_id]
+        self._update_depth()
+        await self.run(self.storage.delete_session_contexts, session_id)
+
+    async def delete_user_contexts(self, user_id: str) -> None:
+        """Delete all contexts for a user, including queued writes."""
+        self._pending = [c for c in self._pending if c["metadata"].get("user_id") != user_id]
+        self._update_depth()
+        await self.run(self.storage.delete_user_contexts, user_id)
+
+    async def get_collection_stats(self) -> dict[str, Any]:
+        """Get collection statistics."""
+        return await self.run(self.storage.get_collection_stats)
+
+    async def enqueue(self, contexts: list[dict[str, Any]]) -> None:
+        """Queue contexts for a coalesced background write.
+
+        Args:
+            contexts: Context dicts in ``save_contexts_batch`` format
+        """
+        if not contexts:
+            return
+        if self._closed:
+            raise RuntimeError("AsyncContextStorage is closed")
+
+        self._pending.extend(contexts)
+        self.stats.enqueued += len(contexts)
+        self._update_depth()
+
+        if len(self._pending) >= self.max_queue_size:
+            await self.flush()
+            return
+
+        self._ensure_writer()
+        if len(self._pending) >= self.max_batch_size:
+            assert self._wakeup is not None
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Write all queued contexts in one batch.
+
+        Returns:
+            Number of records written
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch, self._pending = self._pending, []
+            self._update_depth()
+
+            start = time.perf_counter()
+            try:
+                await self.run(self.storage.save_contexts_batch, batch)
+            except Exception as e:
+                # Put the batch back so it is retried on the next flush
+                self._pending[:0] = batch
+                self._update_depth()
+                self.stats.failed_flushes += 1
+                logger.error(f"Write-behind flush of {len(batch)} contexts failed: {e}")
+                raise
+
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.stats.flush_count += 1
+            self.stats.flushed += len(batch)
+            self.stats.last_flush_latency_ms = latency_ms
+            self.stats.total_flush_latency_ms += latency_ms
+            logger.debug(f"Flushed {len(batch)} contexts in {latency_ms:.1f}ms")
+            return len(batch)
+
+    async def close(self) -> None:
+        """Flush pending writes, stop the writer task and the thread pool."""
+        self._closed = True
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer_task
+            self._writer_task = None
+
+        try:
+            await self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get write-behind metrics."""
+        return self.stats.to_dict()
+
+    def _update_depth(self) -> None:
+        self.stats.queue_depth = len(self._pending)
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queue_depth)
+
+    def _ensure_writer(self) -> None:
+        if self._writer_task is None or self._writer_task.done():
+            self._wakeup = asyncio.Event()
+            self._writer_task = asyncio.create_task(
+                self._writer_loop(), name="context-write-behind"
+            )
+
+    async def _writer_loop(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+
+            # Failures are logged by flush(); keep the writer alive and retry
+            with contextlib.suppress(Exception):
+                await self.flush()
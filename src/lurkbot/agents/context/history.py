@@ -0,0 +1,221 @@
+"""Chronological context index.
+
+Recency lookups ("last N messages of this session") do not need semantic
+search. Running them through ChromaDB embeds an empty query and returns the
+*nearest* records instead of the *newest*. This module keeps a SQLite table
+keyed by ``(session_id, timestamp)`` and ``(user_id, timestamp)`` alongside
+the vector store, so recency and time-range lookups are plain index scans.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from lurkbot.logging import get_logger
+
+from .models import ContextRecord
+
+logger = get_logger("context.history")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contexts (
+    context_id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    context_type TEXT NOT NULL,
+    message_role TEXT NOT NULL,
+    has_tool_call INTEGER NOT NULL DEFAULT 0,
+    tool_names TEXT NOT NULL DEFAULT '',
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_contexts_session_ts ON contexts (session_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_contexts_user_ts ON contexts (user_id, timestamp);
+"""
+
+_COLUMNS = (
+    "context_id, session_id, user_id, timestamp, context_type, "
+    "message_role, has_tool_call, tool_names, text"
+)
+
+
+class ContextHistoryIndex:
+    """Time-ordered index of context records backed by SQLite.
+
+    The index is safe to use from the storage thread pool; all access is
+    serialized on an internal lock.
+    """
+
+    def __init__(self, db_path: str | Path = ":memory:"):
+        """Open (or create) the index.
+
+        Args:
+            db_path: SQLite database file, or ":memory:"
+        """
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def add(self, text: str, metadata: dict[str, Any]) -> None:
+        """Index a single context from its ChromaDB document and metadata."""
+        self.add_many([(text, metadata)])
+
+    def add_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> int:
+        """Index many contexts in one transaction.
+
+        Args:
+            items: ``(text, metadata)`` pairs in ChromaDB format
+
+        Returns:
+            Number of rows written
+        """
+        rows = [
+            (
+                metadata["context_id"],
+                metadata.get("session_id", ""),
+                metadata.get("user_id", ""),
+                float(metadata.get("timestamp", 0.0)),
+                metadata.get("context_type", ""),
+                metadata.get("message_role", ""),
+                int(bool(metadata.get("has_tool_call", False))),
+                metadata.get("tool_names", "") or "",
+                text,
+            )
+            for text, metadata in items
+        ]
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO contexts ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def recent_for_session(
+        self,
+        session_id: str,
+        limit: int = 10,
+        time_range: tuple[float, float] | None = None,
+    ) -> list[ContextRecord]:
+        """Get the newest records of a session (newest first)."""
+        return self._recent("session_id", session_id, limit, time_range)
+
+    def recent_for_user(
+        self,
+        user_id: str,
+        limit: int = 20,
+        time_range: tuple[float, float] | None = None,
+    ) -> list[ContextRecord]:
+        """Get the newest records of a user across sessions (newest first)."""
+        return self._recent("user_id", user_id, limit, time_range)
+
+    def ids_in_range(
+        self,
+        time_range: tuple[float, float],
+        user_id: str | None = None,
+        session_id: str | None = None,
+        context_types: list[str] | None = None,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Get context IDs within a time range (newest first).
+
+        Args:
+            time_range: Tuple of (start_timestamp, end_timestamp), inclusive
+            user_id: Filter by user ID
+            session_id: Filter by session ID
+            context_types: Filter by context types
+            limit: Maximum number of IDs
+
+        Returns:
+            Matching context IDs
+        """
+        clauses = ["timestamp BETWEEN ? AND ?"]
+        params: list[Any] = [time_range[0], time_range[1]]
+        if user_id:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if session_id:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if context_types:
+            clauses.append(f"context_type IN ({', '.join('?' * len(context_types))})")
+            params.extend(context_types)
+
+        sql = f"SELECT context_id FROM contexts WHERE {' AND '.join(clauses)} ORDER BY timestamp DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            return [row[0] for row in self._conn.execute(sql, params)]
+
+    def delete(self, context_ids: list[str]) -> None:
+        """Remove records by ID."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM contexts WHERE context_id = ?", [(cid,) for cid in context_ids]
+            )
+
+    def delete_session(self, session_id: str) -> None:
+        """Remove all records of a session."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM contexts WHERE session_id = ?", (session_id,))
+
+    def delete_user(self, user_id: str) -> None:
+        """Remove all records of a user."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM contexts WHERE user_id = ?", (user_id,))
+
+    def count(self) -> int:
+        """Number of indexed records."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM contexts").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _recent(
+        self,
+        column: str,
+        value: str,
+        limit: int,
+        time_range: tuple[float, float] | None,
+    ) -> list[ContextRecord]:
+        sql = f"SELECT {_COLUMNS} FROM contexts WHERE {column} = ?"
+        params: list[Any] = [value]
+        if time_range:
+            sql += " AND timestamp BETWEEN ? AND ?"
+            params.extend(time_range)
+        sql += " ORDER BY timestamp DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        return [
+            ContextRecord(
+                context_id=row[0],
+                session_id=row[1],
+                user_id=row[2],
+                timestamp=row[3],
+                context_type=row[4],
+                message_role=row[5],
+                has_tool_call=bool(row[6]),
+                tool_names=[name for name in row[7].split(",") if name],
+                text=row[8],
+            )
+            for row in rows
+        ]
@@ -1,11 +1,17 @@
 """Context manager - unified interface for context-aware system."""
 
+import asyncio
 import time
 import uuid
+from pathlib import Path
 from typing import Any
 
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+
 from lurkbot.logging import get_logger
+from lurkbot.memory.embeddings import EmbeddingCache
 
+from .async_storage import AsyncContextStorage
 from .models import ContextConfig, ContextRecord, RetrievedContext
 from .retrieval import ContextRetrieval
 from .storage import ContextStorage
@@ -21,12 +27,38 @@ class ContextManager:
         persist_directory: str = "./data/chroma_db",
         enable_auto_save: bool = True,
         max_context_length: int = 5,
+        write_behind: bool = True,
+        max_workers: int = 4,
+        flush_interval: float = 0.5,
+        embedding_cache_size: int = 4096,
+        persist_embeddings: bool = False,
     ):
-        """Initialize context manager."""
-        self.storage = ContextStorage(persist_directory)
+        """Initialize context manager.
+
+        Args:
+            persist_directory: Directory for ChromaDB data
+            enable_auto_save: Save interactions after each agent run
+            max_context_length: Maximum number of contexts to load
+            write_behind: Queue interaction writes and flush them in batches
+            max_workers: Thread pool size for blocking storage calls
+            flush_interval: Maximum delay before queued writes are flushed (seconds)
+            embedding_cache_size: Number of embeddings kept in memory
+            persist_embeddings: Also keep embeddings in an on-disk mmap store
+        """
+        embedding_cache = EmbeddingCache(
+            DefaultEmbeddingFunction(),
+            namespace="chroma-default",
+            max_entries=embedding_cache_size,
+            cache_dir=Path(persist_directory) / "embeddings" if persist_embeddings else None,
+        )
+        self.storage = ContextStorage(persist_directory, embedding_cache=embedding_cache)
+        self.async_storage = AsyncContextStorage(
+            self.storage, max_workers=max_workers, flush_interval=flush_interval
+        )
         self.retrieval = ContextRetrieval(self.storage)
         self.enable_auto_save = enable_auto_save
         self.max_context_length = max_context_length
+        self.write_behind = write_behind
         logger.info("ContextManager initialized")
 
     async def load_context_for_prompt(
@@ -36,14 +68,34 @@ class ContextManager:
         session_id: str | None = None,
         include_session_history: bool = True,
     ) -> list[RetrievedContext]:
-        """Load relevant contexts for a user prompt."""
+        """Load relevant contexts for a user prompt.
+
+        Semantic search and session history run concurrently in the storage
+        thread pool, so the event loop is never blocked by ChromaDB.
+        """
         try:
-            contexts = self.retrieval.find_relevant_contexts(
-                query=prompt, user_id=user_id, limit=self.max_context_length
-            )
+            # Read-your-writes: make queued interactions visible to the query
+            if self.async_storage.queue_depth:
+                await self.async_storage.flush()
 
+            lookups = [
+                self.async_storage.run(
+                    self.retrieval.find_relevant_contexts,
+                    query=prompt,
+                    user_id=user_id,
+                    limit=self.max_context_length,
+                )
+            ]
             if include_session_history and session_id:
-                history = self.retrieval.get_session_history(session_id, limit=3)
+                lookups.append(
+                    self.async_storage.run(
+                        self.retrieval.get_session_history, session_id, limit=3
+                    )
+                )
+            contexts, *rest = await asyncio.gather(*lookups)
+
+            if rest:
+                history = rest[0]
                 for record in history:
                     if not any(c.context.context_id == record.context_id for c in contexts):
                         contexts.append(
@@ -116,11 +168,28 @@ class ContextManager:
                 }
             )
 
-            self.storage.save_contexts_batch(contexts)
-            logger.info(f"Saved interaction for session {session_id}")
+            if self.write_behind:
+                await self.async_storage.enqueue(contexts)
+                logger.debug(f"Queued interaction for session {session_id}")
+            else:
+                await self.async_storage.save_contexts_batch(contexts)
+                logger.info(f"Saved interaction for session {session_id}")
         except Exception as e:
             logger.error(f"Failed to save interaction: {e}")
 
+    async def flush(self) -> int:
+        """Write all queued interactions now.
+
+        Returns:
+            Number of records written
+        """
+        return await self.async_storage.flush()
+
+    async def close(self) -> None:
+        """Flush queued interactions and release storage resources."""
+        await self.async_storage.close()
+        self.storage.embedding_cache.close()
+
     def format_contexts_for_prompt(self, contexts: list[RetrievedContext]) -> str:
         """Format contexts for inclusion in system prompt."""
         if not contexts:
@@ -147,9 +216,12 @@ class ContextManager:
         storage_stats = self.storage.get_collection_stats()
         return {
             "storage": storage_stats,
+            "write_behind": self.async_storage.get_metrics(),
+            "embedding_cache": self.storage.embedding_cache.get_stats(),
             "config": {
                 "enable_auto_save": self.enable_auto_save,
                 "max_context_length": self.max_context_length,
+                "write_behind": self.write_behind,
             },
         }
 
@@ -173,3 +245,12 @@ def get_context_manager(
         )
 
     return _context_manager
+
+
+async def close_context_manager() -> None:
+    """Flush and close the global ContextManager, if one was created."""
+    global _context_manager
+
+    if _context_manager is not None:
+        await _context_manager.close()
+        _context_manager = None
@@ -1,6 +1,5 @@
 """Context retrieval with semantic search."""
 
-import time
 from typing import Any
 
 from lurkbot.logging import get_logger
@@ -10,6 +9,10 @@ from .storage import ContextStorage
 
 logger = get_logger("context.retrieval")
 
+# Largest time-range candidate set pushed into ChromaDB as an ID filter;
+# wider ranges fall back to a metadata range filter.
+MAX_TIME_RANGE_IDS = 1000
+
 
 class ContextRetrieval:
     """Retrieve relevant contexts using semantic search."""
@@ -45,19 +48,35 @@ class ContextRetrieval:
             List of RetrievedContext objects sorted by relevance
         """
         # Build metadata filter
-        where = {}
+        clauses: list[dict[str, Any]] = []
         if user_id:
-            where["user_id"] = user_id
+            clauses.append({"user_id": user_id})
         if session_id:
-            where["session_id"] = session_id
+            clauses.append({"session_id": session_id})
         if context_types:
-            where["context_type"] = {"$in": context_types}
+            clauses.append({"context_type": {"$in": context_types}})
 
-        # TODO: ChromaDB doesn't support timestamp range filtering directly
-        # We'll filter after retrieval for now
         try:
+            # Resolve the time range through the chronological index so
+            # ChromaDB only searches records inside it
+            if time_range:
+                candidate_ids = self.storage.history.ids_in_range(
+                    time_range,
+                    user_id=user_id,
+                    session_id=session_id,
+                    context_types=context_types,
+                    limit=MAX_TIME_RANGE_IDS + 1,
+                )
+                if not candidate_ids:
+                    return []
+                if len(candidate_ids) <= MAX_TIME_RANGE_IDS:
+                    clauses = [{"context_id": {"$in": candidate_ids}}]
+                else:
+                    clauses.append({"timestamp": {"$gte": time_range[0]}})
+                    clauses.append({"timestamp": {"$lte": time_range[1]}})
+
             results = self.storage.query_raw(
-                query_texts=[query], n_results=limit, where=where if where else None
+                query_texts=[query], n_results=limit, where=_and_filters(clauses)
             )
 
             if not results["documents"] or not results["documents"][0]:
@@ -69,12 +88,6 @@ class ContextRetrieval:
             for doc, metadata, distance in zip(
                 results["documents"][0], results["metadatas"][0], results["distances"][0]
             ):
-                # Apply time range filter
-                if time_range:
-                    timestamp = metadata.get("timestamp", 0)
-                    if not (time_range[0] <= timestamp <= time_range[1]):
-                        continue
-
                 retrieved.append(RetrievedContext.from_chroma_result(doc, metadata, distance))
 
             logger.info(f"Found {len(retrieved)} relevant contexts for query")
@@ -87,6 +100,8 @@ class ContextRetrieval:
     def get_session_history(self, session_id: str, limit: int = 10) -> list[ContextRecord]:
         """Get recent history for a session.
 
+        Reads the chronological index; no embedding or vector search is done.
+
         Args:
             session_id: Session ID
             limit: Maximum number of records
@@ -95,27 +110,7 @@ class ContextRetrieval:
             List of ContextRecord sorted by timestamp (newest first)
         """
         try:
-            # Query with session filter
-            results = self.storage.query_raw(
-                query_texts=[""],  # Empty query to get all
-                n_results=limit,
-                where={"session_id": session_id},
-            )
-
-            if not results["documents"] or not results["documents"][0]:
-                return []
-
-            # Convert to ContextRecord
-            records = [
-                ContextRecord.from_metadata(doc, metadata)
-                for doc, metadata in zip(results["documents"][0], results["metadatas"][0])
-            ]
-
-            # Sort by timestamp (newest first)
-            records.sort(key=lambda r: r.timestamp, reverse=True)
-
-            return records[:limit]
-
+            return self.storage.history.recent_for_session(session_id, limit=limit)
         except Exception as e:
             logger.error(f"Failed to get session history: {e}")
             return []
@@ -137,29 +132,9 @@ class ContextRetrieval:
             List of ContextRecord sorted by timestamp (newest first)
         """
         try:
-            results = self.storage.query_raw(
-                query_texts=[""],  # Empty query
-                n_results=limit,
-                where={"user_id": user_id},
+            return self.storage.history.recent_for_user(
+                user_id, limit=limit, time_range=time_range
             )
-
-            if not results["documents"] or not results["documents"][0]:
-                return []
-
-            records = [
-                ContextRecord.from_metadata(doc, metadata)
-                for doc, metadata in zip(results["documents"][0], results["metadatas"][0])
-            ]
-
-            # Apply time range filter
-            if time_range:
-                records = [r for r in records if time_range[0] <= r.timestamp <= time_range[1]]
-
-            # Sort by timestamp
-            records.sort(key=lambda r: r.timestamp, reverse=True)
-
-            return records[:limit]
-
         except Exception as e:
             logger.error(f"Failed to get user contexts: {e}")
             return []
@@ -175,3 +150,12 @@ class ContextRetrieval:
         """
         # Simple inverse distance scoring
         return 1.0 / (1.0 + distance)
+
+
+def _and_filters(clauses: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Combine single-field ChromaDB filters with ``$and``."""
+    if not clauses:
+        return None
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"$and": clauses}
@@ -1,14 +1,16 @@
 """Context storage using ChromaDB."""
 
-import time
+from pathlib import Path
 from typing import Any
 
 import chromadb
 from chromadb.config import Settings
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
 
 from lurkbot.logging import get_logger
+from lurkbot.memory.embeddings import EmbeddingCache
 
-from .models import ContextRecord
+from .history import ContextHistoryIndex
 
 logger = get_logger("context.storage")
 
@@ -16,14 +18,26 @@ logger = get_logger("context.storage")
 class ContextStorage:
     """Manage context persistence in ChromaDB."""
 
-    def __init__(self, persist_directory: str = "./data/chroma_db"):
+    def __init__(
+        self,
+        persist_directory: str = "./data/chroma_db",
+        embedding_cache: EmbeddingCache | None = None,
+    ):
         """Initialize persistent ChromaDB client.
 
         Args:
             persist_directory: Directory for ChromaDB data
+            embedding_cache: Cache used to embed documents and queries; defaults
+                to an in-memory cache over ChromaDB's default embedding function
         """
         self.persist_directory = persist_directory
 
+        # Embeddings are computed here (not inside ChromaDB) so that repeated
+        # texts are served from the cache
+        if embedding_cache is None:
+            embedding_cache = EmbeddingCache(DefaultEmbeddingFunction(), namespace="chroma-default")
+        self.embedding_cache = embedding_cache
+
         # Create persistent client
         self.client = chromadb.PersistentClient(
             path=persist_directory,
@@ -36,9 +50,27 @@ class ContextStorage:
             metadata={"description": "LurkBot conversation contexts"},
         )
 
+        # Chronological index for recency and time-range lookups
+        self.history = ContextHistoryIndex(Path(persist_directory) / "history.db")
+        self._backfill_history()
+
         logger.info(f"Context storage initialized at {persist_directory}")
         logger.info(f"Current collection size: {self.collection.count()}")
 
+    def _backfill_history(self) -> None:
+        """Populate the history index from an existing collection."""
+        if self.history.count() > 0 or self.collection.count() == 0:
+            return
+
+        existing = self.collection.get(include=["documents", "metadatas"])
+        indexed = self.history.add_many(
+            (doc or "", {"context_id": cid, **(metadata or {})})
+            for cid, doc, metadata in zip(
+                existing["ids"], existing["documents"], existing["metadatas"], strict=True
+            )
+        )
+        logger.info(f"Backfilled history index with {indexed} contexts")
+
     def save_context(
         self,
         context_id: str,
@@ -55,12 +87,15 @@ class ContextStorage:
             embedding: Optional pre-computed embedding
         """
         try:
+            if embedding is None:
+                embedding = self.embedding_cache.embed_one(text)
             self.collection.add(
                 ids=[context_id],
                 documents=[text],
                 metadatas=[metadata],
-                embeddings=[embedding] if embedding else None,
+                embeddings=[embedding],
             )
+            self.history.add(text, {"context_id": context_id, **metadata})
             logger.debug(f"Saved context {context_id}")
         except Exception as e:
             logger.error(f"Failed to save context {context_id}: {e}")
@@ -81,14 +116,21 @@ class ContextStorage:
             metadatas = [ctx["metadata"] for ctx in contexts]
             embeddings = [ctx.get("embedding") for ctx in contexts]
 
-            # Only pass embeddings if all are provided
-            if all(e is not None for e in embeddings):
-                self.collection.add(
-                    ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings
-                )
-            else:
-                self.collection.add(ids=ids, documents=documents, metadatas=metadatas)
+            # Fill in missing embeddings with one cached batch call
+            missing = [i for i, e in enumerate(embeddings) if e is None]
+            if missing:
+                computed = self.embedding_cache.embed([documents[i] for i in missing])
+                for i, vector in zip(missing, computed, strict=True):
+                    embeddings[i] = vector
+
+            self.collection.add(
+                ids=ids, documents=documents, metadatas=metadatas, embeddings=embeddings
+            )
 
+            self.history.add_many(
+                (doc, {"context_id": cid, **metadata})
+                for cid, doc, metadata in zip(ids, documents, metadatas, strict=True)
+            )
             logger.info(f"Saved {len(contexts)} contexts in batch")
         except Exception as e:
             logger.error(f"Failed to save contexts batch: {e}")
@@ -102,6 +144,7 @@ class ContextStorage:
         """
         try:
             self.collection.delete(ids=[context_id])
+            self.history.delete([context_id])
             logger.debug(f"Deleted context {context_id}")
         except Exception as e:
             logger.error(f"Failed to delete context {context_id}: {e}")
@@ -115,6 +158,7 @@ class ContextStorage:
         """
         try:
             self.collection.delete(where={"session_id": session_id})
+            self.history.delete_session(session_id)
             logger.info(f"Deleted all contexts for session {session_id}")
         except Exception as e:
             logger.error(f"Failed to delete session contexts: {e}")
@@ -128,6 +172,7 @@ class ContextStorage:
         """
         try:
             self.collection.delete(where={"user_id": user_id})
+            self.history.delete_user(user_id)
             logger.info(f"Deleted all contexts for user {user_id}")
         except Exception as e:
             logger.error(f"Failed to delete user contexts: {e}")
@@ -137,10 +182,11 @@ class ContextStorage:
         """Get collection statistics.
 
         Returns:
-            Dict with stats: count, persist_directory
+            Dict with stats: count, history_count, persist_directory
         """
         return {
             "count": self.collection.count(),
+            "history_count": self.history.count(),
             "persist_directory": self.persist_directory,
             "collection_name": self.collection.name,
         }
@@ -163,6 +209,10 @@ class ContextStorage:
         Returns:
             ChromaDB query results
         """
+        if query_texts is not None and query_embeddings is None:
+            query_embeddings = self.embedding_cache.embed(query_texts)
+            query_texts = None
+
         return self.collection.query(
             query_texts=query_texts,
             query_embeddings=query_embeddings,
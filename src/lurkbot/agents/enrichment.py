@@ -0,0 +1,152 @@
+"""Pre-LLM enrichment pipeline.
+
+Before the main agent run, ``run_embedded_agent`` enriches the system prompt
+with plugin results, retrieved context and proactive suggestions. These
+stages are independent I/O-bound calls, so this module runs them
+concurrently under a single per-request latency budget. Stages that miss
+the deadline are cancelled and skipped instead of being awaited.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from lurkbot.logging import get_logger
+
+from .types import StageTiming
+
+logger = get_logger("agent.enrichment")
+
+# Default latency budget for all enrichment stages combined (milliseconds)
+DEFAULT_ENRICHMENT_BUDGET_MS = 5_000
+
+StageFactory = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class EnrichmentResult:
+    """Outcome of an enrichment pipeline run."""
+
+    results: dict[str, Any] = field(default_factory=dict)
+    timings: list[StageTiming] = field(default_factory=list)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get the result of a stage, or ``default`` if it did not complete."""
+        return self.results.get(name, default)
+
+    @property
+    def skipped(self) -> list[str]:
+        """Names of stages that were cancelled because of the budget."""
+        return [t.name for t in self.timings if t.status == "timeout"]
+
+
+class EnrichmentPipeline:
+    """Run independent enrichment stages concurrently under a deadline.
+
+    Stages are registered in the order their output should be applied.
+    A stage that depends on another one can call :meth:`wait_for` to
+    await its result without cancelling it.
+
+    Example:
+        >>> pipeline = EnrichmentPipeline(budget_ms=2000)
+        >>> pipeline.add_stage("context", load_context)
+        >>> pipeline.add_stage("proactive", analyze_input)
+        >>> outcome = await pipeline.run()
+        >>> outcome.get("context")
+    """
+
+    def __init__(self, budget_ms: int | None = DEFAULT_ENRICHMENT_BUDGET_MS):
+        """Initialize the pipeline.
+
+        Args:
+            budget_ms: Latency budget for all stages, ``None`` for no limit
+        """
+        self.budget_ms = budget_ms
+        self._stages: dict[str, StageFactory] = {}
+        self._tasks: dict[str, asyncio.Task[Any]] = {}
+        self._timings: dict[str, StageTiming] = {}
+
+    def add_stage(self, name: str, factory: StageFactory) -> None:
+        """Register a stage.
+
+        Args:
+            name: Unique stage name
+            factory: Zero-argument callable returning the stage coroutine
+        """
+        if name in self._stages:
+            raise ValueError(f"Duplicate enrichment stage: {name}")
+        self._stages[name] = factory
+
+    async def wait_for(self, name: str) -> Any:
+        """Await another stage's result from within a stage.
+
+        The awaited stage is shielded, so cancelling the caller does not
+        cancel the dependency.
+
+        Returns:
+            The stage result, or ``None`` if the stage is not registered or failed
+        """
+        task = self._tasks.get(name)
+        if task is None:
+            return None
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            return None
+
+    async def _run_stage(self, name: str, factory: StageFactory) -> Any:
+        timing = self._timings[name]
+        start = time.perf_counter()
+        try:
+            value = await factory()
+            timing.status = "ok"
+            return value
+        except asyncio.CancelledError:
+            timing.status = "timeout"
+            raise
+        except Exception as e:
+            timing.status = "error"
+            timing.error = str(e)
+            logger.warning(f"Enrichment stage '{name}' failed: {e}")
+            raise
+        finally:
+            timing.duration_ms = (time.perf_counter() - start) * 1000
+
+    async def run(self) -> EnrichmentResult:
+        """Run all stages concurrently and collect finished results."""
+        outcome = EnrichmentResult()
+        if not self._stages:
+            return outcome
+
+        for name, factory in self._stages.items():
+            self._timings[name] = StageTiming(name=name)
+            self._tasks[name] = asyncio.create_task(
+                self._run_stage(name, factory), name=f"enrichment:{name}"
+            )
+
+        timeout = self.budget_ms / 1000 if self.budget_ms is not None else None
+        try:
+            _, pending = await asyncio.wait(self._tasks.values(), timeout=timeout)
+        except asyncio.CancelledError:
+            for task in self._tasks.values():
+                task.cancel()
+            raise
+
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for name, task in self._tasks.items():
+            if not task.cancelled() and task.exception() is None:
+                outcome.results[name] = task.result()
+            outcome.timings.append(self._timings[name])
+
+        if outcome.skipped:
+            logger.info(
+                f"Enrichment budget of {self.budget_ms}ms exceeded, "
+                f"skipped stages: {', '.join(outcome.skipped)}"
+            )
+        return outcome
@@ -0,0 +1,172 @@
+"""Reusable agent instance pool.
+
+``create_agent`` builds a new PydanticAI ``Agent``, model and provider (with a
+fresh HTTP client) for every request, so no TLS connection to the LLM
+endpoint is ever reused. The pool keeps one agent per
+``(provider, model_id, base_url)`` and shares OpenAI-compatible providers, and
+therefore their HTTP clients, across requests.
+
+Pooled agents carry no static system prompt: the per-request prompt is read
+from ``AgentDependencies.system_prompt`` at run time.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic_ai import Agent, DeferredToolRequests, RunContext
+from pydantic_ai.providers.openai import OpenAIProvider
+
+from lurkbot.logging import get_logger
+
+logger = get_logger("agent.pool")
+
+# Default maximum number of pooled agents
+DEFAULT_AGENT_POOL_SIZE = 32
+
+PoolKey = tuple[str, str, str | None]
+
+
+@dataclass
+class AgentPoolStats:
+    """Agent pool statistics."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the pool."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class AgentPool:
+    """LRU-bounded pool of agents keyed by (provider, model_id, base_url).
+
+    Example:
+        >>> pool = AgentPool(max_size=16)
+        >>> agent = pool.get_agent("deepseek", "deepseek-chat")
+        >>> deps = AgentDependencies(context=ctx, system_prompt="You are ...")
+        >>> await agent.run(prompt, deps=deps)
+    """
+
+    def __init__(self, max_size: int = DEFAULT_AGENT_POOL_SIZE):
+        """Initialize the pool.
+
+        Args:
+            max_size: Maximum number of agents kept in the pool
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.stats = AgentPoolStats()
+        self._agents: OrderedDict[PoolKey, Agent[Any, str | DeferredToolRequests]] = (
+            OrderedDict()
+        )
+        self._providers: dict[tuple[str, str], OpenAIProvider] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def get_agent(self, provider: str, model_id: str) -> Agent[Any, str | DeferredToolRequests]:
+        """Get a pooled agent, creating it on first use.
+
+        Args:
+            provider: Provider name (e.g., "anthropic", "deepseek")
+            model_id: Model identifier
+
+        Returns:
+            Agent whose system prompt is taken from ``deps.system_prompt``
+        """
+        from .runtime import resolve_agent_model
+
+        provider_lower = provider.lower()
+        with self._lock:
+            model, base_url = resolve_agent_model(
+                provider_lower, model_id, provider_factory=self._get_provider
+            )
+            key: PoolKey = (provider_lower, model_id, base_url)
+
+            agent = self._agents.get(key)
+            if agent is not None:
+                self._agents.move_to_end(key)
+                self.stats.hits += 1
+                return agent
+
+            self.stats.misses += 1
+            agent = _build_pooled_agent(model)
+            self._agents[key] = agent
+
+            while len(self._agents) > self.max_size:
+                evicted_key, _ = self._agents.popitem(last=False)
+                self.stats.evictions += 1
+                logger.debug(f"Evicted pooled agent: {evicted_key}")
+
+            logger.info(f"Pooled new agent: {key}")
+            return agent
+
+    def _get_provider(self, base_url: str, api_key: str) -> OpenAIProvider:
+        """Get a shared OpenAI-compatible provider for an endpoint."""
+        provider = self._providers.get((base_url, api_key))
+        if provider is None:
+            provider = OpenAIProvider(base_url=base_url, api_key=api_key)
+            self._providers[(base_url, api_key)] = provider
+        return provider
+
+    def clear(self) -> None:
+        """Drop all pooled agents and providers."""
+        with self._lock:
+            self._agents.clear()
+            self._providers.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            **self.stats.to_dict(),
+            "size": len(self._agents),
+            "max_size": self.max_size,
+            "providers": len(self._providers),
+        }
+
+
+def _build_pooled_agent(model: Any) -> Agent[Any, str | DeferredToolRequests]:
+    """Create an agent that reads its system prompt from the run dependencies."""
+    from .runtime import AgentDependencies
+
+    agent: Agent[AgentDependencies, str | DeferredToolRequests] = Agent(
+        model,
+        deps_type=AgentDependencies,
+        output_type=[str, DeferredToolRequests],
+    )
+
+    @agent.system_prompt
+    def request_system_prompt(ctx: RunContext[AgentDependencies]) -> str:
+        return ctx.deps.system_prompt
+
+    return agent
+
+
+_agent_pool: AgentPool | None = None
+
+
+def get_agent_pool(max_size: int = DEFAULT_AGENT_POOL_SIZE) -> AgentPool:
+    """Get or create the global AgentPool instance."""
+    global _agent_pool
+
+    if _agent_pool is None:
+        _agent_pool = AgentPool(max_size=max_size)
+
+    return _agent_pool
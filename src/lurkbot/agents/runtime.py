@@ -5,6 +5,7 @@ implementing MoltBot's runEmbeddedPiAgent equivalent using PydanticAI.
 """
 
 import os
+from collections.abc import Callable
 from typing import Any, AsyncIterator
 
 from pydantic import BaseModel, ConfigDict
@@ -23,6 +24,8 @@ from pydantic_ai.providers.openai import OpenAIProvider
 from lurkbot.config.models import get_client_config, get_model
 from lurkbot.logging import get_logger
 
+from .enrichment import DEFAULT_ENRICHMENT_BUDGET_MS, EnrichmentPipeline
+from .pool import get_agent_pool
 from .types import (
     AgentContext,
     AgentRunResult,
@@ -44,6 +47,7 @@ class AgentDependencies(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     context: AgentContext
+    system_prompt: str = ""  # Per-request system prompt for pooled agents
     message_history: list[dict[str, Any]] = []
     relevant_contexts: list[dict[str, Any]] = []  # Retrieved historical contexts
 
@@ -97,6 +101,64 @@ def resolve_model_id(provider: str, model_id: str) -> str:
     return f"{provider_lower}:{model_id}"
 
 
+def resolve_agent_model(
+    provider: str,
+    model_id: str,
+    provider_factory: Callable[[str, str], OpenAIProvider] | None = None,
+) -> tuple[OpenAIChatModel | str, str | None]:
+    """Resolve the PydanticAI model for a provider/model pair.
+
+    For OpenAI-compatible providers (DeepSeek, Qwen, Kimi, GLM), this builds an
+    OpenAIChatModel with a custom base_url. For native providers (Anthropic,
+    OpenAI, Google), it returns the standard model string.
+
+    Args:
+        provider: Provider name (e.g., "anthropic", "deepseek", "qwen")
+        model_id: Model identifier (e.g., "claude-sonnet-4-20250514", "deepseek-chat")
+        provider_factory: Optional ``(base_url, api_key) -> OpenAIProvider`` used to
+            share providers; a new provider is created when omitted
+
+    Returns:
+        Tuple of (model instance or model string, base_url or None)
+    """
+    provider_lower = provider.lower()
+
+    # Check if this is an OpenAI-compatible provider that needs custom endpoint
+    if provider_lower not in OPENAI_COMPATIBLE_PROVIDERS:
+        # Use native PydanticAI provider format
+        return resolve_model_id(provider_lower, model_id), None
+
+    # Get model configuration
+    model_config = get_model(provider_lower, model_id)
+    if not model_config:
+        logger.warning(
+            f"Unknown model {provider_lower}:{model_id}, attempting with defaults"
+        )
+        # Fallback: use get_client_config which may raise if truly unknown
+        config = get_client_config(provider_lower, model_id)
+    else:
+        config = {
+            "base_url": model_config.base_url,
+            "api_key_env": model_config.api_key_env,
+            "model": model_config.model_id,
+        }
+
+    # Get API key from environment
+    api_key = os.getenv(config["api_key_env"])
+    if not api_key:
+        raise ValueError(
+            f"Missing API key: please set {config['api_key_env']} environment variable"
+        )
+
+    # Create OpenAI-compatible model
+    if provider_factory is not None:
+        openai_provider = provider_factory(config["base_url"], api_key)
+    else:
+        openai_provider = OpenAIProvider(base_url=config["base_url"], api_key=api_key)
+
+    return OpenAIChatModel(config["model"], provider=openai_provider), config["base_url"]
+
+
 def create_agent(
     provider: str,
     model_id: str,
@@ -107,10 +169,8 @@ def create_agent(
 
     This is a factory function that creates an agent with the given
     configuration. Tools are registered separately after creation.
-
-    For OpenAI-compatible providers (DeepSeek, Qwen, Kimi, GLM), this function
-    creates an OpenAIChatModel with custom base_url. For native providers
-    (Anthropic, OpenAI, Google), it uses the standard model string format.
+    Every call builds a new model and provider; request paths should use
+    the shared :class:`~lurkbot.agents.pool.AgentPool` instead.
 
     Args:
         provider: Provider name (e.g., "anthropic", "deepseek", "qwen")
@@ -121,67 +181,155 @@ def create_agent(
     Returns:
         Configured PydanticAI Agent instance
     """
-    provider_lower = provider.lower()
+    model, base_url = resolve_agent_model(provider, model_id)
 
-    # Check if this is an OpenAI-compatible provider that needs custom endpoint
-    if provider_lower in OPENAI_COMPATIBLE_PROVIDERS:
-        # Get model configuration
-        model_config = get_model(provider_lower, model_id)
-        if not model_config:
-            logger.warning(
-                f"Unknown model {provider_lower}:{model_id}, attempting with defaults"
-            )
-            # Fallback: use get_client_config which may raise if truly unknown
-            config = get_client_config(provider_lower, model_id)
-        else:
-            config = {
-                "base_url": model_config.base_url,
-                "api_key_env": model_config.api_key_env,
-                "model": model_config.model_id,
-            }
-
-        # Get API key from environment
-        api_key = os.getenv(config["api_key_env"])
-        if not api_key:
-            raise ValueError(
-                f"Missing API key: please set {config['api_key_env']} environment variable"
-            )
+    agent: Agent[AgentDependencies, str | DeferredToolRequests] = Agent(
+        model,
+        deps_type=deps_type,
+        output_type=[str, DeferredToolRequests],
+        system_prompt=system_prompt,
+    )
 
-        # Create OpenAI-compatible model
-        openai_model = OpenAIChatModel(
-            config["model"],
-            provider=OpenAIProvider(
-                base_url=config["base_url"],
-                api_key=api_key,
-            ),
+    if base_url:
+        logger.info(
+            f"Created agent with OpenAI-compatible provider: {provider.lower()} at {base_url}"
         )
+    else:
+        logger.info(f"Created agent with native provider: {model}")
 
-        agent: Agent[AgentDependencies, str | DeferredToolRequests] = Agent(
-            openai_model,
-            deps_type=deps_type,
-            output_type=[str, DeferredToolRequests],
-            system_prompt=system_prompt,
-        )
+    return agent
 
-        logger.info(
-            f"Created agent with OpenAI-compatible provider: {provider_lower} "
-            f"at {config['base_url']}"
-        )
 
-    else:
-        # Use native PydanticAI provider format
-        model_string = resolve_model_id(provider_lower, model_id)
+def _resolve_enrichment_budget(context: AgentContext, budget_ms: int | None) -> int:
+    """Resolve the enrichment budget, never exceeding the run timeout."""
+    budget = DEFAULT_ENRICHMENT_BUDGET_MS if budget_ms is None else budget_ms
+    return min(budget, context.timeout_ms)
 
-        agent: Agent[AgentDependencies, str | DeferredToolRequests] = Agent(
-            model_string,
-            deps_type=deps_type,
-            output_type=[str, DeferredToolRequests],
-            system_prompt=system_prompt,
-        )
 
-        logger.info(f"Created agent with native provider: {model_string}")
+async def _run_plugins_stage(context: AgentContext, prompt: str) -> str:
+    """Execute enabled plugins and format their results for the system prompt."""
+    from lurkbot.plugins import get_plugin_manager
+    from lurkbot.plugins.models import PluginExecutionContext
 
-    return agent
+    plugin_manager = get_plugin_manager()
+
+    # Create plugin execution context
+    plugin_context = PluginExecutionContext(
+        user_id=context.sender_id or context.session_id,
+        channel_id=context.message_channel,
+        session_id=context.session_id,
+        input_data={"query": prompt},
+        parameters={},
+        environment={},
+        config={},
+        metadata={"provider": context.provider, "model": context.model_id},
+    )
+
+    # Execute all enabled plugins
+    plugin_results = await plugin_manager.execute_plugins(plugin_context)
+    if not plugin_results:
+        return ""
+
+    successful_results = [
+        (name, plugin_result)
+        for name, plugin_result in plugin_results.items()
+        if plugin_result.success
+    ]
+    if not successful_results:
+        return ""
+
+    plugin_results_text = "\n\n## Plugin Results\n\n"
+    plugin_results_text += (
+        "The following plugins have been executed to assist with your query:\n\n"
+    )
+    for name, plugin_result in successful_results:
+        plugin_results_text += f"### Plugin: {name}\n"
+        plugin_results_text += f"- Execution time: {plugin_result.execution_time:.2f}s\n"
+        plugin_results_text += f"- Result: {plugin_result.result}\n\n"
+
+    logger.info(f"Executed {len(successful_results)} plugins successfully")
+    return plugin_results_text
+
+
+async def _load_context_stage(
+    context: AgentContext, prompt: str
+) -> tuple[str, list[dict[str, Any]]]:
+    """Retrieve relevant contexts.
+
+    Returns:
+        Tuple of (formatted context text, context records as dicts)
+    """
+    from .context.manager import get_context_manager
+
+    # Use sender_id as user_id, fallback to session_id if not available
+    user_id = context.sender_id or context.session_id
+
+    context_manager = get_context_manager()
+    retrieved = await context_manager.load_context_for_prompt(
+        prompt=prompt,
+        user_id=user_id,
+        session_id=context.session_id,
+        include_session_history=True,
+    )
+
+    context_text = ""
+    if retrieved:
+        context_text = context_manager.format_contexts_for_prompt(retrieved)
+        logger.info(f"Loaded {len(retrieved)} contexts for context-aware mode")
+
+    return context_text, [rc.context.model_dump() for rc in retrieved]
+
+
+async def _proactive_stage(
+    context: AgentContext,
+    prompt: str,
+    message_history: list[dict[str, Any]] | None,
+    pipeline: EnrichmentPipeline,
+) -> str:
+    """Analyze the input and generate proactive task suggestions.
+
+    Analysis runs concurrently with context loading; the context stage is
+    only awaited when suggestions are actually needed.
+    """
+    from .proactive import InputAnalyzer, TaskSuggester
+
+    # Analyze user input
+    analyzer = InputAnalyzer(model=f"{context.provider}:{context.model_id}")
+    analysis = await analyzer.analyze(
+        prompt=prompt,
+        context_history=message_history,
+    )
+
+    logger.debug(
+        f"Input analysis: intent={analysis.intent.value}, "
+        f"sentiment={analysis.sentiment.value}, "
+        f"confidence={analysis.confidence:.2f}"
+    )
+
+    # Check if we should generate suggestions
+    if not analyzer.should_trigger_proactive(analysis):
+        return ""
+
+    suggester = TaskSuggester(model=f"{context.provider}:{context.model_id}")
+
+    # Create context summary from relevant contexts
+    context_summary = None
+    loaded = await pipeline.wait_for("context")
+    if loaded and loaded[1]:
+        # Simple summary: take last 2 contexts
+        recent = loaded[1][-2:]
+        context_summary = "\n".join([f"- {ctx.get('content', '')[:100]}" for ctx in recent])
+
+    suggestions = await suggester.suggest(
+        user_prompt=prompt,
+        analysis=analysis,
+        context_summary=context_summary,
+    )
+    if not suggestions:
+        return ""
+
+    logger.info(f"Generated {len(suggestions)} proactive task suggestions")
+    return suggester.format_suggestions_for_prompt(suggestions)
 
 
 async def run_embedded_agent(
@@ -193,6 +341,7 @@ async def run_embedded_agent(
     enable_context_aware: bool = True,  # Enable context-aware by default
     enable_proactive: bool = True,  # Enable proactive task identification by default
     enable_plugins: bool = True,  # Enable plugin execution by default
+    enrichment_budget_ms: int | None = None,
 ) -> AgentRunResult:
     """Run an embedded agent session with context-aware and proactive capabilities.
 
@@ -209,6 +358,9 @@ async def run_embedded_agent(
         enable_context_aware: Enable context-aware retrieval (default: True)
         enable_proactive: Enable proactive task identification (default: True)
         enable_plugins: Enable plugin execution (default: True)
+        enrichment_budget_ms: Latency budget for the enrichment stages, which run
+            concurrently; stages that miss it are skipped. Defaults to
+            DEFAULT_ENRICHMENT_BUDGET_MS, capped by ``context.timeout_ms``.
 
     Returns:
         AgentRunResult containing the execution results
@@ -240,143 +392,46 @@ async def run_embedded_agent(
     try:
         logger.info(f"Running agent with provider={context.provider} model={context.model_id}")
 
-        # Step 0.5: Execute plugins (if enabled)
-        plugin_results_text = ""
+        # Step 1: Run enrichment stages (plugins, context, proactive) concurrently
+        pipeline = EnrichmentPipeline(
+            budget_ms=_resolve_enrichment_budget(context, enrichment_budget_ms)
+        )
         if enable_plugins:
-            try:
-                from lurkbot.plugins import get_plugin_manager
-                from lurkbot.plugins.models import PluginExecutionContext
-
-                plugin_manager = get_plugin_manager()
-
-                # Create plugin execution context
-                plugin_context = PluginExecutionContext(
-                    user_id=context.sender_id or context.session_id,
-                    channel_id=context.channel_id,
-                    session_id=context.session_id,
-                    input_data={"query": prompt},
-                    parameters={},
-                    environment={},
-                    config={},
-                    metadata={"provider": context.provider, "model": context.model_id},
-                )
-
-                # Execute all enabled plugins
-                plugin_results = await plugin_manager.execute_plugins(plugin_context)
-
-                # Format plugin results for injection into system prompt
-                if plugin_results:
-                    successful_results = [
-                        (name, result)
-                        for name, result in plugin_results.items()
-                        if result.success
-                    ]
-
-                    if successful_results:
-                        plugin_results_text = "\n\n## Plugin Results\n\n"
-                        plugin_results_text += (
-                            "The following plugins have been executed to assist with your query:\n\n"
-                        )
-
-                        for name, result in successful_results:
-                            plugin_results_text += f"### Plugin: {name}\n"
-                            plugin_results_text += f"- Execution time: {result.execution_time:.2f}s\n"
-                            plugin_results_text += f"- Result: {result.result}\n\n"
-
-                        logger.info(
-                            f"Executed {len(successful_results)} plugins successfully"
-                        )
-
-            except Exception as e:
-                logger.warning(f"Plugin execution failed (continuing without plugins): {e}")
-
-        # Inject plugin results into system prompt
-        if plugin_results_text:
-            system_prompt = system_prompt + plugin_results_text
-
-        # Step 1: Load relevant contexts (if enabled)
-        relevant_contexts = []
+            pipeline.add_stage("plugins", lambda: _run_plugins_stage(context, prompt))
         if enable_context_aware:
-            try:
-                from .context.manager import get_context_manager
-
-                # Use sender_id as user_id, fallback to session_id if not available
-                user_id = context.sender_id or context.session_id
-
-                context_manager = get_context_manager()
-                retrieved = await context_manager.load_context_for_prompt(
-                    prompt=prompt,
-                    user_id=user_id,
-                    session_id=context.session_id,
-                    include_session_history=True,
-                )
-
-                # Format contexts and append to system prompt
-                if retrieved:
-                    context_text = context_manager.format_contexts_for_prompt(retrieved)
-                    system_prompt = f"{system_prompt}\n\n## Relevant Context\n{context_text}"
-                    logger.info(f"Loaded {len(retrieved)} contexts for context-aware mode")
-
-                relevant_contexts = [rc.context.model_dump() for rc in retrieved]
-            except Exception as e:
-                logger.warning(f"Context-aware loading failed, continuing without: {e}")
-
-        # Step 1.5: Proactive task identification (if enabled)
+            pipeline.add_stage("context", lambda: _load_context_stage(context, prompt))
         if enable_proactive:
-            try:
-                from .proactive import InputAnalyzer, TaskSuggester
-
-                # Analyze user input
-                analyzer = InputAnalyzer(model=f"{context.provider}:{context.model_id}")
-                analysis = await analyzer.analyze(
-                    prompt=prompt,
-                    context_history=message_history,
-                )
+            pipeline.add_stage(
+                "proactive",
+                lambda: _proactive_stage(context, prompt, message_history, pipeline),
+            )
 
-                logger.debug(
-                    f"Input analysis: intent={analysis.intent.value}, "
-                    f"sentiment={analysis.sentiment.value}, "
-                    f"confidence={analysis.confidence:.2f}"
-                )
+        enrichment = await pipeline.run()
+        result.stage_timings = enrichment.timings
 
-                # Check if we should generate suggestions
-                if analyzer.should_trigger_proactive(analysis):
-                    suggester = TaskSuggester(model=f"{context.provider}:{context.model_id}")
-
-                    # Create context summary from relevant contexts
-                    context_summary = None
-                    if relevant_contexts:
-                        # Simple summary: take last 2 contexts
-                        recent = relevant_contexts[-2:]
-                        context_summary = "\n".join(
-                            [f"- {ctx.get('content', '')[:100]}" for ctx in recent]
-                        )
-
-                    suggestions = await suggester.suggest(
-                        user_prompt=prompt,
-                        analysis=analysis,
-                        context_summary=context_summary,
-                    )
+        # Apply stage outputs in a fixed order so the prompt is deterministic
+        plugin_results_text = enrichment.get("plugins")
+        if plugin_results_text:
+            system_prompt = system_prompt + plugin_results_text
 
-                    if suggestions:
-                        # Format and append suggestions to system prompt
-                        suggestions_text = suggester.format_suggestions_for_prompt(suggestions)
-                        system_prompt = f"{system_prompt}\n\n{suggestions_text}"
-                        logger.info(f"Generated {len(suggestions)} proactive task suggestions")
+        relevant_contexts: list[dict[str, Any]] = []
+        loaded = enrichment.get("context")
+        if loaded:
+            context_text, relevant_contexts = loaded
+            if context_text:
+                system_prompt = f"{system_prompt}\n\n## Relevant Context\n{context_text}"
 
-            except Exception as e:
-                logger.warning(f"Proactive task identification failed, continuing without: {e}")
+        suggestions_text = enrichment.get("proactive")
+        if suggestions_text:
+            system_prompt = f"{system_prompt}\n\n{suggestions_text}"
 
-        # Step 2: Create the agent (now supports both native and OpenAI-compatible providers)
-        agent = create_agent(
-            provider=context.provider,
-            model_id=context.model_id,
-            system_prompt=system_prompt,
-        )
+        # Step 2: Get a pooled agent (supports both native and OpenAI-compatible providers)
+        agent = get_agent_pool().get_agent(context.provider, context.model_id)
 
         # Step 3: Prepare dependencies
         deps = AgentDependencies(
             context=context,
+            system_prompt=system_prompt,
             message_history=message_history or [],
             relevant_contexts=relevant_contexts,
         )
@@ -479,16 +534,13 @@ async def run_embedded_agent_stream(
         f"Running streaming agent with provider={context.provider} model={context.model_id}"
     )
 
-    # Create the agent
-    agent = create_agent(
-        provider=context.provider,
-        model_id=context.model_id,
-        system_prompt=system_prompt,
-    )
+    # Get a pooled agent
+    agent = get_agent_pool().get_agent(context.provider, context.model_id)
 
     # Prepare dependencies
     deps = AgentDependencies(
         context=context,
+        system_prompt=system_prompt,
         message_history=message_history or [],
     )
 
@@ -531,16 +583,13 @@ async def run_embedded_agent_events(
         f"Running event-streaming agent with provider={context.provider} model={context.model_id}"
     )
 
-    # Create the agent
-    agent = create_agent(
-        provider=context.provider,
-        model_id=context.model_id,
-        system_prompt=system_prompt,
-    )
+    # Get a pooled agent
+    agent = get_agent_pool().get_agent(context.provider, context.model_id)
 
     # Prepare dependencies
     deps = AgentDependencies(
         context=context,
+        system_prompt=system_prompt,
         message_history=message_history or [],
     )
 
@@ -134,6 +134,20 @@ class AgentContext:
     tenant_id: str | None = None
 
 
+@dataclass
+class StageTiming:
+    """Wall time of a pre-LLM enrichment stage.
+
+    Status is one of "pending", "ok", "error" or "timeout" (cancelled
+    because the enrichment budget was exceeded).
+    """
+
+    name: str
+    duration_ms: float = 0.0
+    status: Literal["pending", "ok", "error", "timeout"] = "pending"
+    error: str | None = None
+
+
 @dataclass
 class AgentRunResult:
     """Result of an agent run.
@@ -164,6 +178,9 @@ class AgentRunResult:
     # Deferred tool requests (for human-in-the-loop)
     deferred_requests: Any | None = None  # DeferredToolRequests from PydanticAI
 
+    # Enrichment stage timings (plugins, context, proactive)
+    stage_timings: list[StageTiming] = field(default_factory=list)
+
     @property
     def has_deferred_requests(self) -> bool:
         """Check if there are pending tool approvals."""
@@ -8,6 +8,7 @@ The cron system provides:
 3. Job management: add, update, remove, list
 4. Execution: run (due/force), wake
 5. Persistent storage (JSONL)
+6. Heap-based scheduling with bounded, per-agent concurrent execution
 
 MoltBot cron architecture:
 - CronJob: Complete job definition with schedule, payload, and state
@@ -18,8 +19,11 @@ MoltBot cron architecture:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import heapq
 import json
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -111,6 +115,13 @@ class AgentTurnPayload:
 # Union type for payloads
 CronPayload = SystemEventPayload | AgentTurnPayload
 
+# What to do with a run that is overdue by more than the misfire grace period
+# (service was down, or all workers were busy):
+# - "run_once": run it once, then continue from the next future occurrence
+# - "skip": record it as skipped and continue from the next future occurrence
+# - "catch_up": run every missed occurrence in order (up to max_catch_up_runs)
+MisfirePolicy = Literal["run_once", "skip", "catch_up"]
+
 
 # =============================================================================
 # Job State and Definition
@@ -173,6 +184,9 @@ class CronJob:
     # Isolation settings (for isolated sessions)
     isolation: CronJobIsolation | None = None
 
+    # Misfire handling (None uses the service default)
+    misfire_policy: MisfirePolicy | None = None
+
     # Runtime state
     state: CronJobState = field(default_factory=CronJobState)
 
@@ -224,7 +238,9 @@ class CronService:
 
     Features:
     - Job CRUD operations
-    - Scheduling loop with configurable tick interval
+    - Scheduling loop that sleeps until the next due job (min-heap of run times)
+    - Due jobs run concurrently, bounded globally and per agent
+    - Configurable misfire handling (run_once, skip, catch_up)
     - Support for three schedule types (at, every, cron)
     - Support for two payload types (systemEvent, agentTurn)
     - Persistent storage via JSONL file
@@ -237,19 +253,36 @@ class CronService:
         tick_interval_seconds: float = 1.0,
         on_inject_system_event: Callable[[str, str], Any] | None = None,
         on_run_agent_turn: Callable[[CronJob], Any] | None = None,
+        max_concurrent_runs: int = 16,
+        max_concurrent_runs_per_agent: int = 4,
+        misfire_policy: MisfirePolicy = "run_once",
+        misfire_grace_seconds: float = 60.0,
+        max_catch_up_runs: int = 10,
     ):
         """Initialize cron service.
 
         Args:
             storage_path: Path to JSONL storage file
             agent_id: Agent identifier
-            tick_interval_seconds: Scheduler tick interval
+            tick_interval_seconds: Longest the scheduler sleeps between checks
+                (it otherwise sleeps until the next due job or a job change)
             on_inject_system_event: Callback (session_key, text) -> None
             on_run_agent_turn: Callback (job) -> result
+            max_concurrent_runs: Maximum jobs executing at once
+            max_concurrent_runs_per_agent: Maximum jobs executing at once per agent
+            misfire_policy: Default policy for overdue runs (see MisfirePolicy)
+            misfire_grace_seconds: How late a run may start before it counts as misfired
+            max_catch_up_runs: Missed occurrences replayed under "catch_up" before
+                skipping ahead to the next future occurrence
         """
         self.storage_path = Path(storage_path)
         self.agent_id = agent_id
         self.tick_interval = tick_interval_seconds
+        self.max_concurrent_runs = max_concurrent_runs
+        self.max_concurrent_runs_per_agent = max_concurrent_runs_per_agent
+        self.misfire_policy: MisfirePolicy = misfire_policy
+        self.misfire_grace_ms = int(misfire_grace_seconds * 1000)
+        self.max_catch_up_runs = max_catch_up_runs
 
         # Callbacks
         self._on_inject_system_event = on_inject_system_event
@@ -260,6 +293,20 @@ class CronService:
         self.runs: dict[str, list[CronRunResult]] = {}
         self._running = False
         self._task: asyncio.Task | None = None
+        self._wake_event: asyncio.Event | None = None
+
+        # Schedule: min-heap of (next_run_at_ms, job_id). Entries are invalidated
+        # lazily; _scheduled holds the one valid run time per job.
+        self._heap: list[tuple[int, str]] = []
+        self._scheduled: dict[str, int] = {}
+        self._catch_up_counts: dict[str, int] = {}
+
+        # Dispatch: per-agent FIFO of (job_id, scheduled_at_ms), served round-robin
+        # by agents that are below their concurrency limit
+        self._waiting: dict[str, deque[tuple[str, int]]] = {}
+        self._ready_agents: deque[str] = deque()
+        self._agent_running: dict[str, int] = {}
+        self._active: set[asyncio.Task] = set()
 
         # Load persisted jobs
         self._load()
@@ -274,6 +321,7 @@ class CronService:
             return
 
         self._running = True
+        self._wake_event = asyncio.Event()
         self._task = asyncio.create_task(self._scheduler_loop())
         logger.debug(f"Cron service started for agent {self.agent_id}")
 
@@ -283,6 +331,17 @@ class CronService:
         if self._task:
             self._task.cancel()
             self._task = None
+
+        # Jobs still waiting for a worker go back on the schedule; runs already
+        # executing are left to finish
+        for queue in self._waiting.values():
+            for job_id, _ in queue:
+                job = self.jobs.get(job_id)
+                if job:
+                    job.state.running_at_ms = None
+                    self._schedule(job)
+        self._waiting.clear()
+        self._ready_agents.clear()
         logger.debug(f"Cron service stopped for agent {self.agent_id}")
 
     def status(self) -> CronServiceStatus:
@@ -354,6 +413,7 @@ class CronService:
             wake_mode=job_input.get("wake_mode", "next-heartbeat"),
             payload=payload,
             isolation=self._parse_isolation(job_input.get("isolation")),
+            misfire_policy=job_input.get("misfire_policy"),
             state=CronJobState(
                 next_run_at_ms=self._calculate_next_run(schedule, now_ms),
             ),
@@ -365,6 +425,7 @@ class CronService:
         # Store
         self.jobs[job_id] = job
         self.runs[job_id] = []
+        self._schedule(job)
         self._save()
 
         logger.debug(f"Created cron job {job_id}: {job.name}")
@@ -409,12 +470,15 @@ class CronService:
             job.wake_mode = patch["wake_mode"]
         if "isolation" in patch:
             job.isolation = self._parse_isolation(patch["isolation"])
+        if "misfire_policy" in patch:
+            job.misfire_policy = patch["misfire_policy"]
 
         job.updated_at_ms = now_ms
 
         # Validate
         self._validate_job(job)
 
+        self._schedule(job)
         self._save()
         logger.debug(f"Updated cron job {job_id}")
         return job
@@ -433,6 +497,8 @@ class CronService:
 
         del self.jobs[job_id]
         self.runs.pop(job_id, None)
+        self._scheduled.pop(job_id, None)
+        self._catch_up_counts.pop(job_id, None)
         self._save()
 
         logger.debug(f"Removed cron job {job_id}")
@@ -482,8 +548,9 @@ class CronService:
         Args:
             mode: "now" for immediate check, "next-heartbeat" to wait
         """
-        # In full implementation, this would signal the scheduler
         logger.debug(f"Cron scheduler wake requested: {mode}")
+        if mode == "now":
+            self._notify()
 
     def get_runs(self, job_id: str, limit: int = 10) -> list[CronRunResult]:
         """Get run history for a job.
@@ -503,19 +570,181 @@ class CronService:
     # -------------------------------------------------------------------------
 
     async def _scheduler_loop(self) -> None:
-        """Main scheduler loop."""
+        """Main scheduler loop.
+
+        Dispatches every due job, then sleeps until the next run time on the
+        heap. Job changes and ``wake("now")`` interrupt the sleep.
+        """
+        assert self._wake_event is not None
         while self._running:
+            next_at: int | None = None
             try:
                 now_ms = int(time.time() * 1000)
-
-                for job in list(self.jobs.values()):
-                    if job.enabled and self._is_due(job):
-                        await self._execute_job(job)
+                for job, scheduled_at_ms in self._pop_due(now_ms):
+                    self._dispatch(job, scheduled_at_ms, now_ms)
+                _, next_at = self._get_next_scheduled_job()
 
             except Exception as e:
                 logger.error(f"Cron scheduler error: {e}")
 
-            await asyncio.sleep(self.tick_interval)
+            timeout = self.tick_interval
+            if next_at is not None:
+                timeout = min(timeout, max(0.0, (next_at - time.time() * 1000) / 1000))
+            self._wake_event.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake_event.wait(), timeout)
+
+    # -------------------------------------------------------------------------
+    # Schedule Heap
+    # -------------------------------------------------------------------------
+
+    def _schedule(self, job: CronJob) -> None:
+        """(Re)register a job's next run time on the heap."""
+        next_at = job.state.next_run_at_ms if job.enabled else None
+        if next_at is None:
+            self._scheduled.pop(job.id, None)
+        elif self._scheduled.get(job.id) != next_at:
+            self._scheduled[job.id] = next_at
+            heapq.heappush(self._heap, (next_at, job.id))
+            # Drop superseded entries once they dominate the heap
+            if len(self._heap) > 2 * len(self._scheduled) + 1024:
+                self._rebuild_schedule(from_jobs=False)
+        self._notify()
+
+    def _rebuild_schedule(self, from_jobs: bool = True) -> None:
+        """Rebuild the heap (from job state, or from the valid entries)."""
+        if from_jobs:
+            self._scheduled = {
+                job.id: job.state.next_run_at_ms
+                for job in self.jobs.values()
+                if job.enabled and job.state.next_run_at_ms is not None
+            }
+        self._heap = [(at, job_id) for job_id, at in self._scheduled.items()]
+        heapq.heapify(self._heap)
+
+    def _valid_head(self) -> tuple[CronJob, int] | None:
+        """Discard stale entries at the top of the heap and return the head."""
+        while self._heap:
+            at, job_id = self._heap[0]
+            job = self.jobs.get(job_id)
+            if self._scheduled.get(job_id) != at or job is None or not job.enabled:
+                heapq.heappop(self._heap)
+                if self._scheduled.get(job_id) == at:
+                    del self._scheduled[job_id]
+                continue
+            if job.state.next_run_at_ms != at:
+                # State was changed directly; reschedule from the job itself
+                heapq.heappop(self._heap)
+                del self._scheduled[job_id]
+                self._schedule(job)
+                continue
+            return job, at
+        return None
+
+    def _pop_due(self, now_ms: int) -> list[tuple[CronJob, int]]:
+        """Pop every job due at ``now_ms``, earliest first."""
+        due: list[tuple[CronJob, int]] = []
+        while (head := self._valid_head()) is not None and head[1] <= now_ms:
+            job, at = head
+            heapq.heappop(self._heap)
+            del self._scheduled[job.id]
+            # A running job (e.g. forced via run()) is rescheduled when it finishes
+            if not job.state.running_at_ms:
+                due.append((job, at))
+        return due
+
+    def _notify(self) -> None:
+        """Wake the scheduler loop so it recomputes its sleep."""
+        if self._wake_event is not None:
+            self._wake_event.set()
+
+    # -------------------------------------------------------------------------
+    # Dispatch
+    # -------------------------------------------------------------------------
+
+    def _dispatch(self, job: CronJob, scheduled_at_ms: int, now_ms: int) -> None:
+        """Queue a due job for the worker pool, applying the misfire policy."""
+        policy = job.misfire_policy or self.misfire_policy
+        if policy == "skip" and now_ms - scheduled_at_ms > self.misfire_grace_ms:
+            self._record_misfire(job, scheduled_at_ms, now_ms)
+            return
+
+        job.state.running_at_ms = now_ms  # reserved until a worker picks it up
+        agent = job.agent_id or self.agent_id
+        self._waiting.setdefault(agent, deque()).append((job.id, scheduled_at_ms))
+        self._mark_ready(agent)
+        self._drain()
+
+    def _mark_ready(self, agent: str) -> None:
+        if (
+            self._waiting.get(agent)
+            and self._agent_running.get(agent, 0) < self.max_concurrent_runs_per_agent
+            and agent not in self._ready_agents
+        ):
+            self._ready_agents.append(agent)
+
+    def _drain(self) -> None:
+        """Start queued jobs while there is capacity, round-robin across agents."""
+        while self._ready_agents and len(self._active) < self.max_concurrent_runs:
+            agent = self._ready_agents.popleft()
+            queue = self._waiting[agent]
+            job_id, scheduled_at_ms = queue.popleft()
+            if not queue:
+                del self._waiting[agent]
+
+            job = self.jobs.get(job_id)
+            if job is not None:
+                self._agent_running[agent] = self._agent_running.get(agent, 0) + 1
+                task = asyncio.create_task(self._run_queued(job, agent, scheduled_at_ms))
+                self._active.add(task)
+            self._mark_ready(agent)
+
+    async def _run_queued(self, job: CronJob, agent: str, scheduled_at_ms: int) -> None:
+        """Run a dispatched job, then hand its slot to the next queued job."""
+        try:
+            await self._execute_job(job, scheduled_at_ms)
+        except Exception as e:
+            logger.error(f"Cron run task failed: {e}")
+        finally:
+            self._active.discard(asyncio.current_task())
+            self._agent_running[agent] -= 1
+            if not self._agent_running[agent]:
+                del self._agent_running[agent]
+            self._mark_ready(agent)
+            self._drain()
+
+    def _record_misfire(self, job: CronJob, scheduled_at_ms: int, now_ms: int) -> None:
+        """Record a skipped (misfired) run and move on to the next occurrence."""
+        result = CronRunResult(
+            job_id=job.id,
+            run_id=f"run_{uuid4().hex[:8]}",
+            started_at_ms=now_ms,
+            ended_at_ms=now_ms,
+            status="skipped",
+            error=f"misfired: {now_ms - scheduled_at_ms}ms late",
+            duration_ms=0,
+        )
+        job.state.last_status = "skipped"
+        job.state.next_run_at_ms = self._calculate_next_run(job.schedule, now_ms)
+        self._schedule(job)
+        self._save()
+        if job.id in self.runs:
+            self.runs[job.id].append(result)
+            self.runs[job.id] = self.runs[job.id][-100:]
+        logger.debug(f"Cron job {job.id} misfired, skipped")
+
+    def _next_run_after(self, job: CronJob, scheduled_at_ms: int | None, now_ms: int) -> int | None:
+        """Next run time after a run, honoring the catch_up policy."""
+        policy = job.misfire_policy or self.misfire_policy
+        if policy == "catch_up" and scheduled_at_ms is not None:
+            next_at = self._calculate_next_run(job.schedule, scheduled_at_ms)
+            if next_at is not None and next_at <= now_ms - self.misfire_grace_ms:
+                count = self._catch_up_counts.get(job.id, 0) + 1
+                if count < self.max_catch_up_runs:
+                    self._catch_up_counts[job.id] = count
+                    return next_at
+        self._catch_up_counts.pop(job.id, None)
+        return self._calculate_next_run(job.schedule, now_ms)
 
     def _is_due(self, job: CronJob) -> bool:
         """Check if job is due for execution."""
@@ -526,8 +755,15 @@ class CronService:
         now_ms = int(time.time() * 1000)
         return now_ms >= job.state.next_run_at_ms
 
-    async def _execute_job(self, job: CronJob) -> CronRunResult:
-        """Execute a cron job."""
+    async def _execute_job(
+        self, job: CronJob, scheduled_at_ms: int | None = None
+    ) -> CronRunResult:
+        """Execute a cron job.
+
+        Args:
+            job: Job to run
+            scheduled_at_ms: Run time this execution was scheduled for (None when forced)
+        """
         now_ms = int(time.time() * 1000)
         run_id = f"run_{uuid4().hex[:8]}"
 
@@ -586,14 +822,15 @@ class CronService:
             job.state.running_at_ms = None
 
             # Calculate next run
-            job.state.next_run_at_ms = self._calculate_next_run(
-                job.schedule, int(time.time() * 1000)
+            job.state.next_run_at_ms = self._next_run_after(
+                job, scheduled_at_ms, int(time.time() * 1000)
             )
 
             # Handle delete_after_run
             if job.delete_after_run and result.status == "ok":
                 self.remove(job.id)
-            else:
+            elif job.id in self.jobs:
+                self._schedule(job)
                 self._save()
 
         # Store run result
@@ -674,18 +911,10 @@ class CronService:
 
     def _get_next_scheduled_job(self) -> tuple[CronJob | None, int | None]:
         """Get the next scheduled job and its run time."""
-        next_job: CronJob | None = None
-        next_at: int | None = None
-
-        for job in self.jobs.values():
-            if not job.enabled:
-                continue
-            job_next = job.state.next_run_at_ms
-            if job_next and (next_at is None or job_next < next_at):
-                next_at = job_next
-                next_job = job
-
-        return next_job, next_at
+        head = self._valid_head()
+        if head is None:
+            return None, None
+        return head
 
     def _validate_job(self, job: CronJob) -> None:
         """Validate job configuration."""
@@ -784,9 +1013,13 @@ class CronService:
                         continue
                     data = json.loads(line)
                     job = self._job_from_dict(data)
+                    # Nothing can be running at startup; clear state left by a crash
+                    job.state.running_at_ms = None
                     self.jobs[job.id] = job
                     self.runs[job.id] = []
 
+            self._rebuild_schedule()
+
             logger.debug(f"Loaded {len(self.jobs)} cron jobs from {self.storage_path}")
         except Exception as e:
             logger.error(f"Failed to load cron jobs: {e}")
@@ -849,6 +1082,7 @@ class CronService:
             "wake_mode": job.wake_mode,
             "payload": payload_dict,
             "isolation": isolation_dict,
+            "misfire_policy": job.misfire_policy,
             "state": {
                 "next_run_at_ms": job.state.next_run_at_ms,
                 "running_at_ms": job.state.running_at_ms,
@@ -877,6 +1111,7 @@ class CronService:
             wake_mode=data.get("wake_mode", "next-heartbeat"),
             payload=self._parse_payload(data.get("payload", {})),
             isolation=self._parse_isolation(data.get("isolation")),
+            misfire_policy=data.get("misfire_policy"),
             state=CronJobState(
                 next_run_at_ms=state_data.get("next_run_at_ms"),
                 running_at_ms=state_data.get("running_at_ms"),
@@ -900,6 +1135,7 @@ __all__ = [
     "CronScheduleCron",
     # Payload types
     "CronPayload",
+    "MisfirePolicy",
     "SystemEventPayload",
     "AgentTurnPayload",
     # Job types
@@ -15,6 +15,8 @@ import httpx
 from loguru import logger
 from pydantic import Field
 
+from lurkbot.utils.http_client import create_http_client
+
 from .base import ConfigItem, ConfigProvider, ProviderConfig
 
 
@@ -90,7 +92,7 @@ class ConsulProvider(ConfigProvider):
         if self.consul_config.token:
             headers["X-Consul-Token"] = self.consul_config.token
 
-        self._client = httpx.AsyncClient(
+        self._client = create_http_client(
             timeout=self.config.timeout,
             headers=headers,
         )
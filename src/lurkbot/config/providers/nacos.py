@@ -15,6 +15,8 @@ import httpx
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from lurkbot.utils.http_client import create_http_client
+
 from .base import ConfigItem, ConfigProvider, ProviderConfig
 
 
@@ -77,7 +79,7 @@ class NacosProvider(ConfigProvider):
 
     async def _connect(self) -> bool:
         """连接到 Nacos"""
-        self._client = httpx.AsyncClient(timeout=self.config.timeout)
+        self._client = create_http_client(timeout=self.config.timeout)
 
         # 如果配置了用户名密码，获取 token
         if self.nacos_config.username and self.nacos_config.password:
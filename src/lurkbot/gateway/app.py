@@ -81,6 +81,22 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # 关闭时
     logger.info("Shutting down LurkBot Gateway...")
 
+    # 刷新 write-behind 队列中尚未写入的上下文
+    try:
+        from lurkbot.agents.context.manager import close_context_manager
+
+        await close_context_manager()
+    except Exception as e:
+        logger.warning(f"Failed to close context manager: {e}")
+
+    # 关闭出站 HTTP 共享连接池
+    try:
+        from lurkbot.utils.http_client import close_http_clients
+
+        await close_http_clients()
+    except Exception as e:
+        logger.warning(f"Failed to close HTTP client pools: {e}")
+
 
 # ============================================================================
 # FastAPI Application Factory
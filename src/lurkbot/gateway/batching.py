@@ -2,15 +2,53 @@
 消息批处理模块
 
 实现消息批量发送，提升吞吐量
+
+支持两种线路模式：
+- message: 每条消息一个 WebSocket 帧（默认，兼容所有客户端）
+- batch: 一次刷新只发送一个帧 {"type": "batch", "frames": [...]}，
+  整批消息只做一次 orjson 序列化，需在握手时协商 batch-frames 能力
 """
 
 import asyncio
-from typing import Callable, Awaitable
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Awaitable, Literal
 from loguru import logger
 
 from lurkbot.utils import json_utils as json
 
 
+WireMode = Literal["message", "batch"]
+
+# 发送延迟 EWMA 平滑系数
+_LATENCY_ALPHA = 0.2
+
+
+@dataclass
+class BatcherStats:
+    """批处理统计"""
+
+    messages_sent: int = 0
+    frames_sent: int = 0
+    flushes: int = 0
+    send_latency_ewma: float = 0.0  # 秒
+
+    @property
+    def avg_batch_size(self) -> float:
+        """平均每次刷新的消息数"""
+        return self.messages_sent / self.flushes if self.flushes else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为字典"""
+        return {
+            "messages_sent": self.messages_sent,
+            "frames_sent": self.frames_sent,
+            "flushes": self.flushes,
+            "avg_batch_size": self.avg_batch_size,
+            "send_latency_ewma_ms": self.send_latency_ewma * 1000,
+        }
+
+
 class MessageBatcher:
     """消息批处理器
 
@@ -18,12 +56,22 @@ class MessageBatcher:
     1. 批量大小触发：达到 batch_size 时立即刷新
     2. 延迟触发：超过 batch_delay 时自动刷新
     3. 手动刷新：支持显式调用 flush()
+    4. 单帧批量：batch 模式下一次刷新只序列化、发送一个帧
+    5. 自适应延迟：根据实测发送延迟调整 batch_delay，
+       发送越慢就攒越多消息再发，发送很快则尽快刷新以降低延迟
 
     Args:
         send_func: 发送函数，接收 JSON 字符串
         batch_size: 批量大小（默认 100）
         batch_delay: 批量延迟（秒，默认 0.01 = 10ms）
         auto_flush: 是否自动刷新（默认 True）
+        wire_mode: 线路模式，"message" 或 "batch"（默认 "message"）
+        send_bytes_func: batch 模式的发送函数，接收 JSON bytes；
+            未提供时解码后交给 send_func
+        adaptive_delay: 是否根据发送延迟自适应调整 batch_delay（默认 False）
+        min_batch_delay: 自适应延迟下限（秒）
+        max_batch_delay: 自适应延迟上限（秒）
+        latency_factor: 自适应延迟 = 发送延迟 EWMA × latency_factor
     """
 
     def __init__(
@@ -32,22 +80,38 @@ class MessageBatcher:
         batch_size: int = 100,
         batch_delay: float = 0.01,
         auto_flush: bool = True,
+        wire_mode: WireMode = "message",
+        send_bytes_func: Callable[[bytes], Awaitable[None]] | None = None,
+        adaptive_delay: bool = False,
+        min_batch_delay: float = 0.001,
+        max_batch_delay: float = 0.05,
+        latency_factor: float = 2.0,
     ):
+        if wire_mode not in ("message", "batch"):
+            raise ValueError(f"Unknown wire mode: {wire_mode}")
+
         self.send_func = send_func
+        self.send_bytes_func = send_bytes_func
         self.batch_size = batch_size
         self.batch_delay = batch_delay
         self.auto_flush = auto_flush
-
-        self._buffer: list[dict] = []
+        self.wire_mode: WireMode = wire_mode
+        self.adaptive_delay = adaptive_delay
+        self.min_batch_delay = min_batch_delay
+        self.max_batch_delay = max_batch_delay
+        self.latency_factor = latency_factor
+        self.stats = BatcherStats()
+
+        self._buffer: list[dict | json.Fragment] = []
         self._flush_task: asyncio.Task | None = None
         self._lock = asyncio.Lock()
         self._closed = False
 
-    async def add(self, message: dict) -> None:
+    async def add(self, message: dict | json.Fragment) -> None:
         """添加消息到批处理缓冲区
 
         Args:
-            message: 要发送的消息字典
+            message: 要发送的消息字典，或已序列化的 json_utils.Fragment
         """
         if self._closed:
             logger.warning("Batcher is closed, ignoring message")
@@ -63,6 +127,27 @@ class MessageBatcher:
             elif self.auto_flush and not self._flush_task:
                 self._flush_task = asyncio.create_task(self._delayed_flush())
 
+    def enable_batch_frames(
+        self, send_bytes_func: Callable[[bytes], Awaitable[None]] | None = None
+    ) -> None:
+        """切换到单帧批量模式（握手协商成功后调用）
+
+        Args:
+            send_bytes_func: 发送 JSON bytes 的函数
+        """
+        self.wire_mode = "batch"
+        if send_bytes_func is not None:
+            self.send_bytes_func = send_bytes_func
+
+    def get_stats(self) -> dict[str, Any]:
+        """获取批处理统计"""
+        return {
+            **self.stats.to_dict(),
+            "wire_mode": self.wire_mode,
+            "batch_delay_ms": self.batch_delay * 1000,
+            "buffered": len(self._buffer),
+        }
+
     async def flush(self) -> None:
         """刷新缓冲区（公共接口）"""
         async with self._lock:
@@ -97,7 +182,7 @@ class MessageBatcher:
             # 任务被取消，正常情况
             pass
 
-    async def _send_batch(self, messages: list[dict]) -> None:
+    async def _send_batch(self, messages: list[dict | json.Fragment]) -> None:
         """批量发送消息
 
         Args:
@@ -106,12 +191,40 @@ class MessageBatcher:
         if not messages:
             return
 
-        # 批量序列化
-        batch_data = [json.dumps(msg) for msg in messages]
-
-        # 批量发送
-        for data in batch_data:
-            await self.send_func(data)
+        start = time.perf_counter()
+        if self.wire_mode == "batch":
+            # 整批一次序列化，一个帧发出
+            payload = json.dumps_bytes({"type": "batch", "frames": messages})
+            if self.send_bytes_func is not None:
+                await self.send_bytes_func(payload)
+            else:
+                await self.send_func(payload.decode("utf-8"))
+            frames = 1
+        else:
+            # 批量序列化
+            batch_data = [json.dumps(msg) for msg in messages]
+
+            # 批量发送
+            for data in batch_data:
+                await self.send_func(data)
+            frames = len(batch_data)
+
+        self._record_send(len(messages), frames, time.perf_counter() - start)
+
+    def _record_send(self, messages: int, frames: int, latency: float) -> None:
+        """记录发送统计，并在启用时调整批量延迟"""
+        stats = self.stats
+        if stats.flushes == 0:
+            stats.send_latency_ewma = latency
+        else:
+            stats.send_latency_ewma += _LATENCY_ALPHA * (latency - stats.send_latency_ewma)
+        stats.flushes += 1
+        stats.messages_sent += messages
+        stats.frames_sent += frames
+
+        if self.adaptive_delay:
+            target = stats.send_latency_ewma * self.latency_factor
+            self.batch_delay = min(self.max_batch_delay, max(self.min_batch_delay, target))
 
     async def close(self) -> None:
         """关闭批处理器，刷新剩余消息"""
@@ -2,24 +2,94 @@
 Gateway 事件广播系统
 
 对标 MoltBot src/gateway/events.ts
+
+每个订阅者拥有一个有界出站队列和独立的写任务：emit() 只负责入队，
+慢客户端不会拖慢其他订阅者，停止读取的客户端也不会让内存无限增长。
+队列满时按订阅者的溢出策略处理（丢弃最旧 / 按事件类型合并 / 断开）。
 """
 
 import asyncio
 import time
-from typing import Callable, Awaitable
+from collections import deque
 from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Awaitable
 from loguru import logger
 
 from lurkbot.gateway.protocol.frames import EventFrame
+from lurkbot.utils import json_utils as json
+
+
+class OverflowPolicy(str, Enum):
+    """订阅者队列溢出策略"""
+
+    DROP_OLDEST = "drop_oldest"  # 丢弃队列中最旧的事件
+    COALESCE = "coalesce"  # 用新事件替换队列中同类型的旧事件，没有同类型时丢弃最旧
+    DISCONNECT = "disconnect"  # 断开订阅者
 
 
 @dataclass
+class SubscriberStats:
+    """订阅者投递统计（按连接）"""
+
+    queued: int = 0
+    delivered: int = 0
+    failed: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+    total_lag_ms: float = 0.0
+
+    @property
+    def avg_lag_ms(self) -> float:
+        """平均投递延迟（入队到开始投递，毫秒）"""
+        return self.total_lag_ms / self.delivered if self.delivered else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为字典"""
+        return {
+            "queued": self.queued,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "last_lag_ms": self.last_lag_ms,
+            "max_lag_ms": self.max_lag_ms,
+            "avg_lag_ms": self.avg_lag_ms,
+        }
+
+
+@dataclass(eq=False)
 class EventSubscriber:
-    """事件订阅者"""
+    """事件订阅者
+
+    serialized=True 时 callback 接收共享的 JSON bytes（每个事件只序列化一次），
+    否则接收 EventFrame。
+    """
 
-    callback: Callable[[EventFrame], Awaitable[None]]
+    callback: Callable[[Any], Awaitable[None]]
     session_key: str | None = None  # None = 订阅所有事件
     event_filter: str | None = None  # None = 订阅所有事件类型
+    name: str | None = None  # 用于统计的订阅者名称（如连接 ID）
+    serialized: bool = False
+    queue_size: int = 1024
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    on_disconnect: Callable[[], Awaitable[None]] | None = None  # DISCONNECT 策略触发时调用
+    stats: SubscriberStats = field(default_factory=SubscriberStats)
+    closed: bool = False
+
+    # (事件帧, 共享 bytes, 入队时间)
+    _queue: deque[tuple[EventFrame, bytes | None, float]] = field(
+        default_factory=deque, init=False, repr=False
+    )
+    _wakeup: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+    _writer: asyncio.Task | None = field(default=None, init=False, repr=False)
+    _delivering: bool = field(default=False, init=False, repr=False)
 
 
 class EventBroadcaster:
@@ -27,12 +97,22 @@ class EventBroadcaster:
     事件广播器
 
     对标 MoltBot EventEmitter
+
+    Args:
+        queue_size: 每个订阅者的默认队列容量
+        overflow_policy: 默认溢出策略
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        queue_size: int = 1024,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ):
         self._subscribers: list[EventSubscriber] = []
         self._event_id_counter = 0
         self._lock = asyncio.Lock()
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
 
     def _generate_event_id(self) -> str:
         """生成事件 ID"""
@@ -41,15 +121,37 @@ class EventBroadcaster:
 
     def subscribe(
         self,
-        callback: Callable[[EventFrame], Awaitable[None]],
+        callback: Callable[[Any], Awaitable[None]],
         session_key: str | None = None,
         event_filter: str | None = None,
+        *,
+        name: str | None = None,
+        serialized: bool = False,
+        queue_size: int | None = None,
+        overflow_policy: OverflowPolicy | None = None,
+        on_disconnect: Callable[[], Awaitable[None]] | None = None,
     ) -> EventSubscriber:
-        """订阅事件"""
+        """订阅事件
+
+        Args:
+            callback: 投递回调
+            session_key: 只接收该会话的事件
+            event_filter: 只接收以该前缀开头的事件
+            name: 订阅者名称，用于统计
+            serialized: 回调接收共享的 JSON bytes 而不是 EventFrame
+            queue_size: 出站队列容量（默认使用广播器配置）
+            overflow_policy: 溢出策略（默认使用广播器配置）
+            on_disconnect: DISCONNECT 策略断开订阅者时调用
+        """
         subscriber = EventSubscriber(
             callback=callback,
             session_key=session_key,
             event_filter=event_filter,
+            name=name,
+            serialized=serialized,
+            queue_size=queue_size or self.queue_size,
+            overflow_policy=overflow_policy or self.overflow_policy,
+            on_disconnect=on_disconnect,
         )
         self._subscribers.append(subscriber)
         logger.debug(f"Added event subscriber (session={session_key}, filter={event_filter})")
@@ -60,6 +162,7 @@ class EventBroadcaster:
         if subscriber in self._subscribers:
             self._subscribers.remove(subscriber)
             logger.debug("Removed event subscriber")
+        self._close_subscriber(subscriber)
 
     async def emit(
         self,
@@ -80,17 +183,32 @@ class EventBroadcaster:
         return event_frame
 
     async def _broadcast(self, event_frame: EventFrame) -> None:
-        """广播事件到所有订阅者"""
-        tasks = []
-        for subscriber in self._subscribers:
-            if self._should_deliver(subscriber, event_frame):
-                tasks.append(self._deliver_event(subscriber, event_frame))
+        """广播事件：入队到所有匹配的订阅者，不等待投递完成"""
+        targets = [s for s in self._subscribers if self._should_deliver(s, event_frame)]
+        if not targets:
+            return
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        # 序列化一次，所有订阅者共享同一份 bytes
+        data = None
+        if any(s.serialized for s in targets):
+            data = json.dumps_bytes(event_frame.model_dump(by_alias=True))
+
+        disconnected = []
+        for subscriber in targets:
+            if not self._enqueue(subscriber, event_frame, data):
+                disconnected.append(subscriber)
+
+        for subscriber in disconnected:
+            await self._disconnect(subscriber)
+
+        # 让出一次事件循环，空闲的写任务可以立即开始投递
+        await asyncio.sleep(0)
 
     def _should_deliver(self, subscriber: EventSubscriber, event_frame: EventFrame) -> bool:
         """判断是否应该投递事件"""
+        if subscriber.closed:
+            return False
+
         # 检查 session_key 过滤
         if subscriber.session_key and subscriber.session_key != event_frame.session_key:
             return False
@@ -101,13 +219,128 @@ class EventBroadcaster:
 
         return True
 
-    async def _deliver_event(self, subscriber: EventSubscriber, event_frame: EventFrame) -> None:
+    def _enqueue(
+        self, subscriber: EventSubscriber, event_frame: EventFrame, data: bytes | None
+    ) -> bool:
+        """事件入队，返回 False 表示订阅者需要断开"""
+        queue = subscriber._queue
+        stats = subscriber.stats
+        item = (event_frame, data, time.monotonic())
+
+        if len(queue) >= subscriber.queue_size:
+            policy = subscriber.overflow_policy
+            if policy == OverflowPolicy.DISCONNECT:
+                return False
+
+            replaced = False
+            if policy == OverflowPolicy.COALESCE:
+                for i, (queued_frame, _, enqueued_at) in enumerate(queue):
+                    if queued_frame.event == event_frame.event:
+                        # 保留原队列位置和入队时间，内容替换为最新事件
+                        queue[i] = (event_frame, data, enqueued_at)
+                        stats.coalesced += 1
+                        replaced = True
+                        break
+            if replaced:
+                stats.queued += 1
+                return True
+
+            queue.popleft()
+            stats.dropped += 1
+
+        queue.append(item)
+        stats.queued += 1
+        stats.queue_depth = len(queue)
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+
+        subscriber._wakeup.set()
+        if subscriber._writer is None or subscriber._writer.done():
+            subscriber._writer = asyncio.create_task(self._writer_loop(subscriber))
+        return True
+
+    async def _writer_loop(self, subscriber: EventSubscriber) -> None:
+        """订阅者写任务：按顺序投递队列中的事件"""
+        queue = subscriber._queue
+        stats = subscriber.stats
+        while not subscriber.closed:
+            if not queue:
+                subscriber._wakeup.clear()
+                await subscriber._wakeup.wait()
+                continue
+
+            event_frame, data, enqueued_at = queue.popleft()
+            stats.queue_depth = len(queue)
+
+            lag_ms = (time.monotonic() - enqueued_at) * 1000
+            stats.last_lag_ms = lag_ms
+            stats.max_lag_ms = max(stats.max_lag_ms, lag_ms)
+            stats.total_lag_ms += lag_ms
+
+            subscriber._delivering = True
+            try:
+                await self._deliver_event(subscriber, event_frame, data)
+            finally:
+                subscriber._delivering = False
+
+    async def _deliver_event(
+        self, subscriber: EventSubscriber, event_frame: EventFrame, data: bytes | None = None
+    ) -> None:
         """投递事件到订阅者"""
         try:
-            await subscriber.callback(event_frame)
+            await subscriber.callback(data if subscriber.serialized else event_frame)
+            subscriber.stats.delivered += 1
         except Exception as e:
+            subscriber.stats.failed += 1
             logger.error(f"Error delivering event {event_frame.event}: {e}")
 
+    async def _disconnect(self, subscriber: EventSubscriber) -> None:
+        """按 DISCONNECT 策略断开订阅者"""
+        logger.warning(
+            f"Event subscriber {subscriber.name or id(subscriber)} overflowed "
+            f"({subscriber.queue_size} queued), disconnecting"
+        )
+        self.unsubscribe(subscriber)
+        if subscriber.on_disconnect:
+            try:
+                await subscriber.on_disconnect()
+            except Exception as e:
+                logger.error(f"Error disconnecting event subscriber: {e}")
+
+    def _close_subscriber(self, subscriber: EventSubscriber) -> None:
+        """停止订阅者写任务并丢弃未投递事件"""
+        subscriber.closed = True
+        subscriber.stats.dropped += len(subscriber._queue)
+        subscriber._queue.clear()
+        subscriber.stats.queue_depth = 0
+        if subscriber._writer and not subscriber._writer.done():
+            subscriber._writer.cancel()
+        subscriber._writer = None
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """等待所有订阅者队列投递完毕
+
+        Returns:
+            超时前全部投递完毕返回 True
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while any(s._queue or s._delivering for s in self._subscribers):
+            if deadline is not None and loop.time() >= deadline:
+                return False
+            await asyncio.sleep(0.001)
+        return True
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        """获取每个订阅者（连接）的投递与延迟统计"""
+        return {
+            subscriber.name or f"subscriber_{i}": {
+                **subscriber.stats.to_dict(),
+                "overflow_policy": subscriber.overflow_policy.value,
+                "queue_size": subscriber.queue_size,
+            }
+            for i, subscriber in enumerate(self._subscribers)
+        }
+
 
 # 全局事件广播器实例
 _event_broadcaster = EventBroadcaster()
@@ -116,4 +349,3 @@ _event_broadcaster = EventBroadcaster()
 def get_event_broadcaster() -> EventBroadcaster:
     """获取全局事件广播器"""
     return _event_broadcaster
-
@@ -5,6 +5,8 @@ Gateway 协议定义
 """
 
 from lurkbot.gateway.protocol.frames import (
+    CAP_BATCH_FRAMES,
+    BatchFrame,
     ConnectParams,
     HelloOk,
     EventFrame,
@@ -19,6 +21,8 @@ from lurkbot.gateway.protocol.frames import (
 )
 
 __all__ = [
+    "CAP_BATCH_FRAMES",
+    "BatchFrame",
     "ConnectParams",
     "HelloOk",
     "EventFrame",
@@ -8,6 +8,9 @@ from enum import Enum
 from typing import Literal
 from pydantic import BaseModel, Field
 
+# 客户端在 hello.caps 中声明、服务器在 hello-ok.caps 中确认的能力
+CAP_BATCH_FRAMES = "batch-frames"  # 一个 WebSocket 帧携带多条消息
+
 
 class ErrorCode(str, Enum):
     """错误码枚举"""
@@ -92,6 +95,17 @@ class HelloOk(BaseModel):
     server: ServerInfo
     features: Features
     snapshot: Snapshot
+    caps: list[str] = []  # 协商后启用的能力
+
+
+class BatchFrame(BaseModel):
+    """批量帧（协商 batch-frames 能力后使用）
+
+    一次刷新的全部消息按顺序放入 frames，作为一个 WebSocket 帧发送。
+    """
+
+    type: Literal["batch"] = "batch"
+    frames: list[dict]
 
 
 class EventFrame(BaseModel):
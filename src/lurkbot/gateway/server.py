@@ -13,12 +13,12 @@ from loguru import logger
 from lurkbot.utils import json_utils as json
 
 from lurkbot.gateway.protocol.frames import (
+    CAP_BATCH_FRAMES,
     ConnectParams,
     HelloOk,
     ServerInfo,
     Features,
     Snapshot,
-    EventFrame,
     RequestFrame,
     ResponseFrame,
     ErrorCode,
@@ -39,6 +39,7 @@ class GatewayConnection:
         enable_batching: bool = True,
         batch_size: int = 100,
         batch_delay: float = 0.01,
+        adaptive_delay: bool = True,
     ):
         self.websocket = websocket
         self.conn_id = conn_id
@@ -52,14 +53,34 @@ class GatewayConnection:
                 send_func=self._send_text,
                 batch_size=batch_size,
                 batch_delay=batch_delay,
+                adaptive_delay=adaptive_delay,
             )
         else:
             self.batcher = None
 
+    @property
+    def batch_frames(self) -> bool:
+        """是否已启用单帧批量模式"""
+        return self.batcher is not None and self.batcher.wire_mode == "batch"
+
+    async def enable_batch_frames(self) -> None:
+        """切换到单帧批量模式
+
+        先刷新已缓冲的消息（如 hello-ok），保证协商前的消息仍按单帧发送。
+        """
+        if self.batcher is None:
+            return
+        await self.batcher.flush()
+        self.batcher.enable_batch_frames(self._send_bytes)
+
     async def _send_text(self, text: str) -> None:
         """发送文本消息（内部方法）"""
         await self.websocket.send_text(text)
 
+    async def _send_bytes(self, data: bytes) -> None:
+        """发送二进制消息（内部方法，batch 模式下承载 UTF-8 JSON）"""
+        await self.websocket.send_bytes(data)
+
     async def send_json(self, data: dict) -> None:
         """发送 JSON 消息（支持批处理）"""
         if self.batcher:
@@ -67,6 +88,13 @@ class GatewayConnection:
         else:
             await self.websocket.send_text(json.dumps(data))
 
+    async def send_serialized(self, data: bytes) -> None:
+        """发送已序列化的 JSON 消息（支持批处理，不会重新序列化）"""
+        if self.batcher:
+            await self.batcher.add(json.Fragment(data))
+        else:
+            await self.websocket.send_text(data.decode("utf-8"))
+
     async def receive_json(self) -> dict:
         """接收 JSON 消息"""
         text = await self.websocket.receive_text()
@@ -101,6 +129,7 @@ class GatewayServer:
         await websocket.accept()
         logger.info(f"Gateway connection accepted: {conn_id}")
 
+        subscriber = None
         try:
             # 握手
             await self._handshake(connection)
@@ -108,7 +137,10 @@ class GatewayServer:
 
             # 订阅事件
             subscriber = self._event_broadcaster.subscribe(
-                lambda event: self._send_event(connection, event)
+                lambda data: self._send_event(connection, data),
+                name=conn_id,
+                serialized=True,
+                on_disconnect=lambda: self._close_slow_connection(connection),
             )
 
             # 消息循环
@@ -167,6 +199,11 @@ class GatewayServer:
                 logger.warning(f"Tenant validation failed: {e}")
                 # Continue without tenant context for backward compatibility
 
+        # 协商能力：仅在启用批处理且客户端声明支持时使用单帧批量
+        caps: list[str] = []
+        if connection.batcher is not None and CAP_BATCH_FRAMES in (connect_params.caps or []):
+            caps.append(CAP_BATCH_FRAMES)
+
         # 发送 hello-ok 响应
         hello_ok = HelloOk(
             protocol=self.PROTOCOL_VERSION,
@@ -180,9 +217,12 @@ class GatewayServer:
                 events=["agent.*", "session.*", "cron.*", "config.*"],
             ),
             snapshot=Snapshot(),
+            caps=caps,
         )
 
         await connection.send_json(hello_ok.model_dump(by_alias=True))
+        if CAP_BATCH_FRAMES in caps:
+            await connection.enable_batch_frames()
         connection.authenticated = True
         logger.info(f"Handshake completed for {connection.conn_id}")
 
@@ -263,13 +303,17 @@ class GatewayServer:
 
         await connection.send_json(response.model_dump(by_alias=True))
 
-    async def _send_event(self, connection: GatewayConnection, event: EventFrame) -> None:
-        """发送事件到客户端"""
+    async def _send_event(self, connection: GatewayConnection, data: bytes) -> None:
+        """发送事件到客户端（data 为广播器共享的已序列化事件帧）"""
         try:
-            await connection.send_json(event.model_dump(by_alias=True))
+            await connection.send_serialized(data)
         except Exception as e:
             logger.error(f"Failed to send event: {e}")
 
+    async def _close_slow_connection(self, connection: GatewayConnection) -> None:
+        """关闭事件队列溢出的连接（1013: 稍后重试）"""
+        await connection.websocket.close(code=1013)
+
 
 # 全局 Gateway 服务器实例
 _gateway_server = GatewayServer()
@@ -1,5 +1,26 @@
 """Memory and vector search.
 
 This module contains memory infrastructure:
+- embeddings.py: Content-hash keyed embedding cache (LRU + mmap disk tier)
+- index.py: Persistent BM25 inverted index over memory file sections
+- vectors.py: Memory-mapped section embedding matrix for hybrid search
 - store.py: Memory store with sqlite-vec vector search
 """
+
+from .embeddings import Embedder, EmbeddingCache, EmbeddingCacheStats, content_hash
+from .index import IndexedSection, MemoryIndex, split_sections, tokenize
+from .vectors import HashingEmbedder, SectionVectorIndex, reciprocal_rank_fusion
+
+__all__ = [
+    "Embedder",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "content_hash",
+    "IndexedSection",
+    "MemoryIndex",
+    "split_sections",
+    "tokenize",
+    "HashingEmbedder",
+    "SectionVectorIndex",
+    "reciprocal_rank_fusion",
+]
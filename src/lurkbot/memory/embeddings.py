@@ -0,0 +1,311 @@
+"""Content-addressed embedding cache.
+
+Embedding the same text twice is common: retries, repeated prompts, and the
+save-after-query path in the context system (the prompt embedded for
+retrieval is embedded again when the interaction is saved). ``EmbeddingCache``
+sits in front of an embedder and keys vectors by a hash of the embedder name
+and the text. It has two tiers:
+
+- an in-process LRU of float32 vectors
+- an optional on-disk store: an append-only, memory-mapped float32 matrix
+  plus a key file, so vectors survive restarts without being loaded eagerly
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from lurkbot.logging import get_logger
+
+logger = get_logger("memory.embeddings")
+
+# An embedder maps a batch of texts to one vector per text
+Embedder = Callable[[list[str]], Sequence[Sequence[float]]]
+
+_KEY_BYTES = 16
+
+
+def content_hash(text: str, namespace: str = "") -> bytes:
+    """Hash a text (and embedder namespace) into a fixed-size cache key."""
+    digest = hashlib.blake2b(digest_size=_KEY_BYTES)
+    digest.update(namespace.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.digest()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Embedding cache statistics."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    memory_bytes: int = 0
+    disk_bytes: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Total hits across both tiers."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "memory_bytes": self.memory_bytes,
+            "disk_bytes": self.disk_bytes,
+        }
+
+
+class _DiskVectorStore:
+    """Append-only float32 vector store backed by ``np.memmap``.
+
+    Layout in ``directory``:
+    - ``meta.json``: embedder namespace and vector dimension
+    - ``keys.bin``: concatenated 16-byte keys, row i belongs to key i
+    - ``vectors.f32``: row-major float32 matrix
+    """
+
+    def __init__(self, directory: Path, namespace: str):
+        self.directory = directory
+        self.namespace = namespace
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._meta_path = directory / "meta.json"
+        self._keys_path = directory / "keys.bin"
+        self._vectors_path = directory / "vectors.f32"
+
+        self.dim: int | None = None
+        self._rows: dict[bytes, int] = {}
+        self._mmap: np.memmap | None = None
+        self._load()
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._rows) * (self.dim or 0) * 4
+
+    def _load(self) -> None:
+        if not self._meta_path.exists():
+            return
+
+        meta = json.loads(self._meta_path.read_text())
+        if meta.get("namespace") != self.namespace:
+            logger.info(f"Embedding store at {self.directory} is for another embedder, resetting")
+            self._reset()
+            return
+
+        self.dim = int(meta["dim"])
+        keys = self._keys_path.read_bytes() if self._keys_path.exists() else b""
+        vector_rows = (
+            self._vectors_path.stat().st_size // (self.dim * 4)
+            if self._vectors_path.exists()
+            else 0
+        )
+        # Ignore a torn trailing write: keep only rows present in both files
+        rows = min(len(keys) // _KEY_BYTES, vector_rows)
+        if self._keys_path.exists():
+            with open(self._keys_path, "r+b") as f:
+                f.truncate(rows * _KEY_BYTES)
+        if self._vectors_path.exists():
+            with open(self._vectors_path, "r+b") as f:
+                f.truncate(rows * self.dim * 4)
+        self._rows = {
+            keys[i * _KEY_BYTES : (i + 1) * _KEY_BYTES]: i for i in range(rows)
+        }
+
+    def _reset(self) -> None:
+        for path in (self._meta_path, self._keys_path, self._vectors_path):
+            path.unlink(missing_ok=True)
+        self.dim = None
+        self._rows = {}
+        self._mmap = None
+
+    def get(self, key: bytes) -> np.ndarray | None:
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        if self._mmap is None or row >= self._mmap.shape[0]:
+            self._mmap = np.memmap(
+                self._vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(len(self._rows), self.dim),
+            )
+        return np.array(self._mmap[row])
+
+    def put_many(self, items: list[tuple[bytes, np.ndarray]]) -> None:
+        items = [(key, vec) for key, vec in items if key not in self._rows]
+        if not items:
+            return
+
+        if self.dim is None:
+            self.dim = int(items[0][1].shape[0])
+            self._meta_path.write_text(json.dumps({"namespace": self.namespace, "dim": self.dim}))
+        items = [(key, vec) for key, vec in items if vec.shape[0] == self.dim]
+        if not items:
+            return
+
+        matrix = np.stack([vec for _, vec in items]).astype(np.float32, copy=False)
+        with open(self._vectors_path, "ab") as f:
+            f.write(matrix.tobytes())
+        with open(self._keys_path, "ab") as f:
+            f.write(b"".join(key for key, _ in items))
+
+        start = len(self._rows)
+        for offset, (key, _) in enumerate(items):
+            self._rows[key] = start + offset
+
+    def close(self) -> None:
+        self._mmap = None
+
+
+class EmbeddingCache:
+    """Content-hash keyed embedding cache with an optional disk tier.
+
+    The cache is thread-safe and meant to be called from storage worker
+    threads. Misses in one call are deduplicated and embedded in a single
+    batch.
+
+    Example:
+        >>> cache = EmbeddingCache(embedder, namespace="all-MiniLM-L6-v2")
+        >>> vectors = cache.embed(["hello", "world", "hello"])
+        >>> cache.get_stats()["hit_rate"]
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        namespace: str = "default",
+        max_entries: int = 4096,
+        cache_dir: str | Path | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            embedder: Callable embedding a batch of texts
+            namespace: Embedder/model name, part of every cache key
+            max_entries: Maximum number of vectors kept in memory
+            cache_dir: Directory for the on-disk tier, or None to disable it
+        """
+        self.embedder = embedder
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.stats = EmbeddingCacheStats()
+
+        self._memory: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._disk = _DiskVectorStore(Path(cache_dir), namespace) if cache_dir else None
+        self._lock = threading.Lock()
+        if self._disk:
+            self.stats.disk_bytes = self._disk.nbytes
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def embed_one(self, text: str) -> np.ndarray:
+        """Embed a single text."""
+        return self.embed([text])[0]
+
+    def embed(self, texts: Sequence[str]) -> list[np.ndarray]:
+        """Embed texts, serving repeated content from the cache.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One float32 vector per input text, in input order
+        """
+        keys = [content_hash(text, self.namespace) for text in texts]
+        vectors: dict[bytes, np.ndarray] = {}
+        missing: dict[bytes, str] = {}
+
+        with self._lock:
+            for key, text in zip(keys, texts, strict=True):
+                if key in vectors or key in missing:
+                    continue
+                vector = self._lookup(key)
+                if vector is None:
+                    missing[key] = text
+                    self.stats.misses += 1
+                else:
+                    vectors[key] = vector
+
+        if missing:
+            computed = self.embedder(list(missing.values()))
+            new_items = [
+                (key, np.asarray(vec, dtype=np.float32))
+                for key, vec in zip(missing, computed, strict=True)
+            ]
+            with self._lock:
+                for key, vector in new_items:
+                    self._remember(key, vector)
+                    vectors[key] = vector
+                if self._disk:
+                    self._disk.put_many(new_items)
+                    self.stats.disk_bytes = self._disk.nbytes
+
+        return [vectors[key] for key in keys]
+
+    def clear(self) -> None:
+        """Drop the in-memory tier."""
+        with self._lock:
+            self._memory.clear()
+            self.stats.memory_bytes = 0
+
+    def close(self) -> None:
+        """Release the disk tier's memory map."""
+        if self._disk:
+            self._disk.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            **self.stats.to_dict(),
+            "entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "disk_enabled": self._disk is not None,
+        }
+
+    def _lookup(self, key: bytes) -> np.ndarray | None:
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+            return vector
+
+        if self._disk:
+            vector = self._disk.get(key)
+            if vector is not None:
+                self.stats.disk_hits += 1
+                self._remember(key, vector)
+                return vector
+        return None
+
+    def _remember(self, key: bytes, vector: np.ndarray) -> None:
+        if key in self._memory:
+            return
+        self._memory[key] = vector
+        self.stats.memory_bytes += vector.nbytes
+        while len(self._memory) > self.max_entries:
+            _, evicted = self._memory.popitem(last=False)
+            self.stats.memory_bytes -= evicted.nbytes
+            self.stats.evictions += 1
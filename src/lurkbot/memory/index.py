@@ -0,0 +1,396 @@
+"""Persistent inverted index with BM25 ranking over memory sections.
+
+``MemoryIndex`` splits memory markdown files into sections (paragraphs
+separated by blank lines) and keeps a ``term -> {section: term frequency}``
+inverted index, so a search only touches the postings of the query terms
+instead of re-reading and re-scanning every file. Per-term BM25 weights are
+cached as NumPy arrays, so scoring a query is a few vectorized adds.
+
+- Files are re-read only when their mtime or size changed since the last
+  refresh; sections of deleted files are dropped.
+- The index is persisted as a single JSON file, so a restart does not
+  re-tokenize an unchanged corpus.
+- Tokenization is CJK-aware. Han, Kana and Hangul text has no word
+  boundaries, so those runs are indexed as overlapping character bigrams
+  (a one-character run is kept as a unigram, as in Lucene's CJK analyzer);
+  other text is split into lowercase words.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import numpy as np
+
+from lurkbot.logging import get_logger
+from lurkbot.utils import json_utils
+
+logger = get_logger("memory.index")
+
+# Bump when tokenization or the on-disk layout changes; older files are rebuilt
+INDEX_FORMAT_VERSION = 1
+
+# Kana, CJK ideographs and Hangul: scripts written without spaces between words
+_CJK_RANGES = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_TOKEN_RE = re.compile(rf"([{_CJK_RANGES}]+)|[^\W{_CJK_RANGES}]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase index terms.
+
+    Words are split on non-word characters; CJK runs become character bigrams.
+
+    Example:
+        >>> tokenize("Deploy 项目进度")
+        ['deploy', '项目', '目进', '进度']
+    """
+    tokens: list[str] = []
+    for match in _TOKEN_RE.finditer(text.lower()):
+        run = match.group(1)
+        if run is None:
+            tokens.append(match.group(0))
+        elif len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def split_sections(lines: list[str]) -> list[tuple[int, int, str]]:
+    """Split file lines into blank-line separated sections.
+
+    Returns:
+        ``(line_start, line_end, text)`` tuples with 1-indexed, inclusive lines
+    """
+    sections: list[tuple[int, int, str]] = []
+    start = 0
+    current: list[str] = []
+    for i, line in enumerate(lines):
+        if line.strip():
+            if not current:
+                start = i
+            current.append(line)
+        elif current:
+            sections.append((start + 1, i, "\n".join(current)))
+            current = []
+    if current:
+        sections.append((start + 1, len(lines), "\n".join(current)))
+    return sections
+
+
+@dataclass(slots=True)
+class IndexedSection:
+    """A section of a memory file stored in the index."""
+
+    path: str
+    line_start: int
+    line_end: int
+    content: str
+    length: int  # number of terms
+
+
+class MemoryIndex:
+    """Incrementally maintained BM25 index over memory files.
+
+    Not thread-safe; callers serialize ``refresh`` and ``search``.
+
+    Example:
+        >>> index = MemoryIndex(root, index_path=root / ".lurkbot" / "memory-index.json")
+        >>> index.refresh(root.glob("memory/**/*.md"))
+        >>> for section, score in index.search("deploy checklist", limit=5):
+        ...     print(section.path, section.line_start, score)
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        index_path: str | Path | None = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        """Initialize the index.
+
+        Args:
+            root: Directory that section paths are relative to
+            index_path: JSON file the index is persisted to, or None to keep it in memory
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+        """
+        self.root = Path(root)
+        self.index_path = Path(index_path) if index_path else None
+        self.k1 = k1
+        self.b = b
+
+        self._files: dict[str, tuple[int, int]] = {}  # path -> (mtime_ns, size)
+        self._file_sections: dict[str, list[int]] = {}
+        self._sections: dict[int, IndexedSection] = {}
+        self._postings: dict[str, dict[int, int]] = {}
+        self._total_length = 0
+        self._next_id = 0
+        # Incremented on every change; lets derived indexes detect staleness
+        self.version = 0
+
+        # Derived per-term BM25 weights, rebuilt lazily after changes
+        self._weights: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._length_norms: np.ndarray | None = None
+
+        if self.index_path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    @property
+    def sections(self) -> Mapping[int, IndexedSection]:
+        """Indexed sections by section id (read-only view)."""
+        return MappingProxyType(self._sections)
+
+    @property
+    def id_bound(self) -> int:
+        """Upper bound (exclusive) of section ids, for id-aligned arrays."""
+        return self._next_id
+
+    @property
+    def avg_length(self) -> float:
+        """Average section length in terms."""
+        return self._total_length / len(self._sections) if self._sections else 0.0
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def refresh(self, files: Iterable[Path]) -> bool:
+        """Bring the index up to date with the given files.
+
+        Only files whose mtime or size changed are re-read. Indexed files that
+        are no longer listed are removed.
+
+        Args:
+            files: Current memory files (absolute, under ``root``)
+
+        Returns:
+            True if the index changed
+        """
+        seen: set[str] = set()
+        changed = False
+        # String slicing instead of Path.relative_to, which dominates a no-op refresh
+        root_prefix = os.path.join(os.fspath(self.root), "")
+
+        for file_path in files:
+            path = os.fspath(file_path)
+            if path.startswith(root_prefix):
+                rel_path = path[len(root_prefix) :]
+            else:
+                rel_path = os.path.relpath(path, self.root)
+            seen.add(rel_path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._files.get(rel_path) == signature:
+                continue
+
+            self._remove_file(rel_path)
+            self._add_file(rel_path, file_path)
+            self._files[rel_path] = signature
+            changed = True
+
+        for rel_path in [p for p in self._files if p not in seen]:
+            self._remove_file(rel_path)
+            del self._files[rel_path]
+            changed = True
+
+        if changed:
+            self.version += 1
+            if self._next_id > 2 * len(self._sections) + 1024:
+                self._renumber()
+            self._invalidate()
+            if self.index_path is not None:
+                self._save()
+        return changed
+
+    def _add_file(self, rel_path: str, file_path: Path) -> None:
+        try:
+            lines = file_path.read_text(encoding="utf-8").splitlines()
+        except Exception:
+            lines = []
+
+        section_ids = []
+        for line_start, line_end, text in split_sections(lines):
+            section_id = self._next_id
+            self._next_id += 1
+            terms = Counter(tokenize(text))
+            length = sum(terms.values())
+            self._sections[section_id] = IndexedSection(
+                rel_path, line_start, line_end, text, length
+            )
+            self._total_length += length
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[section_id] = tf
+            section_ids.append(section_id)
+        self._file_sections[rel_path] = section_ids
+
+    def _renumber(self) -> None:
+        """Reassign dense section ids so score arrays stay sized to the corpus."""
+        new_ids = {old: new for new, old in enumerate(self._sections)}
+        self._sections = {new_ids[old]: section for old, section in self._sections.items()}
+        self._file_sections = {
+            path: [new_ids[old] for old in ids] for path, ids in self._file_sections.items()
+        }
+        self._postings = {
+            term: {new_ids[old]: tf for old, tf in postings.items()}
+            for term, postings in self._postings.items()
+        }
+        self._next_id = len(self._sections)
+
+    def _remove_file(self, rel_path: str) -> None:
+        for section_id in self._file_sections.pop(rel_path, []):
+            section = self._sections.pop(section_id)
+            self._total_length -= section.length
+            for term in set(tokenize(section.content)):
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+                postings.pop(section_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    # -------------------------------------------------------------------------
+    # Search
+    # -------------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[IndexedSection, float]]:
+        """Rank sections against a query with BM25.
+
+        Scores are normalized to ``[0, 1]`` by the best score attainable for
+        the query (every query term with saturated term frequency), so they
+        are comparable across queries and usable as a ``min_score`` threshold.
+
+        Args:
+            query: Search query
+            limit: Maximum number of sections to return
+
+        Returns:
+            ``(section, score)`` pairs, best first
+        """
+        terms = set(tokenize(query))
+        if not terms or not self._sections or limit <= 0:
+            return []
+
+        n = len(self._sections)
+        scores = np.zeros(self._next_id, dtype=np.float64)
+        max_score = 0.0
+        for term in terms:
+            df = len(self._postings.get(term, ()))
+            idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            max_score += idf * (self.k1 + 1.0)
+            if df:
+                section_ids, weights = self._term_weights(term)
+                scores[section_ids] += idf * weights
+
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(scores[candidates], -limit)[-limit:]]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [
+            (self._sections[int(section_id)], float(scores[section_id]) / max_score)
+            for section_id in ranked
+        ]
+
+    def _term_weights(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        """Section ids and BM25 term weights (without idf) for a term.
+
+        Weights depend on the average section length, so the cache is
+        cleared whenever the index changes and rebuilt lazily per term.
+        """
+        cached = self._weights.get(term)
+        if cached is not None:
+            return cached
+
+        if self._length_norms is None:
+            lengths = np.zeros(self._next_id, dtype=np.float64)
+            for section_id, section in self._sections.items():
+                lengths[section_id] = section.length
+            avg = self.avg_length or 1.0
+            self._length_norms = self.k1 * (1.0 - self.b + self.b * lengths / avg)
+
+        postings = self._postings[term]
+        section_ids = np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+        tf = np.fromiter(postings.values(), dtype=np.float64, count=len(postings))
+        weights = tf * (self.k1 + 1.0) / (tf + self._length_norms[section_ids])
+        self._weights[term] = (section_ids, weights)
+        return section_ids, weights
+
+    def _invalidate(self) -> None:
+        self._weights.clear()
+        self._length_norms = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "files": len(self._files),
+            "sections": len(self._sections),
+            "terms": len(self._postings),
+            "avg_section_length": self.avg_length,
+            "index_path": str(self.index_path) if self.index_path else None,
+        }
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if self.index_path is None or not self.index_path.exists():
+            return
+        try:
+            data = json_utils.loads(self.index_path.read_bytes())
+        except Exception as e:
+            logger.warning(f"Failed to load memory index {self.index_path}, rebuilding: {e}")
+            return
+        if data.get("version") != INDEX_FORMAT_VERSION or data.get("root") != str(self.root):
+            logger.info(f"Memory index at {self.index_path} is outdated, rebuilding")
+            return
+
+        self._files = {path: (sig[0], sig[1]) for path, sig in data["files"].items()}
+        for section_id, path, line_start, line_end, length, content in data["sections"]:
+            self._sections[section_id] = IndexedSection(path, line_start, line_end, content, length)
+            self._file_sections.setdefault(path, []).append(section_id)
+            self._total_length += length
+        self._postings = {
+            term: dict(zip(postings[0::2], postings[1::2], strict=True))
+            for term, postings in data["postings"].items()
+        }
+        self._next_id = max(self._sections, default=-1) + 1
+
+    def _save(self) -> None:
+        assert self.index_path is not None
+        data = {
+            "version": INDEX_FORMAT_VERSION,
+            "root": str(self.root),
+            "files": self._files,
+            "sections": [
+                [section_id, s.path, s.line_start, s.line_end, s.length, s.content]
+                for section_id, s in self._sections.items()
+            ],
+            # Flattened [id, tf, id, tf, ...] keeps the file compact
+            "postings": {
+                term: [value for item in postings.items() for value in item]
+                for term, postings in self._postings.items()
+            },
+        }
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(json_utils.dumps_bytes(data))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Failed to persist memory index {self.index_path}: {e}")
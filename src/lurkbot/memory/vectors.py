@@ -0,0 +1,338 @@
+"""Dense section embeddings for hybrid memory search.
+
+``SectionVectorIndex`` keeps one L2-normalized float32 embedding per
+``MemoryIndex`` section, in a matrix whose rows are aligned with section ids,
+so a semantic query is a single matrix-vector product. With a directory the
+matrix is a ``np.memmap`` next to the keyword index and survives restarts.
+
+Each row stores the content hash it was computed from. A sync re-embeds only
+sections whose content has no vector yet; rows moved by section renumbering
+or file rewrites with unchanged paragraphs are copied, not recomputed.
+
+Also provided:
+- ``HashingEmbedder``: a dependency-free local embedder (feature hashing over
+  the CJK-aware index tokens), usable offline and in tests
+- ``reciprocal_rank_fusion``: rank-based fusion of keyword and semantic results
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from collections.abc import Hashable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from lurkbot.logging import get_logger
+
+from .embeddings import Embedder, content_hash
+from .index import IndexedSection, MemoryIndex, tokenize
+
+logger = get_logger("memory.vectors")
+
+_KEY_BYTES = 16
+
+
+class HashingEmbedder:
+    """Local embedder based on the hashing trick.
+
+    Index tokens are hashed into ``dim`` signed buckets. It captures lexical
+    overlap rather than meaning, but needs no model download and is fully
+    deterministic.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def __call__(self, texts: list[str]) -> list[np.ndarray]:
+        vectors = []
+        for text in texts:
+            vector = np.zeros(self.dim, dtype=np.float32)
+            for token in tokenize(text):
+                h = zlib.crc32(token.encode("utf-8"))
+                vector[h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+            vectors.append(vector)
+        return vectors
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]],
+    k: int = 60,
+) -> list[tuple[Hashable, float]]:
+    """Fuse ranked lists with reciprocal rank fusion.
+
+    Each item scores ``sum(1 / (k + rank))`` over the lists it appears in
+    (rank starts at 1). Scores are divided by the best attainable score, so
+    an item ranked first in every list scores 1.0.
+
+    Returns:
+        ``(item, score)`` pairs, best first
+    """
+    fused: dict[Hashable, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            fused[item] = fused.get(item, 0.0) + 1.0 / (k + rank)
+    best = len(rankings) / (k + 1) if rankings else 1.0
+    return sorted(((item, score / best) for item, score in fused.items()), key=lambda x: -x[1])
+
+
+class SectionVectorIndex:
+    """Section embedding matrix aligned with ``MemoryIndex`` section ids.
+
+    Layout in ``directory`` (when given):
+    - ``memory-vectors.json``: embedder namespace and vector dimension
+    - ``memory-vectors.keys``: 16-byte content hash per row (zeros = empty)
+    - ``memory-vectors.f32``: row-major float32 matrix of normalized vectors
+
+    Example:
+        >>> vectors = SectionVectorIndex(HashingEmbedder(), namespace="hashing-256")
+        >>> vectors.sync(index)
+        >>> vectors.search("deploy checklist", limit=5)
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        namespace: str = "default",
+        directory: str | Path | None = None,
+    ):
+        """Initialize the vector index.
+
+        Args:
+            embedder: Callable embedding a batch of texts
+            namespace: Embedder/model name; stored vectors from another embedder are discarded
+            directory: Directory for the memory-mapped matrix, or None to keep it in memory
+        """
+        self.embedder = embedder
+        self.namespace = namespace
+        self.directory = Path(directory) if directory else None
+
+        self.dim: int | None = None
+        self._matrix: np.ndarray | None = None
+        self._keys: np.ndarray | None = None  # (capacity, 16) uint8
+        self._live: np.ndarray = np.zeros(0, dtype=bool)
+        self._index: MemoryIndex | None = None
+        self._synced_version: int | None = None
+        self.embedded_count = 0  # sections embedded (not reused) since creation
+
+        if self.directory is not None:
+            self._meta_path = self.directory / "memory-vectors.json"
+            self._keys_path = self.directory / "memory-vectors.keys"
+            self._matrix_path = self.directory / "memory-vectors.f32"
+            self._load()
+
+    @property
+    def capacity(self) -> int:
+        return 0 if self._keys is None else self._keys.shape[0]
+
+    # -------------------------------------------------------------------------
+    # Sync
+    # -------------------------------------------------------------------------
+
+    def sync(self, index: MemoryIndex) -> int:
+        """Bring the matrix up to date with the keyword index.
+
+        Args:
+            index: Keyword index whose sections are embedded
+
+        Returns:
+            Number of sections embedded by this call
+        """
+        if index is self._index and index.version == self._synced_version:
+            return 0
+
+        sections = index.sections
+        wanted = {
+            section_id: content_hash(section.content, self.namespace)
+            for section_id, section in sections.items()
+        }
+
+        # Rows that already hold the vector for their section's content
+        ids = np.fromiter(wanted.keys(), dtype=np.int64, count=len(wanted))
+        current = np.zeros(len(ids), dtype=bool)
+        if self._keys is not None and len(ids):
+            want = np.frombuffer(b"".join(wanted.values()), dtype=np.uint8).reshape(-1, _KEY_BYTES)
+            in_range = ids < self.capacity
+            current[in_range] = (self._keys[ids[in_range]] == want[in_range]).all(axis=1)
+
+        # Other sections reuse a vector by content hash when some row has it
+        # (sections renumbered, paragraphs moved), otherwise they are embedded
+        reusable: dict[bytes, int] = {}
+        if self._keys is not None and not current.all():
+            for row in np.flatnonzero(self._keys.any(axis=1)):
+                reusable.setdefault(self._keys[row].tobytes(), int(row))
+
+        copies: list[tuple[int, int]] = []
+        missing: dict[bytes, list[int]] = {}
+        for section_id in ids[~current].tolist():
+            key = wanted[section_id]
+            row = reusable.get(key)
+            if row is not None:
+                copies.append((section_id, row))
+            else:
+                missing.setdefault(key, []).append(section_id)
+
+        new_vectors: list[np.ndarray] = []
+        if missing:
+            texts = [sections[section_ids[0]].content for section_ids in missing.values()]
+            new_vectors = [_normalize(v) for v in self.embedder(texts)]
+            self.embedded_count += len(new_vectors)
+            if self.dim is None:
+                self._init_storage(int(new_vectors[0].shape[0]))
+
+        if self._matrix is not None:
+            self._ensure_capacity(index.id_bound)
+            assert self._keys is not None
+            # Read every source row before writing any destination row
+            copied = [(dst, self._matrix[src].copy(), self._keys[src].copy()) for dst, src in copies]
+            for dst, vector, key in copied:
+                self._matrix[dst] = vector
+                self._keys[dst] = key
+            for (key, section_ids), vector in zip(missing.items(), new_vectors, strict=True):
+                for section_id in section_ids:
+                    self._matrix[section_id] = vector
+                    self._keys[section_id] = np.frombuffer(key, dtype=np.uint8)
+
+            self._live = np.zeros(self.capacity, dtype=bool)
+            self._live[list(sections)] = True
+            # Rows beyond the live set are stale; clear them so they are not reused wrongly
+            stale = np.flatnonzero(~self._live)
+            self._keys[stale] = 0
+            self._flush()
+
+        self._index = index
+        self._synced_version = index.version
+        if new_vectors:
+            logger.debug(f"Embedded {len(new_vectors)} memory sections ({len(copies)} reused)")
+        return len(new_vectors)
+
+    # -------------------------------------------------------------------------
+    # Search
+    # -------------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[IndexedSection, float]]:
+        """Rank synced sections by cosine similarity to the query.
+
+        Returns:
+            ``(section, cosine)`` pairs, best first
+        """
+        if self._index is None or self._matrix is None or limit <= 0 or not self._live.any():
+            return []
+
+        query_vector = _normalize(self.embedder([query])[0])
+        if query_vector.shape[0] != self.dim:
+            raise ValueError(f"Query vector has dim {query_vector.shape[0]}, expected {self.dim}")
+
+        scores = self._matrix @ query_vector
+        scores[~self._live] = -np.inf
+        live = int(self._live.sum())
+        limit = min(limit, live)
+        top = np.argpartition(scores, -limit)[-limit:]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        sections = self._index.sections
+        return [(sections[int(row)], float(scores[row])) for row in top]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get vector index statistics."""
+        return {
+            "namespace": self.namespace,
+            "dim": self.dim,
+            "rows": int(self._live.sum()),
+            "capacity": self.capacity,
+            "embedded": self.embedded_count,
+            "memory_mapped": self.directory is not None,
+        }
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if not self._meta_path.exists():
+            return
+        try:
+            meta = json.loads(self._meta_path.read_text())
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get("namespace") != self.namespace or not meta.get("dim"):
+            logger.info(f"Memory vectors at {self.directory} are for another embedder, resetting")
+            self._reset_files()
+            return
+
+        self.dim = int(meta["dim"])
+        rows = min(
+            self._keys_path.stat().st_size // _KEY_BYTES if self._keys_path.exists() else 0,
+            self._matrix_path.stat().st_size // (self.dim * 4)
+            if self._matrix_path.exists()
+            else 0,
+        )
+        self._map_files(rows)
+
+    def _init_storage(self, dim: int) -> None:
+        self.dim = dim
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._meta_path.write_text(json.dumps({"namespace": self.namespace, "dim": dim}))
+            self._map_files(0)
+        else:
+            self._matrix = np.zeros((0, dim), dtype=np.float32)
+            self._keys = np.zeros((0, _KEY_BYTES), dtype=np.uint8)
+
+    def _map_files(self, rows: int) -> None:
+        assert self.dim is not None
+        for path, row_bytes in ((self._keys_path, _KEY_BYTES), (self._matrix_path, self.dim * 4)):
+            with open(path, "ab") as f:
+                f.truncate(rows * row_bytes)
+        if rows == 0:
+            self._matrix = np.zeros((0, self.dim), dtype=np.float32)
+            self._keys = np.zeros((0, _KEY_BYTES), dtype=np.uint8)
+        else:
+            self._matrix = np.memmap(
+                self._matrix_path, dtype=np.float32, mode="r+", shape=(rows, self.dim)
+            )
+            self._keys = np.memmap(
+                self._keys_path, dtype=np.uint8, mode="r+", shape=(rows, _KEY_BYTES)
+            )
+        self._live = np.zeros(rows, dtype=bool)
+
+    def _ensure_capacity(self, rows: int) -> None:
+        if rows <= self.capacity:
+            return
+        new_capacity = max(rows, self.capacity * 2, 64)
+        if self.directory is not None:
+            self._flush()
+            self._matrix = self._keys = None
+            self._map_files(new_capacity)
+            return
+
+        assert self._matrix is not None and self._keys is not None and self.dim is not None
+        matrix = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        keys = np.zeros((new_capacity, _KEY_BYTES), dtype=np.uint8)
+        matrix[: self.capacity] = self._matrix
+        keys[: self.capacity] = self._keys
+        self._matrix, self._keys = matrix, keys
+        self._live = np.zeros(new_capacity, dtype=bool)
+
+    def _flush(self) -> None:
+        for array in (self._matrix, self._keys):
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    def _reset_files(self) -> None:
+        for path in (self._meta_path, self._keys_path, self._matrix_path):
+            path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Flush and release the memory map. The index is unusable afterwards."""
+        self._flush()
+        self._matrix = self._keys = None
+        self._live = np.zeros(0, dtype=bool)
+        self._index = None
+
+
+def _normalize(vector: Any) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm > 0 else vector
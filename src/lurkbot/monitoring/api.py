@@ -7,6 +7,8 @@ This module provides FastAPI endpoints for querying metrics and statistics.
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from lurkbot.utils.http_client import get_http_client_stats
+
 from .collector import MetricsCollector, MetricsStats, PerformanceMetrics
 from .config import MonitoringConfig
 
@@ -151,6 +153,11 @@ def create_monitoring_router(
             message=message,
         )
 
+    @router.get("/http-clients")
+    async def get_http_clients():
+        """Get per-host statistics of the shared outbound HTTP client pools."""
+        return get_http_client_stats()
+
     @router.post("/reset")
     async def reset_metrics():
         """Reset all metrics and statistics."""
@@ -10,6 +10,8 @@ from prometheus_client.core import GaugeMetricFamily
 from prometheus_client.registry import Collector
 from loguru import logger
 
+from lurkbot.utils.http_client import get_http_client_stats
+
 from .collector import MetricsCollector
 
 
@@ -107,6 +109,49 @@ class SystemMetricsCollector(Collector):
         yield uptime_gauge
 
 
+class HTTPClientMetricsCollector(Collector):
+    """
+    Custom Prometheus collector for the shared outbound HTTP client pools.
+
+    Exposes per-host request counts, latency and pool utilization from
+    ``lurkbot.utils.http_client``, labelled by base URL.
+    """
+
+    # (metric name, help text, stats key)
+    METRICS = [
+        ("lurkbot_http_client_requests_total", "Outbound HTTP requests", "requests"),
+        ("lurkbot_http_client_errors_total", "Outbound HTTP errors (5xx/transport)", "errors"),
+        ("lurkbot_http_client_in_flight", "Outbound HTTP requests in flight", "in_flight"),
+        (
+            "lurkbot_http_client_latency_avg_ms",
+            "Average time to response headers in milliseconds",
+            "avg_latency_ms",
+        ),
+        (
+            "lurkbot_http_client_latency_p95_ms",
+            "P95 time to response headers over recent requests in milliseconds",
+            "p95_latency_ms",
+        ),
+        ("lurkbot_http_client_connections", "Open pooled connections", "connections"),
+        ("lurkbot_http_client_idle_connections", "Idle pooled connections", "idle_connections"),
+        ("lurkbot_http_client_max_connections", "Connection limit per host", "max_connections"),
+        (
+            "lurkbot_http_client_pool_utilization",
+            "Active connections divided by the connection limit",
+            "utilization",
+        ),
+    ]
+
+    def collect(self):
+        """Collect metrics for Prometheus."""
+        stats = get_http_client_stats()
+        for name, documentation, key in self.METRICS:
+            gauge = GaugeMetricFamily(name, documentation, labels=["host"])
+            for host, host_stats in stats.items():
+                gauge.add_metric([host], host_stats[key])
+            yield gauge
+
+
 class PrometheusExporter:
     """
     Prometheus metrics exporter.
@@ -136,6 +181,8 @@ class PrometheusExporter:
         # Register custom collector
         self.system_collector = SystemMetricsCollector(metrics_collector)
         self.registry.register(self.system_collector)
+        self.http_client_collector = HTTPClientMetricsCollector()
+        self.registry.register(self.http_client_collector)
 
         # HTTP server state
         self._server_started = False
@@ -13,10 +13,11 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-import httpx
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from lurkbot.utils.http_client import create_http_client
+
 from .manager import PluginManager
 from .manifest import PluginManifest
 from .schema_validator import ManifestValidator
@@ -84,7 +85,7 @@ class PluginMarketplace:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self._index: PluginIndex | None = None
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._client = create_http_client(timeout=30.0)
 
     async def close(self) -> None:
         """关闭市场"""
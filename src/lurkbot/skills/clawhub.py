@@ -7,10 +7,11 @@ This module provides a client to search, download, and install skills from ClawH
 import hashlib
 from typing import Any
 
-import httpx
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from lurkbot.utils.http_client import create_http_client
+
 
 # ============================================================================
 # Data Models
@@ -75,7 +76,7 @@ class ClawHubClient:
         """
         self.api_url = api_url.rstrip("/")
         self.timeout = timeout
-        self.client = httpx.AsyncClient(
+        self.client = create_http_client(
             timeout=timeout,
             headers={
                 "User-Agent": user_agent,
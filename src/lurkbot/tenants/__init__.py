@@ -70,6 +70,11 @@ from .quota import (
     QuotaManager,
     QuotaType,
 )
+from .ratelimit import (
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    RedisRateLimitBackend,
+)
 from .storage import (
     FileTenantStorage,
     MemoryTenantStorage,
@@ -134,6 +139,7 @@ from .audit import (
     ReportStatus,
     ReportType,
     ResourceType,
+    SQLiteAuditStorage,
     configure_audit_api,
     configure_audit_logger,
     create_audit_router,
@@ -166,6 +172,10 @@ __all__ = [
     "QuotaType",
     "QuotaCheckResult",
     "QuotaCheckDetail",
+    # Rate limit
+    "RateLimitBackend",
+    "MemoryRateLimitBackend",
+    "RedisRateLimitBackend",
     # Isolation
     "TenantIsolation",
     "TenantContext",
@@ -252,6 +262,7 @@ __all__ = [
     "ReportStatus",
     "ReportType",
     "ResourceType",
+    "SQLiteAuditStorage",
     "configure_audit_api",
     "configure_audit_logger",
     "create_audit_router",
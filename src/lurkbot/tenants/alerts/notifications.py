@@ -11,10 +11,11 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any
 
-import httpx
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from lurkbot.utils.http_client import get_http_client
+
 from .models import Alert, AlertSeverity, NotificationChannel
 
 
@@ -200,15 +201,15 @@ class WebhookChannel(NotificationChannelBase):
                 "context": alert.context,
             }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method=self._config.method,
-                    url=self._config.url,
-                    json=payload,
-                    headers=self._config.headers,
-                    timeout=self._config.timeout,
-                )
-                response.raise_for_status()
+            client = get_http_client()
+            response = await client.request(
+                method=self._config.method,
+                url=self._config.url,
+                json=payload,
+                headers=self._config.headers,
+                timeout=self._config.timeout,
+            )
+            response.raise_for_status()
 
             logger.debug(f"发送 Webhook 通知: alert={alert.alert_id}")
             return True
@@ -263,18 +264,18 @@ class DingTalkChannel(NotificationChannelBase):
             # 构建消息
             message = self._build_message(alert)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self._config.webhook_url,
-                    json=message,
-                    timeout=10,
-                )
-                response.raise_for_status()
+            client = get_http_client()
+            response = await client.post(
+                self._config.webhook_url,
+                json=message,
+                timeout=10,
+            )
+            response.raise_for_status()
 
-                result = response.json()
-                if result.get("errcode") != 0:
-                    logger.error(f"钉钉返回错误: {result}")
-                    return False
+            result = response.json()
+            if result.get("errcode") != 0:
+                logger.error(f"钉钉返回错误: {result}")
+                return False
 
             logger.debug(f"发送钉钉通知: alert={alert.alert_id}")
             return True
@@ -360,18 +361,18 @@ class FeishuChannel(NotificationChannelBase):
         try:
             message = self._build_message(alert)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self._config.webhook_url,
-                    json=message,
-                    timeout=10,
-                )
-                response.raise_for_status()
+            client = get_http_client()
+            response = await client.post(
+                self._config.webhook_url,
+                json=message,
+                timeout=10,
+            )
+            response.raise_for_status()
 
-                result = response.json()
-                if result.get("code") != 0:
-                    logger.error(f"飞书返回错误: {result}")
-                    return False
+            result = response.json()
+            if result.get("code") != 0:
+                logger.error(f"飞书返回错误: {result}")
+                return False
 
             logger.debug(f"发送飞书通知: alert={alert.alert_id}")
             return True
@@ -495,18 +496,18 @@ class WeWorkChannel(NotificationChannelBase):
         try:
             message = self._build_message(alert)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self._config.webhook_url,
-                    json=message,
-                    timeout=10,
-                )
-                response.raise_for_status()
+            client = get_http_client()
+            response = await client.post(
+                self._config.webhook_url,
+                json=message,
+                timeout=10,
+            )
+            response.raise_for_status()
 
-                result = response.json()
-                if result.get("errcode") != 0:
-                    logger.error(f"企业微信返回错误: {result}")
-                    return False
+            result = response.json()
+            if result.get("errcode") != 0:
+                logger.error(f"企业微信返回错误: {result}")
+                return False
 
             logger.debug(f"发送企业微信通知: alert={alert.alert_id}")
             return True
@@ -43,6 +43,7 @@ from .reports import ReportGenerator
 from .storage import (
     AuditStorage,
     MemoryAuditStorage,
+    SQLiteAuditStorage,
 )
 
 __all__ = [
@@ -83,4 +84,5 @@ __all__ = [
     # Storage
     "AuditStorage",
     "MemoryAuditStorage",
+    "SQLiteAuditStorage",
 ]
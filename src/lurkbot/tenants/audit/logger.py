@@ -770,12 +770,11 @@ class AuditLogger:
             events = self._event_buffer.copy()
             self._event_buffer.clear()
 
-        # 批量写入
-        for event in events:
-            try:
-                await self._storage.save_event(event)
-            except Exception as e:
-                logger.error(f"保存审计事件失败: {e}")
+        # 批量写入（持久化存储在一个事务中完成）
+        try:
+            await self._storage.save_events(events)
+        except Exception as e:
+            logger.error(f"保存审计事件失败: {e}")
 
         if events:
             logger.debug(f"刷新了 {len(events)} 条审计事件")
@@ -789,12 +788,11 @@ class AuditLogger:
             evaluations = self._evaluation_buffer.copy()
             self._evaluation_buffer.clear()
 
-        # 批量写入
-        for evaluation in evaluations:
-            try:
-                await self._storage.save_policy_evaluation(evaluation)
-            except Exception as e:
-                logger.error(f"保存策略评估记录失败: {e}")
+        # 批量写入（持久化存储在一个事务中完成）
+        try:
+            await self._storage.save_policy_evaluations(evaluations)
+        except Exception as e:
+            logger.error(f"保存策略评估记录失败: {e}")
 
         if evaluations:
             logger.debug(f"刷新了 {len(evaluations)} 条策略评估记录")
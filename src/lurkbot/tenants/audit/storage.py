@@ -6,10 +6,14 @@
 from __future__ import annotations
 
 import asyncio
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from collections.abc import Callable
 from datetime import datetime, timedelta
-from typing import Any
+from pathlib import Path
+from typing import Any, TypeVar
 
 from loguru import logger
 
@@ -49,6 +53,17 @@ class AuditStorage(ABC):
         """
         pass
 
+    async def save_events(self, events: list[AuditEvent]) -> None:
+        """批量保存审计事件
+
+        默认逐条调用 save_event，持久化存储应覆盖为单个事务。
+
+        Args:
+            events: 审计事件列表
+        """
+        for event in events:
+            await self.save_event(event)
+
     @abstractmethod
     async def get_event(self, event_id: str) -> AuditEvent | None:
         """获取审计事件
@@ -129,6 +144,17 @@ class AuditStorage(ABC):
         """
         pass
 
+    async def save_policy_evaluations(self, evaluations: list[PolicyEvaluation]) -> None:
+        """批量保存策略评估记录
+
+        默认逐条调用 save_policy_evaluation，持久化存储应覆盖为单个事务。
+
+        Args:
+            evaluations: 策略评估记录列表
+        """
+        for evaluation in evaluations:
+            await self.save_policy_evaluation(evaluation)
+
     @abstractmethod
     async def get_policy_evaluation(self, evaluation_id: str) -> PolicyEvaluation | None:
         """获取策略评估记录
@@ -672,3 +698,602 @@ class MemoryAuditStorage(AuditStorage):
     def evaluation_count(self) -> int:
         """获取评估记录数量"""
         return len(self._evaluations)
+
+
+# ============================================================================
+# SQLite 审计存储
+# ============================================================================
+
+_T = TypeVar("_T")
+
+_SECONDS_PER_DAY = 86400
+
+_SEVERITY_RANK = {
+    AuditSeverity.DEBUG.value: 0,
+    AuditSeverity.INFO.value: 1,
+    AuditSeverity.WARNING.value: 2,
+    AuditSeverity.ERROR.value: 3,
+    AuditSeverity.CRITICAL.value: 4,
+}
+
+_SECURITY_EVENT_TYPES = (
+    AuditEventType.AUTH_SUCCESS.value,
+    AuditEventType.AUTH_FAILURE.value,
+    AuditEventType.ACCESS_DENIED.value,
+    AuditEventType.SUSPICIOUS_ACTIVITY.value,
+)
+
+_CONFIG_EVENT_TYPES = (
+    AuditEventType.CONFIG_CREATE.value,
+    AuditEventType.CONFIG_UPDATE.value,
+    AuditEventType.CONFIG_DELETE.value,
+)
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_events (
+    event_id TEXT PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    day INTEGER NOT NULL,
+    tenant_id TEXT,
+    user_id TEXT,
+    session_id TEXT,
+    event_type TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    severity_rank INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    resource_type TEXT,
+    resource_id TEXT,
+    resource_name TEXT,
+    action TEXT NOT NULL,
+    error_message TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_audit_events_tenant_ts ON audit_events (tenant_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_events_ts ON audit_events (timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_events_type_ts ON audit_events (event_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_events_severity_ts ON audit_events (severity, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_events_day ON audit_events (day);
+
+CREATE TABLE IF NOT EXISTS policy_evaluations (
+    evaluation_id TEXT PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    day INTEGER NOT NULL,
+    tenant_id TEXT NOT NULL,
+    user_id TEXT,
+    action TEXT NOT NULL,
+    resource_type TEXT NOT NULL,
+    result TEXT NOT NULL,
+    denial_code TEXT,
+    evaluation_time_ms REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_policy_evals_tenant_ts ON policy_evaluations (tenant_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_policy_evals_ts ON policy_evaluations (timestamp);
+CREATE INDEX IF NOT EXISTS idx_policy_evals_result_ts ON policy_evaluations (result, timestamp);
+CREATE INDEX IF NOT EXISTS idx_policy_evals_day ON policy_evaluations (day);
+
+CREATE TABLE IF NOT EXISTS policy_evaluation_matches (
+    evaluation_id TEXT NOT NULL
+        REFERENCES policy_evaluations (evaluation_id) ON DELETE CASCADE,
+    policy_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_policy_matches_eval ON policy_evaluation_matches (evaluation_id);
+CREATE INDEX IF NOT EXISTS idx_policy_matches_policy ON policy_evaluation_matches (policy_id);
+"""
+
+
+def _in_clause(column: str, values: list[Any]) -> tuple[str, list[Any]]:
+    """生成 IN 子句"""
+    placeholders = ", ".join("?" * len(values))
+    return f"{column} IN ({placeholders})", [getattr(v, "value", v) for v in values]
+
+
+class SQLiteAuditStorage(AuditStorage):
+    """SQLite 审计存储
+
+    持久化审计事件和策略评估记录（WAL 模式）：
+
+    - tenant_id、timestamp、event_type、severity 上建立索引，查询和计数在 SQL 中完成
+    - save_events / save_policy_evaluations 在一个事务中写入整批记录
+    - 统计信息通过聚合查询计算，不再把事件加载到内存
+    - 每条记录带有按天划分的 day 分区键，保留期清理按整天删除
+
+    所有数据库操作在线程池中执行，不阻塞事件循环。
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = ":memory:",
+        retention_days: int = 30,
+    ) -> None:
+        """初始化 SQLite 存储
+
+        Args:
+            db_path: 数据库文件路径，或 ":memory:"
+            retention_days: 保留天数
+        """
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._retention_days = retention_days
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        # 与 Python str.lower() 一致的大小写折叠（SQLite 内置 lower() 只处理 ASCII）
+        self._conn.create_function(
+            "py_lower", 1, lambda s: s.lower() if s else "", deterministic=True
+        )
+        self._conn.executescript(_SQLITE_SCHEMA)
+        self._conn.commit()
+
+    async def _run(self, func: Callable[[], _T]) -> _T:
+        """在线程池中持锁执行数据库操作"""
+
+        def locked() -> _T:
+            with self._lock:
+                return func()
+
+        return await asyncio.to_thread(locked)
+
+    @staticmethod
+    def _partition(timestamp: datetime) -> tuple[float, int]:
+        """时间戳与按天分区键"""
+        ts = timestamp.timestamp()
+        return ts, int(ts // _SECONDS_PER_DAY)
+
+    # -------------------------------------------------------------------------
+    # 审计事件操作
+    # -------------------------------------------------------------------------
+
+    async def save_event(self, event: AuditEvent) -> None:
+        """保存审计事件"""
+        await self.save_events([event])
+
+    async def save_events(self, events: list[AuditEvent]) -> None:
+        """在一个事务中批量保存审计事件"""
+        if not events:
+            return
+
+        rows = []
+        for event in events:
+            ts, day = self._partition(event.timestamp)
+            rows.append(
+                (
+                    event.event_id,
+                    ts,
+                    day,
+                    event.tenant_id,
+                    event.user_id,
+                    event.session_id,
+                    event.event_type.value,
+                    event.severity.value,
+                    _SEVERITY_RANK.get(event.severity.value, 0),
+                    event.result.value,
+                    event.resource_type.value if event.resource_type else None,
+                    event.resource_id,
+                    event.resource_name,
+                    event.action,
+                    event.error_message,
+                    event.model_dump_json(),
+                )
+            )
+
+        def write() -> None:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO audit_events VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+        await self._run(write)
+        logger.debug(f"保存审计事件: {len(rows)} 条")
+
+    async def get_event(self, event_id: str) -> AuditEvent | None:
+        """获取审计事件"""
+        row = await self._run(
+            lambda: self._conn.execute(
+                "SELECT data FROM audit_events WHERE event_id = ?", (event_id,)
+            ).fetchone()
+        )
+        return AuditEvent.model_validate_json(row[0]) if row else None
+
+    async def query_events(self, query: AuditQuery) -> list[AuditEvent]:
+        """查询审计事件"""
+        where, params = self._event_where(query)
+        direction = "DESC" if query.order_desc else "ASC"
+        if query.order_by == "timestamp":
+            order = f"timestamp {direction}"
+        elif query.order_by == "severity":
+            order = f"severity_rank {direction}, timestamp {direction}"
+        else:
+            order = "rowid"
+
+        sql = f"SELECT data FROM audit_events {where} ORDER BY {order} LIMIT ? OFFSET ?"
+        rows = await self._run(
+            lambda: self._conn.execute(sql, [*params, query.limit, query.offset]).fetchall()
+        )
+        return [AuditEvent.model_validate_json(row[0]) for row in rows]
+
+    async def count_events(self, query: AuditQuery) -> int:
+        """统计审计事件数量"""
+        where, params = self._event_where(query)
+        sql = f"SELECT COUNT(*) FROM audit_events {where}"
+        return await self._run(lambda: self._conn.execute(sql, params).fetchone()[0])
+
+    async def delete_events_before(self, before: datetime) -> int:
+        """删除指定时间之前的事件（先按天分区整段删除）"""
+        deleted = await self._run(lambda: self._delete_before("audit_events", before))
+        if deleted:
+            logger.info(f"删除了 {deleted} 条过期审计事件")
+        return deleted
+
+    async def get_event_stats(
+        self,
+        tenant_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> AuditStats:
+        """获取审计统计（SQL 聚合）"""
+        now = datetime.now()
+        start = start_time or (now - timedelta(days=7))
+        end = end_time or now
+        where, params = self._event_where(
+            AuditQuery(tenant_ids=[tenant_id] if tenant_id else None, start_time=start, end_time=end)
+        )
+
+        security = ", ".join("?" * len(_SECURITY_EVENT_TYPES))
+        config = ", ".join("?" * len(_CONFIG_EVENT_TYPES))
+        totals_sql = f"""
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(result = ?), 0),
+                COALESCE(SUM(result = ?), 0),
+                COALESCE(SUM(result = ?), 0),
+                COALESCE(SUM(event_type IN ({security})), 0),
+                COALESCE(SUM(event_type = ?), 0),
+                COALESCE(SUM(event_type = ?), 0),
+                COALESCE(SUM(event_type IN ({config})), 0),
+                COUNT(DISTINCT NULLIF(user_id, '')),
+                COUNT(DISTINCT NULLIF(session_id, ''))
+            FROM audit_events {where}
+        """
+        totals_params = [
+            AuditResult.SUCCESS.value,
+            AuditResult.FAILURE.value,
+            AuditResult.DENIED.value,
+            *_SECURITY_EVENT_TYPES,
+            AuditEventType.AUTH_FAILURE.value,
+            AuditEventType.ACCESS_DENIED.value,
+            *_CONFIG_EVENT_TYPES,
+            *params,
+        ]
+
+        def aggregate() -> tuple[tuple, dict[str, dict[str, int]]]:
+            totals = self._conn.execute(totals_sql, totals_params).fetchone()
+            groups = {
+                column: self._group_counts("audit_events", column, where, params)
+                for column in ("event_type", "severity", "resource_type", "result")
+            }
+            return totals, groups
+
+        totals, groups = await self._run(aggregate)
+
+        return AuditStats(
+            tenant_id=tenant_id,
+            period_start=start,
+            period_end=end,
+            total_events=totals[0],
+            success_events=totals[1],
+            failure_events=totals[2],
+            denied_events=totals[3],
+            by_event_type=groups["event_type"],
+            by_severity=groups["severity"],
+            by_resource_type=groups["resource_type"],
+            by_result=groups["result"],
+            security_events=totals[4],
+            auth_failures=totals[5],
+            access_denials=totals[6],
+            config_changes=totals[7],
+            unique_users=totals[8],
+            unique_sessions=totals[9],
+        )
+
+    def _event_where(self, query: AuditQuery) -> tuple[str, list[Any]]:
+        """构建审计事件过滤条件"""
+        clauses: list[str] = []
+        params: list[Any] = []
+
+        def add(clause: str, values: list[Any]) -> None:
+            clauses.append(clause)
+            params.extend(values)
+
+        if query.start_time:
+            add("timestamp >= ?", [query.start_time.timestamp()])
+        if query.end_time:
+            add("timestamp <= ?", [query.end_time.timestamp()])
+        for column, values in (
+            ("tenant_id", query.tenant_ids),
+            ("user_id", query.user_ids),
+            ("event_type", query.event_types),
+            ("severity", query.severities),
+            ("result", query.results),
+            ("resource_type", query.resource_types),
+            ("resource_id", query.resource_ids),
+        ):
+            if values:
+                add(*_in_clause(column, values))
+        if query.action_pattern:
+            add("instr(py_lower(action), ?) > 0", [query.action_pattern.lower()])
+        if query.keyword:
+            keyword = query.keyword.lower()
+            add(
+                "(instr(py_lower(action), ?) > 0"
+                " OR instr(py_lower(resource_name), ?) > 0"
+                " OR instr(py_lower(error_message), ?) > 0)",
+                [keyword, keyword, keyword],
+            )
+
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    # -------------------------------------------------------------------------
+    # 策略评估记录操作
+    # -------------------------------------------------------------------------
+
+    async def save_policy_evaluation(self, evaluation: PolicyEvaluation) -> None:
+        """保存策略评估记录"""
+        await self.save_policy_evaluations([evaluation])
+
+    async def save_policy_evaluations(self, evaluations: list[PolicyEvaluation]) -> None:
+        """在一个事务中批量保存策略评估记录"""
+        if not evaluations:
+            return
+
+        rows = []
+        matches = []
+        for evaluation in evaluations:
+            ts, day = self._partition(evaluation.timestamp)
+            rows.append(
+                (
+                    evaluation.evaluation_id,
+                    ts,
+                    day,
+                    evaluation.tenant_id,
+                    evaluation.user_id,
+                    evaluation.action,
+                    evaluation.resource_type,
+                    evaluation.result.value,
+                    evaluation.denial_code,
+                    evaluation.evaluation_time_ms,
+                    evaluation.model_dump_json(),
+                )
+            )
+            matches.extend(
+                (evaluation.evaluation_id, policy_id) for policy_id in evaluation.matched_policies
+            )
+
+        def write() -> None:
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM policy_evaluation_matches WHERE evaluation_id = ?",
+                    [(row[0],) for row in rows],
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO policy_evaluations VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.executemany(
+                    "INSERT INTO policy_evaluation_matches VALUES (?, ?)", matches
+                )
+
+        await self._run(write)
+        logger.debug(f"保存策略评估记录: {len(rows)} 条")
+
+    async def get_policy_evaluation(self, evaluation_id: str) -> PolicyEvaluation | None:
+        """获取策略评估记录"""
+        row = await self._run(
+            lambda: self._conn.execute(
+                "SELECT data FROM policy_evaluations WHERE evaluation_id = ?", (evaluation_id,)
+            ).fetchone()
+        )
+        return PolicyEvaluation.model_validate_json(row[0]) if row else None
+
+    async def query_policy_evaluations(
+        self,
+        query: PolicyEvaluationQuery,
+    ) -> list[PolicyEvaluation]:
+        """查询策略评估记录"""
+        where, params = self._evaluation_where(query)
+        direction = "DESC" if query.order_desc else "ASC"
+        if query.order_by == "timestamp":
+            order = f"timestamp {direction}"
+        elif query.order_by == "evaluation_time_ms":
+            order = f"evaluation_time_ms {direction}"
+        else:
+            order = "rowid"
+
+        sql = f"SELECT data FROM policy_evaluations {where} ORDER BY {order} LIMIT ? OFFSET ?"
+        rows = await self._run(
+            lambda: self._conn.execute(sql, [*params, query.limit, query.offset]).fetchall()
+        )
+        return [PolicyEvaluation.model_validate_json(row[0]) for row in rows]
+
+    async def count_policy_evaluations(self, query: PolicyEvaluationQuery) -> int:
+        """统计策略评估记录数量"""
+        where, params = self._evaluation_where(query)
+        sql = f"SELECT COUNT(*) FROM policy_evaluations {where}"
+        return await self._run(lambda: self._conn.execute(sql, params).fetchone()[0])
+
+    async def get_policy_evaluation_stats(
+        self,
+        tenant_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> PolicyEvaluationStats:
+        """获取策略评估统计（SQL 聚合）"""
+        now = datetime.now()
+        start = start_time or (now - timedelta(days=7))
+        end = end_time or now
+        where, params = self._evaluation_where(
+            PolicyEvaluationQuery(
+                tenant_ids=[tenant_id] if tenant_id else None, start_time=start, end_time=end
+            )
+        )
+
+        totals_sql = f"""
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(result = ?), 0),
+                COALESCE(SUM(result = ?), 0),
+                COALESCE(SUM(result = ?), 0),
+                AVG(NULLIF(evaluation_time_ms, 0)),
+                MAX(NULLIF(evaluation_time_ms, 0)),
+                MIN(CASE WHEN evaluation_time_ms > 0 THEN evaluation_time_ms END)
+            FROM policy_evaluations {where}
+        """
+        totals_params = [
+            PolicyEvaluationResult.ALLOW.value,
+            PolicyEvaluationResult.DENY.value,
+            PolicyEvaluationResult.NOT_APPLICABLE.value,
+            *params,
+        ]
+        denial_where = f"{where} AND" if where else "WHERE"
+        denial_sql = f"""
+            SELECT denial_code, COUNT(*) FROM policy_evaluations
+            {denial_where} result = ? AND denial_code IS NOT NULL AND denial_code != ''
+            GROUP BY denial_code
+        """
+        policy_sql = f"""
+            SELECT m.policy_id, COUNT(*) FROM policy_evaluation_matches m
+            WHERE m.evaluation_id IN (SELECT evaluation_id FROM policy_evaluations {where})
+            GROUP BY m.policy_id
+        """
+
+        def aggregate() -> tuple[tuple, dict[str, dict[str, int]]]:
+            totals = self._conn.execute(totals_sql, totals_params).fetchone()
+            groups = {
+                column: self._group_counts("policy_evaluations", column, where, params)
+                for column in ("action", "resource_type")
+            }
+            groups["denial_code"] = dict(
+                self._conn.execute(
+                    denial_sql, [*params, PolicyEvaluationResult.DENY.value]
+                ).fetchall()
+            )
+            groups["policy"] = dict(self._conn.execute(policy_sql, params).fetchall())
+            return totals, groups
+
+        totals, groups = await self._run(aggregate)
+
+        return PolicyEvaluationStats(
+            tenant_id=tenant_id,
+            period_start=start,
+            period_end=end,
+            total_evaluations=totals[0],
+            allow_count=totals[1],
+            deny_count=totals[2],
+            not_applicable_count=totals[3],
+            by_policy=groups["policy"],
+            by_action=groups["action"],
+            by_resource_type=groups["resource_type"],
+            denial_reasons=groups["denial_code"],
+            avg_evaluation_time_ms=totals[4] or 0.0,
+            max_evaluation_time_ms=totals[5] or 0.0,
+            min_evaluation_time_ms=totals[6] or 0.0,
+        )
+
+    def _evaluation_where(self, query: PolicyEvaluationQuery) -> tuple[str, list[Any]]:
+        """构建策略评估过滤条件"""
+        clauses: list[str] = []
+        params: list[Any] = []
+
+        if query.start_time:
+            clauses.append("timestamp >= ?")
+            params.append(query.start_time.timestamp())
+        if query.end_time:
+            clauses.append("timestamp <= ?")
+            params.append(query.end_time.timestamp())
+        for column, values in (
+            ("tenant_id", query.tenant_ids),
+            ("user_id", query.user_ids),
+            ("result", query.results),
+            ("action", query.actions),
+            ("resource_type", query.resource_types),
+        ):
+            if values:
+                clause, values_params = _in_clause(column, values)
+                clauses.append(clause)
+                params.extend(values_params)
+        if query.policy_ids:
+            clause, values_params = _in_clause("policy_id", query.policy_ids)
+            clauses.append(
+                f"evaluation_id IN (SELECT evaluation_id FROM policy_evaluation_matches "
+                f"WHERE {clause})"
+            )
+            params.extend(values_params)
+
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    # -------------------------------------------------------------------------
+    # 辅助方法
+    # -------------------------------------------------------------------------
+
+    def _group_counts(
+        self, table: str, column: str, where: str, params: list[Any]
+    ) -> dict[str, int]:
+        """按列分组计数（忽略 NULL）"""
+        null_filter = f"{where} AND" if where else "WHERE"
+        rows = self._conn.execute(
+            f"SELECT {column}, COUNT(*) FROM {table} {null_filter} {column} IS NOT NULL "
+            f"GROUP BY {column}",
+            params,
+        ).fetchall()
+        return dict(rows)
+
+    def _delete_before(self, table: str, before: datetime) -> int:
+        """按天分区删除：早于截止日的分区整段删除，截止日当天按时间戳删除"""
+        ts, day = self._partition(before)
+        with self._conn:
+            deleted = self._conn.execute(f"DELETE FROM {table} WHERE day < ?", (day,)).rowcount
+            deleted += self._conn.execute(
+                f"DELETE FROM {table} WHERE day = ? AND timestamp < ?", (day, ts)
+            ).rowcount
+        return deleted
+
+    async def cleanup_expired(self) -> tuple[int, int]:
+        """清理过期数据
+
+        Returns:
+            (删除的事件数, 删除的评估记录数)
+        """
+        cutoff = datetime.now() - timedelta(days=self._retention_days)
+
+        events_deleted = await self.delete_events_before(cutoff)
+        evaluations_deleted = await self._run(
+            lambda: self._delete_before("policy_evaluations", cutoff)
+        )
+        if evaluations_deleted:
+            logger.info(f"删除了 {evaluations_deleted} 条过期策略评估记录")
+
+        return events_deleted, evaluations_deleted
+
+    @property
+    def event_count(self) -> int:
+        """获取事件数量"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM audit_events").fetchone()[0]
+
+    @property
+    def evaluation_count(self) -> int:
+        """获取评估记录数量"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM policy_evaluations").fetchone()[0]
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+import math
 from enum import Enum
 from typing import Any
 
@@ -14,6 +14,7 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 from .models import Tenant, TenantQuota, TenantUsage
+from .ratelimit import MemoryRateLimitBackend, RateLimitBackend
 
 
 # ============================================================================
@@ -65,16 +66,28 @@ class QuotaManager:
     """配额管理器
 
     负责检查和追踪租户配额使用情况。
+
+    Args:
+        rate_limit_backend: API 速率计数后端（默认进程内计数，
+            多副本部署时使用 RedisRateLimitBackend 共享限额）
+        rate_window_seconds: API 速率限制窗口（秒）
     """
 
     # 警告阈值（使用率达到此值时发出警告）
     WARNING_THRESHOLD = 0.8  # 80%
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        rate_limit_backend: RateLimitBackend | None = None,
+        rate_window_seconds: int = 60,
+    ) -> None:
         # 运行时使用量追踪
         self._usage_cache: dict[str, dict[str, Any]] = {}
-        # API 调用计数器（滑动窗口）
-        self._api_counters: dict[str, list[datetime]] = {}
+        # API 调用计数器（滑动窗口计数，固定内存）
+        self._rate_limiter: RateLimitBackend = (
+            MemoryRateLimitBackend() if rate_limit_backend is None else rate_limit_backend
+        )
+        self.rate_window_seconds = rate_window_seconds
         # 并发请求计数
         self._concurrent_requests: dict[str, int] = {}
         self._lock = asyncio.Lock()
@@ -218,69 +231,56 @@ class QuotaManager:
     async def check_rate_limit(
         self,
         tenant: Tenant,
-        window_seconds: int = 60,
+        window_seconds: int | None = None,
     ) -> QuotaCheckDetail:
         """检查 API 速率限制
 
         Args:
             tenant: 租户
-            window_seconds: 时间窗口（秒）
+            window_seconds: 时间窗口（秒），默认使用 rate_window_seconds；
+                record_api_call 按 rate_window_seconds 计数，其他窗口没有记录
 
         Returns:
             配额检查详情
         """
-        async with self._lock:
-            now = datetime.now()
-            tenant_id = tenant.id
-
-            # 初始化计数器
-            if tenant_id not in self._api_counters:
-                self._api_counters[tenant_id] = []
+        window = window_seconds or self.rate_window_seconds
+        current = await self._rate_limiter.count(tenant.id, window)
+        # 滑动窗口估算值可能是小数，向下取整后作为调用次数
+        current = math.floor(current + 1e-9)
+        limit = tenant.quota.max_api_calls_per_minute
 
-            # 清理过期记录
-            cutoff = now - timedelta(seconds=window_seconds)
-            self._api_counters[tenant_id] = [
-                t for t in self._api_counters[tenant_id] if t > cutoff
-            ]
+        if limit > 0:
+            percentage = current / limit
+        else:
+            percentage = 0.0
 
-            current = len(self._api_counters[tenant_id])
-            limit = tenant.quota.max_api_calls_per_minute
+        if current >= limit:
+            result = QuotaCheckResult.EXCEEDED
+            message = f"API 速率限制已达到: {current}/{limit}/分钟"
+        elif percentage >= self.WARNING_THRESHOLD:
+            result = QuotaCheckResult.WARNING
+            message = f"API 速率接近限制: {percentage:.1%}"
+        else:
+            result = QuotaCheckResult.OK
+            message = ""
 
-            if limit > 0:
-                percentage = current / limit
-            else:
-                percentage = 0.0
+        return QuotaCheckDetail(
+            quota_type=QuotaType.API_CALLS_PER_MINUTE,
+            result=result,
+            current=current,
+            limit=limit,
+            percentage=min(percentage, 1.0),
+            message=message,
+        )
 
-            if current >= limit:
-                result = QuotaCheckResult.EXCEEDED
-                message = f"API 速率限制已达到: {current}/{limit}/分钟"
-            elif percentage >= self.WARNING_THRESHOLD:
-                result = QuotaCheckResult.WARNING
-                message = f"API 速率接近限制: {percentage:.1%}"
-            else:
-                result = QuotaCheckResult.OK
-                message = ""
-
-            return QuotaCheckDetail(
-                quota_type=QuotaType.API_CALLS_PER_MINUTE,
-                result=result,
-                current=current,
-                limit=limit,
-                percentage=min(percentage, 1.0),
-                message=message,
-            )
-
-    async def record_api_call(self, tenant_id: str) -> None:
+    async def record_api_call(self, tenant_id: str, amount: int = 1) -> None:
         """记录 API 调用
 
         Args:
             tenant_id: 租户 ID
+            amount: 调用次数
         """
-        async with self._lock:
-            if tenant_id not in self._api_counters:
-                self._api_counters[tenant_id] = []
-
-            self._api_counters[tenant_id].append(datetime.now())
+        await self._rate_limiter.hit(tenant_id, self.rate_window_seconds, amount)
 
     # ========================================================================
     # 并发请求限制
@@ -353,10 +353,8 @@ class QuotaManager:
 
         # 特殊处理 API 速率
         if quota_type == QuotaType.API_CALLS_PER_MINUTE:
-            now = datetime.now()
-            cutoff = now - timedelta(seconds=60)
-            calls = self._api_counters.get(tenant_id, [])
-            return len([t for t in calls if t > cutoff])
+            current = await self._rate_limiter.count(tenant_id, self.rate_window_seconds)
+            return math.floor(current + 1e-9)
 
         # 从缓存获取
         if tenant_id in self._usage_cache:
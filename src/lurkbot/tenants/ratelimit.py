@@ -0,0 +1,192 @@
+"""API 速率限制
+
+基于滑动窗口计数器（sliding window counter）实现固定内存的速率限制：
+每个租户只保存当前窗口和上一个窗口的调用计数，估算值为
+
+    上一窗口计数 × (1 - 当前窗口已过比例) + 当前窗口计数
+
+与逐条记录调用时间相比，内存和 CPU 开销与调用频率无关。
+
+提供两种后端：
+- MemoryRateLimitBackend: 进程内计数，使用单调时钟和分片锁
+- RedisRateLimitBackend: 基于 Redis 兼容服务的共享计数，多个 Gateway 副本共享限额
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import zlib
+from typing import Any, Protocol
+
+from loguru import logger
+
+try:
+    import redis.asyncio as aioredis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+class RateLimitBackend(Protocol):
+    """速率限制后端接口"""
+
+    async def hit(self, key: str, window_seconds: int, amount: int = 1) -> None:
+        """记录调用"""
+        ...
+
+    async def count(self, key: str, window_seconds: int) -> float:
+        """估算滑动窗口内的调用次数"""
+        ...
+
+    async def reset(self, key: str) -> None:
+        """清除计数"""
+        ...
+
+
+def _sliding_estimate(previous: int, current: int, elapsed_fraction: float) -> float:
+    """根据相邻两个固定窗口的计数估算滑动窗口计数"""
+    return previous * (1.0 - elapsed_fraction) + current
+
+
+class _WindowCounter:
+    """单个 key 的双窗口计数器"""
+
+    __slots__ = ("window_seconds", "window_start", "current", "previous")
+
+    def __init__(self, window_seconds: int, now: float):
+        self.window_seconds = window_seconds
+        self.window_start = now
+        self.current = 0
+        self.previous = 0
+
+    def advance(self, now: float) -> None:
+        """滚动到 now 所在的窗口"""
+        elapsed_windows = int((now - self.window_start) // self.window_seconds)
+        if elapsed_windows <= 0:
+            return
+        self.previous = self.current if elapsed_windows == 1 else 0
+        self.current = 0
+        self.window_start += elapsed_windows * self.window_seconds
+
+    def estimate(self, now: float) -> float:
+        self.advance(now)
+        fraction = (now - self.window_start) / self.window_seconds
+        return _sliding_estimate(self.previous, self.current, fraction)
+
+
+class MemoryRateLimitBackend:
+    """进程内滑动窗口计数后端
+
+    每个 (key, window) 只占用一个固定大小的计数器；
+    key 按哈希分布到 shards 个锁上，不同租户之间不会争用同一把锁。
+
+    Args:
+        shards: 锁分片数
+        clock: 单调时钟函数（测试时可替换）
+    """
+
+    def __init__(self, shards: int = 64, clock: Any = time.monotonic):
+        self._shards = shards
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._counters: list[dict[tuple[str, int], _WindowCounter]] = [
+            {} for _ in range(shards)
+        ]
+        self._clock = clock
+
+    def _shard(self, key: str) -> int:
+        return zlib.crc32(key.encode()) % self._shards
+
+    async def hit(self, key: str, window_seconds: int, amount: int = 1) -> None:
+        """记录调用"""
+        shard = self._shard(key)
+        now = self._clock()
+        with self._locks[shard]:
+            counters = self._counters[shard]
+            counter = counters.get((key, window_seconds))
+            if counter is None:
+                counter = counters[(key, window_seconds)] = _WindowCounter(window_seconds, now)
+            counter.advance(now)
+            counter.current += amount
+
+    async def count(self, key: str, window_seconds: int) -> float:
+        """估算滑动窗口内的调用次数"""
+        shard = self._shard(key)
+        with self._locks[shard]:
+            counter = self._counters[shard].get((key, window_seconds))
+            if counter is None:
+                return 0.0
+            return counter.estimate(self._clock())
+
+    async def reset(self, key: str) -> None:
+        """清除 key 的所有窗口计数"""
+        shard = self._shard(key)
+        with self._locks[shard]:
+            counters = self._counters[shard]
+            for counter_key in [k for k in counters if k[0] == key]:
+                del counters[counter_key]
+
+    def __len__(self) -> int:
+        return sum(len(counters) for counters in self._counters)
+
+
+class RedisRateLimitBackend:
+    """Redis 兼容的共享滑动窗口计数后端
+
+    每个窗口一个计数 key（``{prefix}{key}:{window}:{index}``），INCRBY 计数，
+    过期时间为两个窗口。窗口编号使用墙上时钟，以便多个副本对齐。
+    可传入任何实现 pipeline/incrby/expire/mget/delete 的异步客户端
+    （redis-py、valkey 等）。
+
+    Args:
+        client: 异步 Redis 客户端，None 时按 url 创建
+        url: Redis 连接 URL
+        prefix: key 前缀
+        clock: 墙上时钟函数（测试时可替换）
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        url: str = "redis://localhost:6379",
+        prefix: str = "lurkbot:ratelimit:",
+        clock: Any = time.time,
+    ):
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise ImportError("redis-py is not installed")
+            client = aioredis.Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+        self._clock = clock
+
+    def _key(self, key: str, window_seconds: int, index: int) -> str:
+        return f"{self.prefix}{key}:{window_seconds}:{index}"
+
+    async def hit(self, key: str, window_seconds: int, amount: int = 1) -> None:
+        """记录调用"""
+        index = int(self._clock() // window_seconds)
+        redis_key = self._key(key, window_seconds, index)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.incrby(redis_key, amount)
+            pipe.expire(redis_key, window_seconds * 2)
+            await pipe.execute()
+
+    async def count(self, key: str, window_seconds: int) -> float:
+        """估算滑动窗口内的调用次数"""
+        now = self._clock()
+        index = int(now // window_seconds)
+        current, previous = await self.client.mget(
+            self._key(key, window_seconds, index),
+            self._key(key, window_seconds, index - 1),
+        )
+        fraction = (now - index * window_seconds) / window_seconds
+        return _sliding_estimate(int(previous or 0), int(current or 0), fraction)
+
+    async def reset(self, key: str) -> None:
+        """清除 key 的计数（扫描匹配的窗口 key）"""
+        keys = [k async for k in self.client.scan_iter(match=f"{self.prefix}{key}:*")]
+        if keys:
+            await self.client.delete(*keys)
+            logger.debug(f"清除速率计数: key={key}, count={len(keys)}")
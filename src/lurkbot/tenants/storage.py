@@ -7,14 +7,19 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import shutil
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
+from urllib.parse import quote
 
 from loguru import logger
 from pydantic import BaseModel
 
+from lurkbot.utils import json_utils
+
 from .models import (
     Tenant,
     TenantConfig,
@@ -26,6 +31,8 @@ from .models import (
     TenantUsage,
 )
 
+_M = TypeVar("_M", bound=BaseModel)
+
 
 # ============================================================================
 # 存储接口
@@ -483,33 +490,153 @@ class MemoryTenantStorage(TenantStorage):
 # ============================================================================
 
 
+class _AppendLog:
+    """单个租户的一类记录（使用统计或事件）的追加日志
+
+    目录布局：
+    - ``snapshot.<G>.json``: 第 G 代快照（记录数组）
+    - ``log.<G>.jsonl``: 第 G 代快照之后追加的记录，每行一条
+
+    压缩时写入 ``snapshot.<G+1>.json`` 后再删除第 G 代文件，
+    中途崩溃时加载器只认最新一代，不会重复或丢失记录。
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.lock = asyncio.Lock()
+        self.items: list[Any] | None = None  # 已加载的记录（懒加载）
+        self.log_bytes = 0
+        self._generation: int | None = None
+        self._handle: Any = None
+
+    @property
+    def generation(self) -> int:
+        """当前代数（首次访问时从目录中发现）"""
+        if self._generation is None:
+            generations = [
+                int(path.stem.split(".", 1)[1])
+                for path in self.directory.glob("snapshot.*.json")
+                if path.stem.split(".", 1)[1].isdigit()
+            ]
+            self._generation = max(generations, default=0)
+        return self._generation
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.directory / f"snapshot.{self.generation}.json"
+
+    @property
+    def log_path(self) -> Path:
+        return self.directory / f"log.{self.generation}.jsonl"
+
+    def append(self, line: bytes) -> None:
+        """追加一行（无缓冲写入，立即对其他读者可见；fsync 由调用方批量进行）"""
+        if self._handle is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.log_path, "ab", buffering=0)
+            self.log_bytes = self._handle.tell()
+        self._handle.write(line)
+        self.log_bytes += len(line)
+
+    def read_raw(self) -> list[dict[str, Any]]:
+        """读取快照和日志中的原始记录（不做模型校验）"""
+        items: list[dict[str, Any]] = []
+        if self.snapshot_path.exists():
+            items.extend(json_utils.loads(self.snapshot_path.read_bytes()))
+        if self.log_path.exists():
+            data = self.log_path.read_bytes()
+            self.log_bytes = len(data)
+            for line in data.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    items.append(json_utils.loads(line))
+                except json_utils.JSONDecodeError:
+                    # 崩溃时可能留下不完整的末行
+                    logger.warning(f"跳过损坏的日志行: {self.log_path}")
+        return items
+
+    def compact(self, items: list[dict[str, Any]] | None = None) -> None:
+        """将快照和日志合并为下一代快照"""
+        if items is None:
+            items = self.read_raw()
+        old_snapshot, old_log = self.snapshot_path, self.log_path
+
+        self.fsync()
+        self.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        next_generation = self.generation + 1
+        target = self.directory / f"snapshot.{next_generation}.json"
+        tmp = target.with_suffix(".json.tmp")
+        with open(tmp, "wb") as f:
+            f.write(json_utils.dumps_bytes(items))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, target)
+
+        self._generation = next_generation
+        self.log_bytes = 0
+        old_snapshot.unlink(missing_ok=True)
+        old_log.unlink(missing_ok=True)
+
+    def fsync(self) -> None:
+        if self._handle is not None:
+            os.fsync(self._handle.fileno())
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
 class FileTenantStorage(TenantStorage):
     """文件租户存储
 
-    将租户数据持久化到 JSON 文件。
+    租户数据保存在 ``tenants.json``；使用统计和事件按租户写入
+    ``usage/<tenant>/``、``events/<tenant>/`` 下的 JSON-lines 追加日志：
+
+    - 每次记录只追加一行，不再重写整个文件
+    - fsync 按 fsync_interval 批量进行（0 表示每次写入都 fsync）
+    - 日志超过 compact_threshold_bytes 时在线程池中压缩为快照
+    - 启动只加载租户列表，某个租户的统计/事件在首次查询时才加载和校验
+
+    旧版 ``usage.json`` / ``events.json`` 会在首次加载时按租户迁移为快照。
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        fsync_interval: float = 1.0,
+        compact_threshold_bytes: int = 1024 * 1024,
+    ):
         """初始化文件存储
 
         Args:
             data_dir: 数据目录
+            fsync_interval: 批量 fsync 间隔（秒），0 表示每次写入立即 fsync
+            compact_threshold_bytes: 日志超过该大小时压缩为快照
         """
         self.data_dir = data_dir
+        self.fsync_interval = fsync_interval
+        self.compact_threshold_bytes = compact_threshold_bytes
         self._tenants_file = data_dir / "tenants.json"
-        self._usage_file = data_dir / "usage.json"
-        self._events_file = data_dir / "events.json"
+        self._usage_dir = data_dir / "usage"
+        self._events_dir = data_dir / "events"
         self._lock = asyncio.Lock()
 
         # 内存缓存
         self._tenants: dict[str, Tenant] = {}
         self._tenants_by_name: dict[str, str] = {}
-        self._usage: dict[str, list[TenantUsage]] = {}
-        self._events: dict[str, list[TenantEvent]] = {}
+        self._usage: dict[str, _AppendLog] = {}
+        self._events: dict[str, _AppendLog] = {}
         self._loaded = False
 
+        # 批量 fsync
+        self._dirty: set[_AppendLog] = set()
+        self._fsync_task: asyncio.Task | None = None
+
     async def _ensure_loaded(self) -> None:
-        """确保数据已加载"""
+        """确保租户数据已加载（使用统计和事件按租户懒加载）"""
         if self._loaded:
             return
 
@@ -528,47 +655,104 @@ class FileTenantStorage(TenantStorage):
                         self._tenants[tenant.id] = tenant
                         self._tenants_by_name[tenant.name] = tenant.id
 
-            # 加载使用统计
-            if self._usage_file.exists():
-                with open(self._usage_file) as f:
-                    data = json.load(f)
-                    for tenant_id, usages in data.items():
-                        self._usage[tenant_id] = [TenantUsage.model_validate(u) for u in usages]
-
-            # 加载事件
-            if self._events_file.exists():
-                with open(self._events_file) as f:
-                    data = json.load(f)
-                    for tenant_id, events in data.items():
-                        self._events[tenant_id] = [TenantEvent.model_validate(e) for e in events]
+            await asyncio.to_thread(self._migrate_legacy_files)
 
             self._loaded = True
             logger.debug(f"加载租户数据: {len(self._tenants)} 个租户")
 
+    def _migrate_legacy_files(self) -> None:
+        """将旧版整文件格式迁移为按租户的快照（不做模型校验）"""
+        for legacy_file, kind in (
+            (self.data_dir / "usage.json", "usage"),
+            (self.data_dir / "events.json", "events"),
+        ):
+            if not legacy_file.exists():
+                continue
+            data = json_utils.loads(legacy_file.read_bytes())
+            for tenant_id, items in data.items():
+                self._log(kind, tenant_id).compact(items)
+            legacy_file.rename(legacy_file.with_name(legacy_file.name + ".migrated"))
+            logger.info(f"迁移旧版 {legacy_file.name}: {len(data)} 个租户")
+
+    def _log(self, kind: str, tenant_id: str) -> _AppendLog:
+        """获取租户的追加日志"""
+        logs = self._usage if kind == "usage" else self._events
+        log = logs.get(tenant_id)
+        if log is None:
+            base = self._usage_dir if kind == "usage" else self._events_dir
+            log = logs[tenant_id] = _AppendLog(base / quote(tenant_id, safe=""))
+        return log
+
+    async def _load_items(self, log: _AppendLog, model: type[_M]) -> list[_M]:
+        """懒加载并校验某个租户的记录（调用方持有 log.lock）"""
+        if log.items is None:
+            log.items = await asyncio.to_thread(
+                lambda: [model.model_validate(item) for item in log.read_raw()]
+            )
+        return log.items
+
+    async def _append(self, log: _AppendLog, record: BaseModel) -> None:
+        """追加一条记录（调用方持有 log.lock）"""
+        log.append(record.model_dump_json().encode("utf-8") + b"\n")
+        if log.items is not None:
+            log.items.append(record)
+
+        if log.log_bytes >= self.compact_threshold_bytes:
+            await asyncio.to_thread(log.compact)
+            self._dirty.discard(log)
+        elif self.fsync_interval <= 0:
+            await asyncio.to_thread(log.fsync)
+        else:
+            self._dirty.add(log)
+            if self._fsync_task is None or self._fsync_task.done():
+                self._fsync_task = asyncio.create_task(self._fsync_loop())
+
+    async def _fsync_loop(self) -> None:
+        """批量 fsync，直到没有待同步的日志"""
+        while self._dirty:
+            await asyncio.sleep(self.fsync_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """立即 fsync 所有已追加的记录"""
+        dirty, self._dirty = self._dirty, set()
+        if dirty:
+            await asyncio.to_thread(lambda: [log.fsync() for log in dirty])
+
+    async def compact(self, tenant_id: str | None = None) -> None:
+        """将日志压缩为快照
+
+        Args:
+            tenant_id: 只压缩该租户（None 表示全部已打开的日志）
+        """
+        logs = [
+            log
+            for logs in (self._usage, self._events)
+            for tid, log in list(logs.items())
+            if tenant_id is None or tid == tenant_id
+        ]
+        for log in logs:
+            async with log.lock:
+                if log.log_bytes or log.log_path.exists():
+                    await asyncio.to_thread(log.compact)
+                    self._dirty.discard(log)
+
+    async def close(self) -> None:
+        """同步并关闭所有日志文件"""
+        if self._fsync_task is not None:
+            self._fsync_task.cancel()
+            self._fsync_task = None
+        await self.flush()
+        for logs in (self._usage, self._events):
+            for log in logs.values():
+                log.close()
+
     async def _save_tenants(self) -> None:
         """保存租户数据"""
         data = [t.model_dump(mode="json") for t in self._tenants.values()]
         with open(self._tenants_file, "w") as f:
             json.dump(data, f, indent=2, ensure_ascii=False, default=str)
 
-    async def _save_usage(self) -> None:
-        """保存使用统计"""
-        data = {
-            tid: [u.model_dump(mode="json") for u in usages]
-            for tid, usages in self._usage.items()
-        }
-        with open(self._usage_file, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-
-    async def _save_events(self) -> None:
-        """保存事件"""
-        data = {
-            tid: [e.model_dump(mode="json") for e in events]
-            for tid, events in self._events.items()
-        }
-        with open(self._events_file, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-
     async def create(self, tenant: Tenant) -> Tenant:
         await self._ensure_loaded()
 
@@ -580,8 +764,6 @@ class FileTenantStorage(TenantStorage):
 
             self._tenants[tenant.id] = tenant
             self._tenants_by_name[tenant.name] = tenant.id
-            self._usage[tenant.id] = []
-            self._events[tenant.id] = []
 
             await self._save_tenants()
 
@@ -633,14 +815,8 @@ class FileTenantStorage(TenantStorage):
             del self._tenants_by_name[tenant.name]
             del self._tenants[tenant_id]
 
-            if tenant_id in self._usage:
-                del self._usage[tenant_id]
-            if tenant_id in self._events:
-                del self._events[tenant_id]
-
             await self._save_tenants()
-            await self._save_usage()
-            await self._save_events()
+            await self._remove_logs(tenant_id)
 
             logger.debug(f"删除租户: {tenant_id}")
             return True
@@ -722,6 +898,16 @@ class FileTenantStorage(TenantStorage):
             await self._save_tenants()
             return True
 
+    async def _remove_logs(self, tenant_id: str) -> None:
+        """删除租户的使用统计和事件日志"""
+        for kind, logs in (("usage", self._usage), ("events", self._events)):
+            log = self._log(kind, tenant_id)
+            del logs[tenant_id]
+            async with log.lock:
+                log.close()
+                self._dirty.discard(log)
+                await asyncio.to_thread(shutil.rmtree, log.directory, True)
+
     async def get_usage(
         self,
         tenant_id: str,
@@ -731,7 +917,9 @@ class FileTenantStorage(TenantStorage):
     ) -> list[TenantUsage]:
         await self._ensure_loaded()
 
-        usages = self._usage.get(tenant_id, [])
+        log = self._log("usage", tenant_id)
+        async with log.lock:
+            usages = await self._load_items(log, TenantUsage)
         filtered = [u for u in usages if u.period == period]
 
         if start_date:
@@ -744,24 +932,18 @@ class FileTenantStorage(TenantStorage):
     async def record_usage(self, usage: TenantUsage) -> bool:
         await self._ensure_loaded()
 
-        async with self._lock:
-            if usage.tenant_id not in self._usage:
-                self._usage[usage.tenant_id] = []
-
-            self._usage[usage.tenant_id].append(usage)
-            await self._save_usage()
-            return True
+        log = self._log("usage", usage.tenant_id)
+        async with log.lock:
+            await self._append(log, usage)
+        return True
 
     async def record_event(self, event: TenantEvent) -> bool:
         await self._ensure_loaded()
 
-        async with self._lock:
-            if event.tenant_id not in self._events:
-                self._events[event.tenant_id] = []
-
-            self._events[event.tenant_id].append(event)
-            await self._save_events()
-            return True
+        log = self._log("events", event.tenant_id)
+        async with log.lock:
+            await self._append(log, event)
+        return True
 
     async def get_events(
         self,
@@ -772,10 +954,12 @@ class FileTenantStorage(TenantStorage):
     ) -> list[TenantEvent]:
         await self._ensure_loaded()
 
-        events = self._events.get(tenant_id, [])
+        log = self._log("events", tenant_id)
+        async with log.lock:
+            events = await self._load_items(log, TenantEvent)
 
         if event_type:
             events = [e for e in events if e.event_type == event_type]
 
-        events.sort(key=lambda e: e.timestamp, reverse=True)
+        events = sorted(events, key=lambda e: e.timestamp, reverse=True)
         return events[offset : offset + limit]
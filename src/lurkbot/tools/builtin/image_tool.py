@@ -396,12 +396,12 @@ async def _get_image_data(params: ImageParams) -> bytes | ToolResult:
 
     if params.url:
         try:
-            import httpx
+            from lurkbot.utils.http_client import get_http_client
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(params.url, timeout=30.0)
-                response.raise_for_status()
-                return response.content
+            client = get_http_client()
+            response = await client.get(params.url, timeout=30.0)
+            response.raise_for_status()
+            return response.content
         except ImportError:
             return error_result("httpx not installed. Install with: pip install httpx")
         except Exception as e:
@@ -9,6 +9,7 @@ These are P1 tools that provide:
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 from dataclasses import dataclass, field
@@ -17,6 +18,15 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
+from lurkbot.memory import (
+    Embedder,
+    EmbeddingCache,
+    HashingEmbedder,
+    IndexedSection,
+    MemoryIndex,
+    SectionVectorIndex,
+    reciprocal_rank_fusion,
+)
 from lurkbot.tools.builtin.common import (
     ToolResult,
     error_result,
@@ -33,6 +43,10 @@ from lurkbot.tools.builtin.common import (
 DEFAULT_MAX_RESULTS = 10
 DEFAULT_MIN_SCORE = 0.0
 DEFAULT_MAX_LINES = 100
+MEMORY_INDEX_FILENAME = "memory-index.json"
+DEFAULT_OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+# BM25 candidates re-ranked for exact phrase matches
+KEYWORD_CANDIDATES = 50
 MEMORY_FILE_PATTERN = re.compile(r"^MEMORY\.md$|^memory/.*\.md$", re.IGNORECASE)
 
 
@@ -60,22 +74,70 @@ class MemorySearchConfig:
     root_dir: str | None = None
     max_results: int = DEFAULT_MAX_RESULTS
     min_score: float = DEFAULT_MIN_SCORE
-    # Embedding provider for semantic search
-    provider: Literal["openai", "local", "keyword"] = "keyword"
+    # Embedding provider for semantic search; anything but "keyword" enables
+    # hybrid search (BM25 + embeddings fused with reciprocal rank fusion)
+    provider: Literal["openai", "local", "hashing", "keyword"] = "keyword"
     model: str | None = None
     api_key: str | None = None
+    # Keyword index persistence (default: <root>/.lurkbot/memory-index.json);
+    # section embeddings are memory-mapped next to it
+    persist_index: bool = True
+    index_path: str | None = None
+    # Reciprocal rank fusion constant
+    rrf_k: int = 60
+
+
+def create_embedder(config: MemorySearchConfig) -> Embedder:
+    """Create the embedder for a configured provider.
+
+    - openai: OpenAI embeddings API (``model`` defaults to text-embedding-3-small)
+    - local: all-MiniLM-L6-v2 through ONNX Runtime (ChromaDB's default function)
+    - hashing: dependency-free hashing embedder, works offline
+    """
+    if config.provider == "openai":
+        from openai import OpenAI
+
+        client = OpenAI(api_key=config.api_key)
+        model = config.model or DEFAULT_OPENAI_EMBEDDING_MODEL
+
+        def embed(texts: list[str]) -> list[list[float]]:
+            response = client.embeddings.create(model=model, input=texts)
+            return [item.embedding for item in response.data]
+
+        return embed
+
+    if config.provider == "local":
+        from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+
+        return DefaultEmbeddingFunction()
+
+    if config.provider == "hashing":
+        return HashingEmbedder()
+
+    raise ValueError(f"Provider {config.provider!r} does not support embeddings")
 
 
 class MemoryManager:
     """Manager for memory file operations.
 
-    This is a framework implementation using keyword-based search.
-    For production semantic search, integrate with an embedding provider.
+    Keyword search runs against a persistent BM25 index of memory sections
+    (see ``lurkbot.memory.index``). With an embedding provider (or an explicit
+    ``embedder``) search is hybrid: section embeddings are kept in a
+    memory-mapped matrix, scored by cosine similarity, and fused with the
+    keyword ranking by reciprocal rank fusion.
     """
 
-    def __init__(self, config: MemorySearchConfig) -> None:
+    def __init__(self, config: MemorySearchConfig, embedder: Embedder | None = None) -> None:
         self.config = config
-        self._files_cache: dict[str, list[str]] | None = None
+        self._embedder = embedder
+        self._index: MemoryIndex | None = None
+        self._vectors: SectionVectorIndex | None = None
+        self._search_lock = asyncio.Lock()
+
+    @property
+    def hybrid(self) -> bool:
+        """Whether search combines keyword and semantic rankings."""
+        return self._embedder is not None or self.config.provider != "keyword"
 
     def _get_memory_root(self) -> Path:
         """Get the root directory for memory files."""
@@ -93,105 +155,118 @@ class MemoryManager:
         if memory_md.exists() and memory_md.is_file():
             files.append(memory_md)
 
-        # Check memory/ directory
+        # Check memory/ directory (os.walk is much cheaper than Path.glob,
+        # and this runs before every search to refresh the index)
         memory_dir = root / "memory"
-        if memory_dir.exists() and memory_dir.is_dir():
-            for f in memory_dir.glob("**/*.md"):
-                if f.is_file():
-                    files.append(f)
+        if memory_dir.is_dir():
+            for dirpath, _, filenames in os.walk(memory_dir):
+                for name in filenames:
+                    if name.lower().endswith(".md"):
+                        files.append(Path(dirpath, name))
 
         return files
 
-    def _read_file_lines(self, path: Path) -> list[str]:
-        """Read file and return lines."""
-        try:
-            return path.read_text(encoding="utf-8").splitlines()
-        except Exception:
-            return []
+    def _get_index_path(self) -> Path | None:
+        """Get where the keyword index is persisted, or None to keep it in memory."""
+        if self.config.index_path:
+            return Path(self.config.index_path)
+        if self.config.persist_index:
+            return self._get_memory_root() / ".lurkbot" / MEMORY_INDEX_FILENAME
+        return None
+
+    def _get_index(self) -> MemoryIndex:
+        """Get the keyword index, loading the persisted copy on first use."""
+        if self._index is None:
+            self._index = MemoryIndex(self._get_memory_root(), index_path=self._get_index_path())
+        return self._index
+
+    def _get_vectors(self) -> SectionVectorIndex:
+        """Get the section embedding index, mapping the persisted matrix on first use."""
+        if self._vectors is None:
+            embedder = self._embedder or create_embedder(self.config)
+            namespace = f"{self.config.provider}:{self.config.model or 'default'}"
+            # The cache deduplicates batches and serves repeated queries
+            cache = EmbeddingCache(embedder, namespace=namespace)
+            index_path = self._get_index_path()
+            self._vectors = SectionVectorIndex(
+                cache.embed,
+                namespace=namespace,
+                directory=index_path.parent if index_path else None,
+            )
+        return self._vectors
 
     def _keyword_search(
         self,
         query: str,
         max_results: int,
     ) -> list[MemorySearchResult]:
-        """Perform keyword-based search.
+        """Perform keyword search over the BM25 index.
 
-        This is a simple implementation. For better results,
-        use embedding-based semantic search.
+        The index is refreshed first; only files whose mtime or size changed
+        are re-read. Sections containing the exact query phrase score 1.0,
+        other matches are ranked by BM25 and scaled into (0, 0.8].
         """
-        results: list[MemorySearchResult] = []
-        root = self._get_memory_root()
+        index = self._get_index()
+        index.refresh(self._find_memory_files())
+
         query_lower = query.lower()
-        query_words = set(query_lower.split())
-
-        for file_path in self._find_memory_files():
-            lines = self._read_file_lines(file_path)
-            if not lines:
-                continue
-
-            rel_path = str(file_path.relative_to(root))
-
-            # Score each section (paragraphs separated by blank lines)
-            current_section_start = 0
-            current_section_lines: list[str] = []
-
-            for i, line in enumerate(lines):
-                if line.strip():
-                    if not current_section_lines:
-                        current_section_start = i
-                    current_section_lines.append(line)
-                else:
-                    if current_section_lines:
-                        # Score this section
-                        section_text = "\n".join(current_section_lines)
-                        score = self._compute_keyword_score(section_text, query_lower, query_words)
-                        if score > 0:
-                            results.append(MemorySearchResult(
-                                path=rel_path,
-                                content=section_text,
-                                score=score,
-                                line_start=current_section_start + 1,
-                                line_end=i,
-                            ))
-                        current_section_lines = []
-
-            # Don't forget the last section
-            if current_section_lines:
-                section_text = "\n".join(current_section_lines)
-                score = self._compute_keyword_score(section_text, query_lower, query_words)
-                if score > 0:
-                    results.append(MemorySearchResult(
-                        path=rel_path,
-                        content=section_text,
-                        score=score,
-                        line_start=current_section_start + 1,
-                        line_end=len(lines),
-                    ))
-
-        # Sort by score descending and limit results
+        results: list[MemorySearchResult] = []
+        for section, bm25_score in index.search(query, max(max_results, KEYWORD_CANDIDATES)):
+            phrase_match = query_lower in section.content.lower()
+            results.append(MemorySearchResult(
+                path=section.path,
+                content=section.content,
+                score=1.0 if phrase_match else bm25_score * 0.8,
+                line_start=section.line_start,
+                line_end=section.line_end,
+            ))
+
         results.sort(key=lambda r: r.score, reverse=True)
         return results[:max_results]
 
-    def _compute_keyword_score(
+    async def _hybrid_search(
         self,
-        text: str,
-        query_lower: str,
-        query_words: set[str],
-    ) -> float:
-        """Compute keyword match score."""
-        text_lower = text.lower()
-
-        # Exact phrase match gives highest score
-        if query_lower in text_lower:
-            return 1.0
-
-        # Word overlap score
-        text_words = set(text_lower.split())
-        overlap = len(query_words & text_words)
-        if overlap == 0:
-            return 0.0
+        query: str,
+        max_results: int,
+    ) -> list[MemorySearchResult]:
+        """Fuse BM25 and embedding rankings with reciprocal rank fusion.
 
-        return overlap / len(query_words) * 0.8
+        Embeddings are computed only for new or changed sections; syncing and
+        scoring run in a worker thread since embedders may block.
+        """
+        index = self._get_index()
+        index.refresh(self._find_memory_files())
+        candidates = max(max_results, KEYWORD_CANDIDATES)
+        keyword_hits = index.search(query, candidates)
+
+        vectors = self._get_vectors()
+
+        def semantic_search() -> list[tuple[IndexedSection, float]]:
+            vectors.sync(index)
+            return [hit for hit in vectors.search(query, candidates) if hit[1] > 0]
+
+        semantic_hits = await asyncio.to_thread(semantic_search)
+
+        sections: dict[tuple[str, int], IndexedSection] = {}
+        rankings: list[list[tuple[str, int]]] = []
+        for hits in (keyword_hits, semantic_hits):
+            ranking = []
+            for section, _ in hits:
+                key = (section.path, section.line_start)
+                sections[key] = section
+                ranking.append(key)
+            rankings.append(ranking)
+
+        return [
+            MemorySearchResult(
+                path=sections[key].path,
+                content=sections[key].content,
+                score=score,
+                line_start=sections[key].line_start,
+                line_end=sections[key].line_end,
+            )
+            for key, score in reciprocal_rank_fusion(rankings, k=self.config.rrf_k)[:max_results]
+        ]
 
     async def search(
         self,
@@ -212,9 +287,11 @@ class MemoryManager:
         max_results = max_results or self.config.max_results
         min_score = min_score if min_score is not None else self.config.min_score
 
-        # Use keyword search by default
-        # TODO: Implement embedding-based search for semantic matching
-        results = self._keyword_search(query, max_results * 2)
+        async with self._search_lock:
+            if self.hybrid:
+                results = await self._hybrid_search(query, max_results * 2)
+            else:
+                results = self._keyword_search(query, max_results * 2)
 
         # Filter by min_score
         filtered = [r for r in results if r.score >= min_score]
@@ -313,6 +390,7 @@ class MemoryManager:
             "provider": self.config.provider,
             "model": self.config.model,
             "enabled": self.config.enabled,
+            "mode": "hybrid" if self.hybrid else "keyword",
         }
 
 
@@ -326,7 +404,8 @@ _memory_manager: MemoryManager | None = None
 def get_memory_manager(config: MemorySearchConfig | None = None) -> MemoryManager:
     """Get or create the memory manager instance."""
     global _memory_manager
-    if _memory_manager is None or config is not None:
+    # Reuse the manager (and its loaded index) while the configuration is unchanged
+    if _memory_manager is None or (config is not None and config != _memory_manager.config):
         _memory_manager = MemoryManager(config or MemorySearchConfig())
     return _memory_manager
 
@@ -14,8 +14,11 @@ import hashlib
 import html
 import re
 import time
-from dataclasses import dataclass, field
-from typing import Any, Literal
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Literal, TypeVar
 from urllib.parse import urljoin, urlparse
 
 import httpx
@@ -28,6 +31,8 @@ from lurkbot.tools.builtin.common import (
     read_number_param,
     read_string_param,
 )
+from lurkbot.utils import json_utils
+from lurkbot.utils.http_client import create_http_client
 
 
 # =============================================================================
@@ -44,22 +49,253 @@ DEFAULT_USER_AGENT = (
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
 )
 
+T = TypeVar("T")
+
 
 # =============================================================================
 # Cache
 # =============================================================================
 
+DEFAULT_FETCH_CACHE_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_SEARCH_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
 
 @dataclass
 class CacheEntry:
-    """Cache entry with TTL."""
+    """Cache entry with TTL and HTTP validators for revalidation."""
 
     data: Any
     expires_at: float
+    size: int = 0
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+    @property
+    def revalidatable(self) -> bool:
+        """Whether a stale entry can be revalidated with a conditional request."""
+        return bool(self.etag or self.last_modified)
+
+
+class WebCache:
+    """Byte-budgeted LRU cache for web tool results.
+
+    - Entries are evicted least-recently-used first once their serialized
+      size exceeds ``max_bytes``.
+    - Stale entries that carry an ETag or Last-Modified validator are kept
+      (until evicted) so the next fetch can revalidate them with a
+      conditional request; other stale entries are dropped on access.
+    - With ``disk_dir`` set, entries are also written as JSON files there
+      (bounded by ``disk_max_bytes``) and survive restarts.
+    """
 
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_FETCH_CACHE_MAX_BYTES,
+        disk_dir: str | Path | None = None,
+        disk_max_bytes: int | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes if disk_max_bytes is not None else max_bytes * 4
+
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._disk_sizes: OrderedDict[str, int] = OrderedDict()  # oldest first
+        self._disk_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.disk_dir is not None:
+            self._scan_disk()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Any | None:
+        """Get fresh cached data."""
+        entry = self.get_entry(key)
+        if entry is not None and entry.fresh:
+            self.hits += 1
+            return entry.data
+        self.misses += 1
+        return None
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get an entry, fresh or stale-but-revalidatable."""
+        entry = self._entries.get(key)
+        if entry is None and self.disk_dir is not None:
+            entry = self._read_disk(key)
+            if entry is not None:
+                self._insert(key, entry)
+        if entry is None:
+            return None
+
+        if not entry.fresh and not entry.revalidatable:
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        key: str,
+        data: Any,
+        ttl_seconds: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CacheEntry:
+        """Store data, evicting least recently used entries over budget."""
+        encoded = json_utils.dumps_bytes(data)
+        entry = CacheEntry(
+            data=data,
+            expires_at=time.time() + ttl_seconds,
+            size=len(encoded),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._insert(key, entry)
+        if self.disk_dir is not None:
+            self._write_disk(key, entry)
+        return entry
+
+    def refresh(self, key: str, entry: CacheEntry, ttl_seconds: float) -> None:
+        """Extend a revalidated entry's lifetime (HTTP 304)."""
+        entry.expires_at = time.time() + ttl_seconds
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        if self.disk_dir is not None:
+            self._write_disk(key, entry)
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        if self.disk_dir is not None and key in self._disk_sizes:
+            self._disk_bytes -= self._disk_sizes.pop(key)
+            (self.disk_dir / f"{key}.json").unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for key in list(self._entries):
+            self.delete(key)
+        for key in list(self._disk_sizes):
+            self.delete(key)
+
+    def get_stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "disk_entries": len(self._disk_sizes),
+            "disk_bytes": self._disk_bytes,
+        }
 
-_fetch_cache: dict[str, CacheEntry] = {}
-_search_cache: dict[str, CacheEntry] = {}
+    def _insert(self, key: str, entry: CacheEntry) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+        if entry.size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    # Disk tier ---------------------------------------------------------------
+
+    def _scan_disk(self) -> None:
+        assert self.disk_dir is not None
+        self.disk_dir.mkdir(parents=True, exist_ok=True)
+        files = sorted(self.disk_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            size = path.stat().st_size
+            self._disk_sizes[path.stem] = size
+            self._disk_bytes += size
+
+    def _read_disk(self, key: str) -> CacheEntry | None:
+        assert self.disk_dir is not None
+        if key not in self._disk_sizes:
+            return None
+        try:
+            raw = json_utils.loads((self.disk_dir / f"{key}.json").read_bytes())
+            return CacheEntry(**raw)
+        except Exception:
+            self.delete(key)
+            return None
+
+    def _write_disk(self, key: str, entry: CacheEntry) -> None:
+        assert self.disk_dir is not None
+        encoded = json_utils.dumps_bytes(asdict(entry))
+        if len(encoded) > self.disk_max_bytes:
+            return
+        try:
+            (self.disk_dir / f"{key}.json").write_bytes(encoded)
+        except OSError:
+            return
+        self._disk_bytes += len(encoded) - self._disk_sizes.pop(key, 0)
+        self._disk_sizes[key] = len(encoded)
+        while self._disk_bytes > self.disk_max_bytes:
+            old_key, size = self._disk_sizes.popitem(last=False)
+            self._disk_bytes -= size
+            (self.disk_dir / f"{old_key}.json").unlink(missing_ok=True)
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls for the same key into one in-flight call."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller's cancellation does not cancel the shared call
+        return await asyncio.shield(future)
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+_fetch_cache = WebCache(max_bytes=DEFAULT_FETCH_CACHE_MAX_BYTES)
+_search_cache = WebCache(max_bytes=DEFAULT_SEARCH_CACHE_MAX_BYTES)
+_fetch_flight = SingleFlight()
+_search_flight = SingleFlight()
+
+
+def configure_web_cache(
+    fetch_max_bytes: int = DEFAULT_FETCH_CACHE_MAX_BYTES,
+    search_max_bytes: int = DEFAULT_SEARCH_CACHE_MAX_BYTES,
+    disk_dir: str | Path | None = None,
+) -> None:
+    """Replace the web tool caches (e.g. to enable the disk tier)."""
+    global _fetch_cache, _search_cache
+    disk = Path(disk_dir) if disk_dir else None
+    _fetch_cache = WebCache(fetch_max_bytes, disk / "fetch" if disk else None)
+    _search_cache = WebCache(search_max_bytes, disk / "search" if disk else None)
+
+
+def get_web_cache_stats() -> dict[str, Any]:
+    """Get web fetch/search cache statistics."""
+    return {"fetch": _fetch_cache.get_stats(), "search": _search_cache.get_stats()}
 
 
 def normalize_cache_key(url: str) -> str:
@@ -67,8 +303,10 @@ def normalize_cache_key(url: str) -> str:
     return hashlib.sha256(url.encode()).hexdigest()[:16]
 
 
-def read_cache(cache: dict[str, CacheEntry], key: str) -> Any | None:
+def read_cache(cache: WebCache | dict[str, CacheEntry], key: str) -> Any | None:
     """Read from cache if not expired."""
+    if isinstance(cache, WebCache):
+        return cache.get(key)
     entry = cache.get(key)
     if entry and entry.expires_at > time.time():
         return entry.data
@@ -76,18 +314,41 @@ def read_cache(cache: dict[str, CacheEntry], key: str) -> Any | None:
 
 
 def write_cache(
-    cache: dict[str, CacheEntry],
+    cache: WebCache | dict[str, CacheEntry],
     key: str,
     data: Any,
     ttl_minutes: int = DEFAULT_CACHE_TTL_MINUTES,
 ) -> None:
     """Write to cache with TTL."""
+    if isinstance(cache, WebCache):
+        cache.put(key, data, ttl_minutes * 60)
+        return
     cache[key] = CacheEntry(
         data=data,
         expires_at=time.time() + ttl_minutes * 60,
     )
 
 
+# =============================================================================
+# HTTP Client
+# =============================================================================
+
+_http_clients: dict[int, httpx.AsyncClient] = {}
+
+
+def _get_http_client(max_redirects: int = DEFAULT_FETCH_MAX_REDIRECTS) -> httpx.AsyncClient:
+    """Get a web tool client backed by the shared connection pools.
+
+    httpx only sets ``max_redirects`` per client, so one client is kept per
+    redirect limit; all of them share the per-host pools of the registry.
+    """
+    client = _http_clients.get(max_redirects)
+    if client is None or client.is_closed:
+        client = create_http_client(timeout=DEFAULT_TIMEOUT_SECONDS, max_redirects=max_redirects)
+        _http_clients[max_redirects] = client
+    return client
+
+
 # =============================================================================
 # Content Extraction
 # =============================================================================
@@ -244,17 +505,41 @@ async def web_fetch_tool(
     if cached:
         return json_result({**cached, "cached": True})
 
-    # Fetch URL
+    # Concurrent fetches of the same URL share one request
+    return await _fetch_flight.do(
+        cache_key,
+        lambda: _fetch_url(url, extract_mode, max_chars, config, cache_key),
+    )
+
+
+async def _fetch_url(
+    url: str,
+    extract_mode: str,
+    max_chars: int,
+    config: WebFetchConfig,
+    cache_key: str,
+) -> ToolResult:
+    """Fetch a URL, revalidating a stale cache entry when it has validators."""
+    headers = {"User-Agent": config.user_agent}
+    stale = _fetch_cache.get_entry(cache_key)
+    if stale is not None:
+        if stale.etag:
+            headers["If-None-Match"] = stale.etag
+        if stale.last_modified:
+            headers["If-Modified-Since"] = stale.last_modified
+
     try:
-        async with httpx.AsyncClient(
+        client = _get_http_client(config.max_redirects)
+        response = await client.get(
+            url,
+            headers=headers,
             timeout=config.timeout_seconds,
             follow_redirects=True,
-            max_redirects=config.max_redirects,
-        ) as client:
-            response = await client.get(
-                url,
-                headers={"User-Agent": config.user_agent},
-            )
+        )
+
+        if response.status_code == 304 and stale is not None:
+            _fetch_cache.refresh(cache_key, stale, config.cache_ttl_minutes * 60)
+            return json_result({**stale.data, "cached": True, "revalidated": True})
 
         if response.status_code >= 400:
             return error_result(f"HTTP error: {response.status_code}")
@@ -284,8 +569,14 @@ async def web_fetch_tool(
             "truncated": len(extracted) >= max_chars,
         }
 
-        # Cache result
-        write_cache(_fetch_cache, cache_key, result, config.cache_ttl_minutes)
+        # Cache result with validators for later revalidation
+        _fetch_cache.put(
+            cache_key,
+            result,
+            config.cache_ttl_minutes * 60,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
 
         return json_result(result)
 
@@ -374,6 +665,20 @@ async def web_search_tool(
     if cached:
         return json_result({**cached, "cached": True})
 
+    # Concurrent identical searches share one provider call
+    return await _search_flight.do(
+        cache_key,
+        lambda: _run_search(query, max_results, config, cache_key),
+    )
+
+
+async def _run_search(
+    query: str,
+    max_results: int,
+    config: WebSearchConfig,
+    cache_key: str,
+) -> ToolResult:
+    """Query the configured search provider and cache the results."""
     # Use configured search provider
     if config.provider == "tavily" and config.api_key:
         results = await _search_tavily(query, max_results, config.api_key, config.timeout_seconds)
@@ -407,30 +712,30 @@ async def _search_tavily(
 ) -> list[SearchResult]:
     """Search using Tavily API."""
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                "https://api.tavily.com/search",
-                json={
-                    "query": query,
-                    "max_results": max_results,
-                    "api_key": api_key,
-                },
-            )
-
-            if response.status_code != 200:
-                return []
-
-            data = response.json()
-            results: list[SearchResult] = []
-
-            for item in data.get("results", []):
-                results.append(SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    snippet=item.get("content", "")[:500],
-                ))
-
-            return results[:max_results]
+        response = await _get_http_client().post(
+            "https://api.tavily.com/search",
+            json={
+                "query": query,
+                "max_results": max_results,
+                "api_key": api_key,
+            },
+            timeout=timeout,
+        )
+
+        if response.status_code != 200:
+            return []
+
+        data = response.json()
+        results: list[SearchResult] = []
+
+        for item in data.get("results", []):
+            results.append(SearchResult(
+                title=item.get("title", ""),
+                url=item.get("url", ""),
+                snippet=item.get("content", "")[:500],
+            ))
+
+        return results[:max_results]
 
     except Exception:
         return []
@@ -444,27 +749,27 @@ async def _search_serper(
 ) -> list[SearchResult]:
     """Search using Serper API."""
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                "https://google.serper.dev/search",
-                headers={"X-API-KEY": api_key},
-                json={"q": query, "num": max_results},
-            )
-
-            if response.status_code != 200:
-                return []
-
-            data = response.json()
-            results: list[SearchResult] = []
-
-            for item in data.get("organic", []):
-                results.append(SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("link", ""),
-                    snippet=item.get("snippet", ""),
-                ))
-
-            return results[:max_results]
+        response = await _get_http_client().post(
+            "https://google.serper.dev/search",
+            headers={"X-API-KEY": api_key},
+            json={"q": query, "num": max_results},
+            timeout=timeout,
+        )
+
+        if response.status_code != 200:
+            return []
+
+        data = response.json()
+        results: list[SearchResult] = []
+
+        for item in data.get("organic", []):
+            results.append(SearchResult(
+                title=item.get("title", ""),
+                url=item.get("link", ""),
+                snippet=item.get("snippet", ""),
+            ))
+
+        return results[:max_results]
 
     except Exception:
         return []
@@ -25,6 +25,7 @@ from lurkbot.tts.types import (
     TELEGRAM_OUTPUT,
     ResolvedElevenLabsConfig,
 )
+from lurkbot.utils.http_client import get_http_client
 
 
 class ElevenLabsTtsProvider(TtsProviderBase):
@@ -147,41 +148,42 @@ class ElevenLabsTtsProvider(TtsProviderBase):
             if effective_format:
                 url += f"?output_format={effective_format}"
 
-            async with httpx.AsyncClient(timeout=timeout_ms / 1000) as client:
-                response = await client.post(
-                    url,
-                    headers={
-                        "xi-api-key": self._api_key,
-                        "Content-Type": "application/json",
-                    },
-                    json=body,
-                )
+            client = get_http_client()
+            response = await client.post(
+                url,
+                headers={
+                    "xi-api-key": self._api_key,
+                    "Content-Type": "application/json",
+                },
+                json=body,
+                timeout=timeout_ms / 1000,
+            )
 
-                if response.status_code != 200:
-                    error_text = response.text
-                    logger.error(f"ElevenLabs TTS error: {response.status_code} - {error_text}")
-                    return TtsProviderResult(
-                        success=False,
-                        error=f"ElevenLabs API error: {response.status_code}",
-                        latency_ms=int((time.time() - start_time) * 1000),
-                    )
+            if response.status_code != 200:
+                error_text = response.text
+                logger.error(f"ElevenLabs TTS error: {response.status_code} - {error_text}")
+                return TtsProviderResult(
+                    success=False,
+                    error=f"ElevenLabs API error: {response.status_code}",
+                    latency_ms=int((time.time() - start_time) * 1000),
+                )
 
-                audio_data = response.content
-                latency_ms = int((time.time() - start_time) * 1000)
+            audio_data = response.content
+            latency_ms = int((time.time() - start_time) * 1000)
 
-                # Save to file if path provided
-                if output_path:
-                    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                    Path(output_path).write_bytes(audio_data)
+            # Save to file if path provided
+            if output_path:
+                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                Path(output_path).write_bytes(audio_data)
 
-                return TtsProviderResult(
-                    success=True,
-                    audio_data=audio_data,
-                    audio_path=output_path,
-                    latency_ms=latency_ms,
-                    output_format=effective_format,
-                    voice_compatible=voice_compatible,
-                )
+            return TtsProviderResult(
+                success=True,
+                audio_data=audio_data,
+                audio_path=output_path,
+                latency_ms=latency_ms,
+                output_format=effective_format,
+                voice_compatible=voice_compatible,
+            )
 
         except httpx.TimeoutException:
             return TtsProviderResult(
@@ -24,6 +24,7 @@ from lurkbot.tts.types import (
     TELEGRAM_OUTPUT,
     ResolvedOpenAIConfig,
 )
+from lurkbot.utils.http_client import get_http_client
 
 
 class OpenAITtsProvider(TtsProviderBase):
@@ -99,47 +100,48 @@ class OpenAITtsProvider(TtsProviderBase):
         extension = output_config.get("extension", ".mp3")
 
         try:
-            async with httpx.AsyncClient(timeout=timeout_ms / 1000) as client:
-                response = await client.post(
-                    f"{self._base_url}/audio/speech",
-                    headers={
-                        "Authorization": f"Bearer {self._api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": effective_model,
-                        "input": text,
-                        "voice": effective_voice,
-                        "response_format": effective_format,
-                        "speed": speed,
-                    },
-                )
+            client = get_http_client()
+            response = await client.post(
+                f"{self._base_url}/audio/speech",
+                headers={
+                    "Authorization": f"Bearer {self._api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": effective_model,
+                    "input": text,
+                    "voice": effective_voice,
+                    "response_format": effective_format,
+                    "speed": speed,
+                },
+                timeout=timeout_ms / 1000,
+            )
 
-                if response.status_code != 200:
-                    error_text = response.text
-                    logger.error(f"OpenAI TTS error: {response.status_code} - {error_text}")
-                    return TtsProviderResult(
-                        success=False,
-                        error=f"OpenAI API error: {response.status_code}",
-                        latency_ms=int((time.time() - start_time) * 1000),
-                    )
+            if response.status_code != 200:
+                error_text = response.text
+                logger.error(f"OpenAI TTS error: {response.status_code} - {error_text}")
+                return TtsProviderResult(
+                    success=False,
+                    error=f"OpenAI API error: {response.status_code}",
+                    latency_ms=int((time.time() - start_time) * 1000),
+                )
 
-                audio_data = response.content
-                latency_ms = int((time.time() - start_time) * 1000)
+            audio_data = response.content
+            latency_ms = int((time.time() - start_time) * 1000)
 
-                # Save to file if path provided
-                if output_path:
-                    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                    Path(output_path).write_bytes(audio_data)
+            # Save to file if path provided
+            if output_path:
+                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                Path(output_path).write_bytes(audio_data)
 
-                return TtsProviderResult(
-                    success=True,
-                    audio_data=audio_data,
-                    audio_path=output_path,
-                    latency_ms=latency_ms,
-                    output_format=effective_format,
-                    voice_compatible=voice_compatible,
-                )
+            return TtsProviderResult(
+                success=True,
+                audio_data=audio_data,
+                audio_path=output_path,
+                latency_ms=latency_ms,
+                output_format=effective_format,
+                voice_compatible=voice_compatible,
+            )
 
         except httpx.TimeoutException:
             return TtsProviderResult(
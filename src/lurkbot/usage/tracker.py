@@ -13,6 +13,8 @@ from typing import Any
 
 import httpx
 
+from lurkbot.utils.http_client import get_http_client
+
 from .types import (
     PROVIDER_LABELS,
     ProviderUsageSnapshot,
@@ -60,13 +62,13 @@ async def fetch_json_with_timeout(
         (响应对象, 错误消息) 元组
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=headers or {},
-                timeout=timeout_ms / 1000,  # 转换为秒
-            )
-            return response, None
+        client = get_http_client()
+        response = await client.get(
+            url,
+            headers=headers or {},
+            timeout=timeout_ms / 1000,  # 转换为秒
+        )
+        return response, None
     except httpx.TimeoutException:
         return None, "Request timeout"
     except httpx.HTTPError as e:
@@ -0,0 +1,365 @@
+"""共享 HTTP 客户端模块
+
+进程级的出站 HTTP 连接池注册表，替代各模块每次请求新建 ``httpx.AsyncClient``
+的做法（每次都要重新握手 TCP/TLS、无法复用连接）。
+
+设计：
+- 连接池按基础 URL（scheme://host:port）划分，每个主机一个独立连接池，
+  连接数上限按主机生效，互不挤占
+- 调用方拿到的是轻量的 ``httpx.AsyncClient``，其 transport 按请求 URL
+  路由到对应主机的连接池；跨主机重定向也会落到正确的连接池
+- 调用方关闭自己的客户端不会关闭共享连接池，连接池的生命周期由网关
+  lifespan 管理（``close_http_clients``）
+- 安装了 ``h2`` 时启用 HTTP/2（``pip install httpx[http2]``），否则使用 HTTP/1.1 keep-alive
+- 每个主机的请求数、错误数、延迟和连接池占用率可通过 ``get_http_client_stats``
+  获取，并由 ``lurkbot.monitoring`` 导出
+
+用法：
+    >>> client = get_http_client()  # 共享客户端，不要关闭
+    >>> response = await client.get("https://api.example.com/v1/items", timeout=10)
+
+    >>> client = create_http_client(headers={"Authorization": "..."})  # 自带默认配置
+    >>> ...
+    >>> await client.aclose()  # 只关闭该客户端，连接池保留
+"""
+
+import asyncio
+import importlib.util
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from loguru import logger
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 20
+DEFAULT_MAX_KEEPALIVE_PER_HOST = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_MAX_HOSTS = 256
+DEFAULT_TIMEOUT = 30.0
+
+TransportFactory = Callable[[str, httpx.Limits], httpx.AsyncBaseTransport]
+
+
+def base_url_of(url: httpx.URL | str) -> str:
+    """获取 URL 的基础地址（scheme://host:port），作为连接池的键"""
+    url = httpx.URL(url)
+    port = url.port or {"http": 80, "https": 443}.get(url.scheme)
+    return f"{url.scheme}://{url.host}:{port}" if port else f"{url.scheme}://{url.host}"
+
+
+# ============================================================================
+# 统计
+# ============================================================================
+
+
+@dataclass
+class HostStats:
+    """单个主机的请求统计"""
+
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    total_latency_ms: float = 0.0
+    latencies_ms: deque[float] = field(default_factory=lambda: deque(maxlen=512))
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为字典"""
+        recent = sorted(self.latencies_ms)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "avg_latency_ms": self.total_latency_ms / self.requests if self.requests else 0.0,
+            "p95_latency_ms": recent[int((len(recent) - 1) * 0.95)] if recent else 0.0,
+            "max_latency_ms": recent[-1] if recent else 0.0,
+        }
+
+
+class _HostPool:
+    """单个主机在某个事件循环上的连接池"""
+
+    def __init__(
+        self,
+        base_url: str,
+        transport: httpx.AsyncBaseTransport,
+        limits: httpx.Limits,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        self.base_url = base_url
+        self.transport = transport
+        self.limits = limits
+        self.loop = loop
+        self.in_flight = 0
+
+    def connection_counts(self) -> tuple[int, int]:
+        """返回 (已建立连接数, 空闲连接数)"""
+        pool = getattr(self.transport, "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return 0, 0
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return len(connections), idle
+
+
+# ============================================================================
+# 注册表
+# ============================================================================
+
+
+class HTTPClientRegistry:
+    """进程级 HTTP 连接池注册表
+
+    按基础 URL 维护连接池（每个事件循环各一份，httpx 的连接不能跨事件循环使用），
+    超过 ``max_hosts`` 时淘汰最久未使用且空闲的连接池。
+
+    Args:
+        max_connections_per_host: 每个主机的最大连接数
+        max_keepalive_per_host: 每个主机保持的最大空闲连接数
+        keepalive_expiry: 空闲连接保持时间（秒）
+        http2: 是否启用 HTTP/2，None 表示安装了 h2 时启用
+        max_hosts: 最多保留的连接池数量
+        host_limits: 按基础 URL 覆盖的连接数限制
+        transport_factory: 创建主机 transport 的工厂（测试时可注入 MockTransport）
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        max_keepalive_per_host: int = DEFAULT_MAX_KEEPALIVE_PER_HOST,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool | None = None,
+        max_hosts: int = DEFAULT_MAX_HOSTS,
+        host_limits: dict[str, httpx.Limits] | None = None,
+        transport_factory: TransportFactory | None = None,
+    ):
+        self.default_limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_keepalive_per_host,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.max_hosts = max_hosts
+        self.host_limits = {base_url_of(url): limits for url, limits in (host_limits or {}).items()}
+        self._transport_factory = transport_factory or self._default_transport
+
+        self._pools: OrderedDict[tuple[str, int], _HostPool] = OrderedDict()
+        self._stats: dict[str, HostStats] = {}
+        self._clients: dict[str | None, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+        self.transport = _RoutingTransport(self)
+
+    def _default_transport(self, _base_url: str, limits: httpx.Limits) -> httpx.AsyncBaseTransport:
+        return httpx.AsyncHTTPTransport(limits=limits, http2=self.http2)
+
+    # ------------------------------------------------------------------------
+    # 客户端
+    # ------------------------------------------------------------------------
+
+    def get_client(self, base_url: str | None = None) -> httpx.AsyncClient:
+        """获取共享客户端
+
+        同一基础 URL 返回同一个客户端实例，调用方不应关闭它。请求级别的超时、
+        请求头通过请求参数传入。
+
+        Args:
+            base_url: 客户端的基础 URL（用于相对路径请求），None 表示不设置
+        """
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            with self._lock:
+                client = self._clients.get(base_url)
+                if client is None or client.is_closed:
+                    client = self.create_client(base_url=base_url or "")
+                    self._clients[base_url] = client
+        return client
+
+    def create_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """创建使用共享连接池的客户端
+
+        参数与 ``httpx.AsyncClient`` 相同（transport 除外）。关闭返回的客户端
+        不会关闭共享连接池。
+        """
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        return httpx.AsyncClient(transport=self.transport, **kwargs)
+
+    # ------------------------------------------------------------------------
+    # 连接池
+    # ------------------------------------------------------------------------
+
+    def _get_pool(self, base_url: str) -> tuple[_HostPool, list[_HostPool]]:
+        """获取主机连接池，同时返回被淘汰、需要关闭的连接池"""
+        loop = asyncio.get_running_loop()
+        key = (base_url, id(loop))
+        evicted: list[_HostPool] = []
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is not None and pool.loop is loop:
+                self._pools.move_to_end(key)
+                return pool, evicted
+
+            limits = self.host_limits.get(base_url, self.default_limits)
+            pool = _HostPool(base_url, self._transport_factory(base_url, limits), limits, loop)
+            self._pools[key] = pool
+            self._stats.setdefault(base_url, HostStats())
+
+            # 淘汰已关闭事件循环上的连接池，以及超出上限的最久未使用空闲连接池
+            for other_key, other in list(self._pools.items()):
+                if other.loop.is_closed():
+                    del self._pools[other_key]
+            excess = len(self._pools) - self.max_hosts
+            for other_key, other in list(self._pools.items()):
+                if excess <= 0:
+                    break
+                if other is not pool and other.in_flight == 0 and other.loop is loop:
+                    del self._pools[other_key]
+                    evicted.append(other)
+                    excess -= 1
+        return pool, evicted
+
+    async def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """将请求路由到对应主机的连接池，并记录统计"""
+        base_url = base_url_of(request.url)
+        pool, evicted = self._get_pool(base_url)
+        for old in evicted:
+            await old.transport.aclose()
+
+        stats = self._stats[base_url]
+        pool.in_flight += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        start = time.perf_counter()
+        try:
+            response = await pool.transport.handle_async_request(request)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            # 延迟统计到收到响应头为止，不包括读取响应体
+            latency_ms = (time.perf_counter() - start) * 1000
+            pool.in_flight -= 1
+            stats.in_flight -= 1
+            stats.requests += 1
+            stats.total_latency_ms += latency_ms
+            stats.latencies_ms.append(latency_ms)
+        if response.status_code >= 500:
+            stats.errors += 1
+        return response
+
+    async def aclose(self) -> None:
+        """关闭当前事件循环上的所有连接池"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pools = [pool for pool in self._pools.values() if pool.loop is loop]
+            self._pools = OrderedDict(
+                (key, pool) for key, pool in self._pools.items() if pool.loop is not loop
+            )
+        for pool in pools:
+            try:
+                await pool.transport.aclose()
+            except Exception as e:
+                logger.warning(f"关闭 HTTP 连接池失败: {pool.base_url}, 错误: {e}")
+        if pools:
+            logger.info(f"已关闭 {len(pools)} 个 HTTP 连接池")
+
+    # ------------------------------------------------------------------------
+    # 统计
+    # ------------------------------------------------------------------------
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """获取每个主机的统计信息
+
+        Returns:
+            基础 URL -> 统计信息，包含请求数、错误数、延迟，以及连接池的
+            连接数和占用率（活跃连接数 / 最大连接数）
+        """
+        with self._lock:
+            pools = list(self._pools.values())
+            stats = dict(self._stats)
+
+        result: dict[str, dict[str, Any]] = {}
+        for base_url, host_stats in stats.items():
+            result[base_url] = {
+                **host_stats.to_dict(),
+                "pools": 0,
+                "connections": 0,
+                "idle_connections": 0,
+                "max_connections": 0,
+            }
+        for pool in pools:
+            entry = result[pool.base_url]
+            connections, idle = pool.connection_counts()
+            entry["pools"] += 1
+            entry["connections"] += connections
+            entry["idle_connections"] += idle
+            entry["max_connections"] += pool.limits.max_connections or 0
+        for entry in result.values():
+            active = entry["connections"] - entry["idle_connections"]
+            entry["utilization"] = (
+                active / entry["max_connections"] if entry["max_connections"] else 0.0
+            )
+        return result
+
+
+class _RoutingTransport(httpx.AsyncBaseTransport):
+    """按请求 URL 路由到主机连接池的 transport，关闭时不关闭共享连接池"""
+
+    def __init__(self, registry: HTTPClientRegistry):
+        self._registry = registry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._registry.handle_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+# ============================================================================
+# 全局注册表
+# ============================================================================
+
+_registry: HTTPClientRegistry | None = None
+
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """获取全局 HTTP 客户端注册表"""
+    global _registry
+    if _registry is None:
+        _registry = HTTPClientRegistry()
+    return _registry
+
+
+def set_http_client_registry(registry: HTTPClientRegistry | None) -> None:
+    """替换全局注册表（配置连接数限制或测试时使用）"""
+    global _registry
+    _registry = registry
+
+
+def get_http_client(base_url: str | None = None) -> httpx.AsyncClient:
+    """获取共享 HTTP 客户端（不要关闭）"""
+    return get_http_client_registry().get_client(base_url)
+
+
+def create_http_client(**kwargs: Any) -> httpx.AsyncClient:
+    """创建使用共享连接池、带自有默认配置的 HTTP 客户端"""
+    return get_http_client_registry().create_client(**kwargs)
+
+
+async def close_http_clients() -> None:
+    """关闭共享连接池（网关关闭时调用）"""
+    if _registry is not None:
+        await _registry.aclose()
+
+
+def get_http_client_stats() -> dict[str, dict[str, Any]]:
+    """获取每个主机的 HTTP 连接池统计"""
+    if _registry is None:
+        return {}
+    return _registry.get_stats()
@@ -77,3 +77,6 @@ def loads(s: str | bytes) -> Any:
 
 # 兼容标准 json 库的异常
 JSONDecodeError = orjson.JSONDecodeError
+
+# 已序列化的 JSON 片段，可嵌入 dumps/dumps_bytes 的输入中而不会被再次序列化
+Fragment = orjson.Fragment
@@ -3,6 +3,8 @@
 """
 
 import asyncio
+import json
+
 import pytest
 from lurkbot.gateway.batching import MessageBatcher
 
@@ -155,3 +157,164 @@ async def test_concurrent_add():
     await asyncio.sleep(0.2)
 
     assert len(sent_messages) == 20
+
+
+@pytest.mark.asyncio
+async def test_batch_mode_single_frame():
+    """测试 batch 模式一次刷新只发送一个帧"""
+    sent_texts = []
+    sent_frames = []
+
+    async def mock_send(text: str):
+        sent_texts.append(text)
+
+    async def mock_send_bytes(data: bytes):
+        sent_frames.append(data)
+
+    batcher = MessageBatcher(
+        send_func=mock_send,
+        batch_size=100,
+        auto_flush=False,
+        wire_mode="batch",
+        send_bytes_func=mock_send_bytes,
+    )
+
+    for i in range(5):
+        await batcher.add({"id": i})
+    await batcher.flush()
+
+    assert sent_texts == []
+    assert len(sent_frames) == 1
+    frame = json.loads(sent_frames[0])
+    assert frame == {"type": "batch", "frames": [{"id": i} for i in range(5)]}
+
+    stats = batcher.get_stats()
+    assert stats["messages_sent"] == 5
+    assert stats["frames_sent"] == 1
+    assert stats["wire_mode"] == "batch"
+
+
+@pytest.mark.asyncio
+async def test_enable_batch_frames_without_bytes_func():
+    """测试切换到 batch 模式后未提供 bytes 发送函数时回退为文本帧"""
+    sent_messages = []
+
+    async def mock_send(text: str):
+        sent_messages.append(text)
+
+    batcher = MessageBatcher(send_func=mock_send, auto_flush=False)
+    await batcher.add({"id": 0})
+    await batcher.flush()
+
+    batcher.enable_batch_frames()
+    await batcher.add({"id": 1})
+    await batcher.add({"id": 2})
+    await batcher.flush()
+
+    assert len(sent_messages) == 2
+    assert json.loads(sent_messages[0]) == {"id": 0}
+    assert json.loads(sent_messages[1])["frames"] == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_delay_follows_send_latency():
+    """测试自适应延迟随发送延迟变化并受上下限约束"""
+    latency = 0.02
+
+    async def slow_send(text: str):
+        await asyncio.sleep(latency)
+
+    batcher = MessageBatcher(
+        send_func=slow_send,
+        batch_delay=0.01,
+        auto_flush=False,
+        adaptive_delay=True,
+        min_batch_delay=0.001,
+        max_batch_delay=0.03,
+    )
+
+    await batcher.add({"id": 1})
+    await batcher.flush()
+    # 2 × ~20ms 超过上限，被钳制
+    assert batcher.batch_delay == 0.03
+
+    latency = 0.0
+    for i in range(30):
+        await batcher.add({"id": i})
+        await batcher.flush()
+    assert batcher.batch_delay < 0.01
+    assert batcher.batch_delay >= 0.001
+
+
+def test_invalid_wire_mode():
+    """测试非法线路模式"""
+
+    async def mock_send(text: str):
+        pass
+
+    with pytest.raises(ValueError):
+        MessageBatcher(send_func=mock_send, wire_mode="stream")
+
+
+@pytest.mark.asyncio
+async def test_handshake_negotiates_batch_frames():
+    """测试握手协商 batch-frames 能力"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from lurkbot.gateway.protocol.frames import CAP_BATCH_FRAMES
+    from lurkbot.gateway.server import GatewayConnection, GatewayServer
+
+    hello = {
+        "type": "hello",
+        "minProtocol": 1,
+        "maxProtocol": 1,
+        "client": {"id": "c1", "version": "1.0.0", "platform": "linux", "mode": "cli"},
+        "caps": [CAP_BATCH_FRAMES],
+    }
+    ws = MagicMock()
+    ws.send_text = AsyncMock()
+    ws.send_bytes = AsyncMock()
+    ws.receive_text = AsyncMock(return_value=json.dumps(hello))
+
+    conn = GatewayConnection(ws, "conn-1")
+    await GatewayServer()._handshake(conn)
+
+    # hello-ok 仍以普通文本帧发送，并确认能力
+    ws.send_text.assert_called_once()
+    hello_ok = json.loads(ws.send_text.call_args.args[0])
+    assert hello_ok["caps"] == [CAP_BATCH_FRAMES]
+    assert conn.batch_frames
+
+    await conn.send_json({"type": "event", "n": 1})
+    await conn.send_json({"type": "event", "n": 2})
+    await conn.close()
+
+    ws.send_bytes.assert_called_once()
+    frame = json.loads(ws.send_bytes.call_args.args[0])
+    assert [f["n"] for f in frame["frames"]] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_handshake_without_caps_keeps_message_mode():
+    """测试客户端未声明能力时保持逐条发送"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from lurkbot.gateway.server import GatewayConnection, GatewayServer
+
+    hello = {
+        "type": "hello",
+        "minProtocol": 1,
+        "maxProtocol": 1,
+        "client": {"id": "c1", "version": "1.0.0", "platform": "linux", "mode": "cli"},
+    }
+    ws = MagicMock()
+    ws.send_text = AsyncMock()
+    ws.receive_text = AsyncMock(return_value=json.dumps(hello))
+
+    conn = GatewayConnection(ws, "conn-2")
+    await GatewayServer()._handshake(conn)
+    await conn.close()
+
+    hello_ok = json.loads(ws.send_text.call_args.args[0])
+    assert hello_ok["caps"] == []
+    assert not conn.batch_frames
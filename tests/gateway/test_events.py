@@ -0,0 +1,155 @@
+"""
+测试事件广播的背压处理
+"""
+
+import asyncio
+
+import pytest
+
+from lurkbot.gateway.events import EventBroadcaster, OverflowPolicy
+from lurkbot.utils import json_utils as json
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_block_others():
+    """测试慢订阅者不影响其他订阅者"""
+    broadcaster = EventBroadcaster()
+    fast_events = []
+    release = asyncio.Event()
+
+    async def slow(event):
+        await release.wait()
+
+    async def fast(event):
+        fast_events.append(event.event)
+
+    broadcaster.subscribe(slow, name="slow")
+    broadcaster.subscribe(fast, name="fast")
+
+    for i in range(3):
+        await asyncio.wait_for(broadcaster.emit(f"test.{i}"), timeout=0.1)
+
+    assert fast_events == ["test.0", "test.1", "test.2"]
+    metrics = broadcaster.get_metrics()
+    assert metrics["fast"]["delivered"] == 3
+    assert metrics["slow"]["delivered"] == 0
+    assert metrics["slow"]["queue_depth"] == 2  # 第一个事件正在投递
+
+    release.set()
+    assert await broadcaster.drain(timeout=1.0)
+    metrics = broadcaster.get_metrics()
+    assert metrics["slow"]["delivered"] == 3
+    assert metrics["slow"]["max_lag_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_bounds_queue():
+    """测试 drop_oldest 策略丢弃最旧事件"""
+    broadcaster = EventBroadcaster(queue_size=2)
+    received = []
+    release = asyncio.Event()
+
+    async def callback(event):
+        await release.wait()
+        received.append(event.payload["n"])
+
+    broadcaster.subscribe(callback, name="client")
+    for n in range(6):
+        await broadcaster.emit("tick", payload={"n": n})
+
+    # 第 0 个正在投递，队列只保留最新的 2 个
+    release.set()
+    await broadcaster.drain(timeout=1.0)
+
+    assert received == [0, 4, 5]
+    stats = broadcaster.get_metrics()["client"]
+    assert stats["dropped"] == 3
+    assert stats["max_queue_depth"] == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_replaces_same_event_type():
+    """测试 coalesce 策略按事件类型合并"""
+    broadcaster = EventBroadcaster(queue_size=2, overflow_policy=OverflowPolicy.COALESCE)
+    received = []
+    release = asyncio.Event()
+
+    async def callback(event):
+        await release.wait()
+        received.append((event.event, event.payload["n"]))
+
+    broadcaster.subscribe(callback, name="client")
+    await broadcaster.emit("progress", payload={"n": 0})  # 正在投递
+    await broadcaster.emit("progress", payload={"n": 1})
+    await broadcaster.emit("status", payload={"n": 2})
+    await broadcaster.emit("progress", payload={"n": 3})  # 替换 n=1
+    await broadcaster.emit("progress", payload={"n": 4})  # 替换 n=3
+
+    release.set()
+    await broadcaster.drain(timeout=1.0)
+
+    assert received == [("progress", 0), ("progress", 4), ("status", 2)]
+    assert broadcaster.get_metrics()["client"]["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_removes_subscriber():
+    """测试 disconnect 策略断开停止读取的订阅者"""
+    broadcaster = EventBroadcaster(queue_size=1, overflow_policy=OverflowPolicy.DISCONNECT)
+    disconnected = []
+    never = asyncio.Event()
+
+    async def callback(event):
+        await never.wait()
+
+    async def on_disconnect():
+        disconnected.append(True)
+
+    subscriber = broadcaster.subscribe(callback, name="stuck", on_disconnect=on_disconnect)
+    for n in range(3):
+        await broadcaster.emit("tick", payload={"n": n})
+
+    assert disconnected == [True]
+    assert subscriber.closed
+    assert "stuck" not in broadcaster.get_metrics()
+
+
+@pytest.mark.asyncio
+async def test_serialized_subscribers_share_bytes():
+    """测试事件只序列化一次，并以同一份 bytes 投递给所有订阅者"""
+    broadcaster = EventBroadcaster()
+    received = []
+
+    async def callback(data):
+        received.append(data)
+
+    broadcaster.subscribe(callback, serialized=True)
+    broadcaster.subscribe(callback, serialized=True)
+
+    frame = await broadcaster.emit("agent.done", payload={"ok": True}, session_key="s1")
+    await broadcaster.drain(timeout=1.0)
+
+    assert len(received) == 2
+    assert received[0] is received[1]
+    decoded = json.loads(received[0])
+    assert decoded["id"] == frame.id
+    assert decoded["sessionKey"] == "s1"
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_stops_writer():
+    """测试取消订阅后停止投递"""
+    broadcaster = EventBroadcaster()
+    received = []
+
+    async def callback(event):
+        received.append(event)
+
+    subscriber = broadcaster.subscribe(callback)
+    await broadcaster.emit("a")
+    broadcaster.unsubscribe(subscriber)
+    await broadcaster.emit("b")
+    await asyncio.sleep(0.01)
+
+    assert [e.event for e in received] == ["a"]
+    assert subscriber.closed
@@ -587,6 +587,194 @@ class TestCronService:
         assert service.get(job_id) is None
 
 
+class TestCronScheduler:
+    """Tests for heap scheduling and concurrent dispatch in CronService."""
+
+    @staticmethod
+    def _add(service, text, every_ms=3600000, **extra):
+        return service.add(
+            {
+                "name": text,
+                "schedule": {"kind": "every", "every_ms": every_ms},
+                "payload": {"kind": "systemEvent", "text": text},
+                **extra,
+            }
+        )
+
+    def test_next_job_tracks_changes(self, tmp_path):
+        """Test the next scheduled job follows adds, updates and removes."""
+        service = CronService(storage_path=tmp_path / "cron.jsonl", agent_id="test")
+        hourly = self._add(service, "hourly")
+        minutely = self._add(service, "minutely", every_ms=60000)
+
+        assert service.status().next_job_id == minutely.id
+
+        service.update(minutely.id, {"enabled": False})
+        assert service.status().next_job_id == hourly.id
+
+        service.update(minutely.id, {"enabled": True})
+        service.remove(minutely.id)
+        assert service.status().next_job_id == hourly.id
+        assert service._get_next_scheduled_job()[1] == hourly.state.next_run_at_ms
+
+    def test_pop_due_returns_only_due_jobs(self, tmp_path):
+        """Test due jobs come off the heap earliest first."""
+        service = CronService(storage_path=tmp_path / "cron.jsonl", agent_id="test")
+        now_ms = int(time.time() * 1000)
+        jobs = [self._add(service, f"job {i}") for i in range(5)]
+        for i, job in enumerate(jobs[:3]):
+            job.state.next_run_at_ms = now_ms - 1000 * (i + 1)
+            service._schedule(job)
+
+        due = service._pop_due(now_ms)
+
+        assert [job.id for job, _ in due] == [jobs[2].id, jobs[1].id, jobs[0].id]
+        assert service._pop_due(now_ms) == []
+        assert service.status().job_count == 5
+
+    @pytest.mark.asyncio
+    async def test_slow_job_does_not_block_others(self, tmp_path):
+        """Test a slow agent turn runs alongside other due jobs."""
+        release = asyncio.Event()
+        events = []
+
+        async def slow_agent_turn(job):
+            await release.wait()
+            return "done"
+
+        service = CronService(
+            storage_path=tmp_path / "cron.jsonl",
+            agent_id="test",
+            on_inject_system_event=lambda key, text: events.append(text),
+            on_run_agent_turn=slow_agent_turn,
+        )
+        slow = service.add(
+            {
+                "name": "slow",
+                "schedule": {"kind": "every", "every_ms": 3600000},
+                "payload": {"kind": "agentTurn", "message": "report"},
+                "session_target": "isolated",
+            }
+        )
+        fast = self._add(service, "fast")
+        past_ms = int(time.time() * 1000) - 10
+        for job in (slow, fast):
+            job.state.next_run_at_ms = past_ms
+            service._schedule(job)
+
+        service.start()
+        try:
+            for _ in range(50):
+                if events:
+                    break
+                await asyncio.sleep(0.01)
+            assert events == ["fast"]
+            assert slow.state.running_at_ms is not None
+        finally:
+            release.set()
+            await asyncio.gather(*service._active)
+            service.stop()
+
+        assert slow.state.last_status == "ok"
+
+    @pytest.mark.asyncio
+    async def test_per_agent_concurrency_limit(self, tmp_path):
+        """Test runs are limited per agent while other agents proceed."""
+        release = asyncio.Event()
+        running: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def on_inject(session_key, text):
+            running[session_key] = running.get(session_key, 0) + 1
+            peak[session_key] = max(peak.get(session_key, 0), running[session_key])
+            await release.wait()
+            running[session_key] -= 1
+
+        service = CronService(
+            storage_path=tmp_path / "cron.jsonl",
+            agent_id="a",
+            on_inject_system_event=on_inject,
+            max_concurrent_runs=10,
+            max_concurrent_runs_per_agent=2,
+        )
+        jobs = [self._add(service, f"a{i}") for i in range(4)]
+        jobs += [self._add(service, f"b{i}", agent_id="b") for i in range(2)]
+
+        now_ms = int(time.time() * 1000)
+        for job in jobs:
+            service._dispatch(job, now_ms, now_ms)
+        await asyncio.sleep(0)
+
+        assert running == {"agent:a:main": 2, "agent:b:main": 2}
+        release.set()
+        for _ in range(100):
+            if not service._active:
+                break
+            await asyncio.sleep(0.01)
+
+        assert peak == {"agent:a:main": 2, "agent:b:main": 2}
+        assert all(job.state.last_status == "ok" for job in jobs)
+        assert all(job.state.running_at_ms is None for job in jobs)
+
+    def test_misfire_skip(self, tmp_path):
+        """Test overdue runs are recorded as skipped under the skip policy."""
+        events = []
+        service = CronService(
+            storage_path=tmp_path / "cron.jsonl",
+            agent_id="test",
+            on_inject_system_event=lambda key, text: events.append(text),
+            misfire_policy="skip",
+            misfire_grace_seconds=1,
+        )
+        job = self._add(service, "late")
+        now_ms = int(time.time() * 1000)
+
+        service._dispatch(job, now_ms - 5000, now_ms)
+
+        assert events == []
+        assert service.get_runs(job.id)[0].status == "skipped"
+        assert job.state.next_run_at_ms > now_ms
+        assert service.status().next_job_id == job.id
+
+    @pytest.mark.asyncio
+    async def test_misfire_catch_up(self, tmp_path):
+        """Test missed occurrences are replayed up to max_catch_up_runs."""
+        events = []
+        service = CronService(
+            storage_path=tmp_path / "cron.jsonl",
+            agent_id="test",
+            on_inject_system_event=lambda key, text: events.append(text),
+            misfire_grace_seconds=0,
+            max_catch_up_runs=3,
+        )
+        job = self._add(service, "tick", every_ms=1000, misfire_policy="catch_up")
+        now_ms = int(time.time() * 1000)
+        scheduled = now_ms - 10_000
+
+        for _ in range(3):
+            await service._execute_job(job, scheduled_at_ms=scheduled)
+            scheduled = job.state.next_run_at_ms
+
+        assert len(events) == 3
+        # Two missed occurrences were replayed, then it skipped ahead
+        assert job.state.next_run_at_ms > now_ms
+
+    def test_state_persisted_and_running_cleared(self, tmp_path):
+        """Test misfire policy is persisted and stale running state is cleared."""
+        storage_path = tmp_path / "cron.jsonl"
+        service = CronService(storage_path=storage_path, agent_id="test")
+        job = self._add(service, "persisted", misfire_policy="skip")
+        job.state.running_at_ms = int(time.time() * 1000)
+        service._save()
+
+        reloaded = CronService(storage_path=storage_path, agent_id="test")
+
+        loaded = reloaded.get(job.id)
+        assert loaded.misfire_policy == "skip"
+        assert loaded.state.running_at_ms is None
+        assert reloaded.status().next_job_id == job.id
+
+
 class TestCronJobState:
     """Tests for CronJobState."""
 
@@ -1,9 +1,11 @@
 """Tests for Prometheus exporter."""
 
+import httpx
 import pytest
 from prometheus_client import CollectorRegistry
 
 from lurkbot.monitoring import MetricsCollector, PrometheusExporter
+from lurkbot.utils.http_client import HTTPClientRegistry, set_http_client_registry
 
 
 class TestPrometheusExporter:
@@ -53,6 +55,29 @@ class TestPrometheusExporter:
         assert "lurkbot_throughput_rps" in metric_names
         assert "lurkbot_uptime_seconds" in metric_names
 
+    @pytest.mark.asyncio
+    async def test_http_client_collector(self):
+        """Test per-host metrics of the shared HTTP client pools."""
+        registry = HTTPClientRegistry(
+            transport_factory=lambda base_url, limits: httpx.MockTransport(
+                lambda request: httpx.Response(200)
+            ),
+        )
+        set_http_client_registry(registry)
+        try:
+            await registry.get_client().get("https://api.example.com/v1")
+            exporter = PrometheusExporter(MetricsCollector(), port=9091)
+
+            metrics = {m.name: m for m in exporter.http_client_collector.collect()}
+        finally:
+            set_http_client_registry(None)
+
+        samples = metrics["lurkbot_http_client_requests_total"].samples
+        assert [(s.labels["host"], s.value) for s in samples] == [
+            ("https://api.example.com:443", 1)
+        ]
+        assert "lurkbot_http_client_pool_utilization" in metrics
+
     def test_repr(self):
         """Test string representation."""
         collector = MetricsCollector()
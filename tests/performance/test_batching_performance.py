@@ -19,6 +19,25 @@ class MockWebSocket:
         """模拟发送文本"""
         self.sent_messages.append(text)
 
+    async def send_bytes(self, data: bytes):
+        """模拟发送二进制"""
+        self.sent_messages.append(data)
+
+
+class FramedWebSocket(MockWebSocket):
+    """模拟每帧都有固定开销（一次 syscall + 让出事件循环）的 WebSocket"""
+
+    async def send_text(self, text: str):
+        await asyncio.sleep(0)
+        self.sent_messages.append(text)
+
+    async def send_bytes(self, data: bytes):
+        await asyncio.sleep(0)
+        self.sent_messages.append(data)
+
+
+EVENTS_PER_CONNECTION = 1000
+
 
 @pytest.mark.benchmark(group="batching-send")
 def test_send_without_batching(benchmark):
@@ -146,3 +165,40 @@ def test_concurrent_with_batching(benchmark):
         asyncio.run(_send())
 
     benchmark(send_messages)
+
+
+def _run_events(wire_mode: str) -> FramedWebSocket:
+    """单连接推送 EVENTS_PER_CONNECTION 个事件"""
+    ws = FramedWebSocket()
+
+    async def _send():
+        batcher = MessageBatcher(
+            send_func=ws.send_text,
+            send_bytes_func=ws.send_bytes,
+            batch_size=100,
+            batch_delay=0.01,
+            wire_mode=wire_mode,
+            adaptive_delay=True,
+        )
+        for i in range(EVENTS_PER_CONNECTION):
+            await batcher.add(
+                {"type": "event", "event": "agent.delta", "payload": {"seq": i, "text": "token"}}
+            )
+        await batcher.close()
+
+    asyncio.run(_send())
+    return ws
+
+
+@pytest.mark.benchmark(group="batching-events-per-connection")
+def test_events_per_message_mode(benchmark):
+    """测试逐条帧模式的单连接事件吞吐（events/sec = 1000 / mean）"""
+    ws = benchmark(_run_events, "message")
+    assert len(ws.sent_messages) == EVENTS_PER_CONNECTION
+
+
+@pytest.mark.benchmark(group="batching-events-per-connection")
+def test_events_batch_frame_mode(benchmark):
+    """测试单帧批量模式的单连接事件吞吐（events/sec = 1000 / mean）"""
+    ws = benchmark(_run_events, "batch")
+    assert len(ws.sent_messages) == EVENTS_PER_CONNECTION // 100
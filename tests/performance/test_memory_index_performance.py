@@ -0,0 +1,127 @@
+"""记忆检索性能测试
+
+测试内容：
+- 2 万个段落规模下，倒排索引 BM25 查询与逐文件扫描的耗时对比
+- 未变更语料的刷新开销（只 stat 文件，不重新读取）
+- 段落向量矩阵的余弦相似度查询（混合检索的语义部分）
+"""
+
+import os
+import random
+from pathlib import Path
+
+import pytest
+
+from lurkbot.memory import HashingEmbedder, MemoryIndex, SectionVectorIndex
+
+FILES = 200
+SECTIONS_PER_FILE = 100
+QUERY = "rollback 数据库迁移"
+
+_WORDS = [
+    "deploy", "gateway", "rollback", "meeting", "budget", "release", "agent", "incident",
+    "review", "customer", "latency", "schema", "backup", "token", "invoice", "roadmap",
+]
+_CJK_WORDS = ["数据库", "迁移", "会议", "预算", "发布", "客户", "延迟", "备份", "周报", "需求"]
+
+
+def _memory_files(root: Path) -> list[Path]:
+    """与 MemoryManager._find_memory_files 相同的文件发现方式"""
+    return [
+        Path(dirpath, name)
+        for dirpath, _, filenames in os.walk(root / "memory")
+        for name in filenames
+        if name.endswith(".md")
+    ]
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory) -> Path:
+    """200 个文件 × 100 个段落的中英文混合记忆语料"""
+    root = tmp_path_factory.mktemp("memory-corpus")
+    memory_dir = root / "memory"
+    memory_dir.mkdir()
+    rng = random.Random(42)
+    for f in range(FILES):
+        sections = []
+        for _ in range(SECTIONS_PER_FILE):
+            words = rng.choices(_WORDS, k=12) + rng.choices(_CJK_WORDS, k=4)
+            rng.shuffle(words)
+            sections.append(" ".join(words[:8]) + "\n" + "".join(words[8:]))
+        (memory_dir / f"notes-{f:03d}.md").write_text("\n\n".join(sections), encoding="utf-8")
+    return root
+
+
+def _scan_search(root: Path, query: str, max_results: int) -> list[tuple[str, float]]:
+    """索引之前的实现：每次查询重新读取、切分并扫描所有文件"""
+    results = []
+    query_lower = query.lower()
+    query_words = set(query_lower.split())
+    for file_path in _memory_files(root):
+        lines = file_path.read_text(encoding="utf-8").splitlines()
+        current: list[str] = []
+        for line in [*lines, ""]:
+            if line.strip():
+                current.append(line)
+                continue
+            if current:
+                text_lower = "\n".join(current).lower()
+                if query_lower in text_lower:
+                    results.append((text_lower, 1.0))
+                else:
+                    overlap = len(query_words & set(text_lower.split()))
+                    if overlap:
+                        results.append((text_lower, overlap / len(query_words) * 0.8))
+                current = []
+    results.sort(key=lambda r: r[1], reverse=True)
+    return results[:max_results]
+
+
+@pytest.mark.benchmark(group="memory-search")
+def test_scan_search(benchmark, corpus):
+    """基线：逐文件扫描"""
+    results = benchmark(_scan_search, corpus, QUERY, 10)
+    assert results
+
+
+@pytest.mark.benchmark(group="memory-search")
+def test_index_search(benchmark, corpus, tmp_path):
+    """倒排索引 BM25 查询"""
+    index = MemoryIndex(corpus, index_path=tmp_path / "memory-index.json")
+    index.refresh(_memory_files(corpus))
+    assert len(index) == FILES * SECTIONS_PER_FILE
+
+    results = benchmark(index.search, QUERY, 10)
+    assert len(results) == 10
+
+
+@pytest.mark.benchmark(group="memory-search")
+def test_index_refresh_unchanged(benchmark, corpus, tmp_path):
+    """语料未变更时的刷新（每次 memory_search 前执行）"""
+    index = MemoryIndex(corpus, index_path=tmp_path / "memory-index.json")
+    index.refresh(_memory_files(corpus))
+
+    changed = benchmark(lambda: index.refresh(_memory_files(corpus)))
+    assert changed is False
+
+
+@pytest.mark.benchmark(group="memory-search")
+def test_vector_search(benchmark, corpus, tmp_path):
+    """段落向量余弦相似度查询（256 维，内存映射矩阵）"""
+    index = MemoryIndex(corpus, index_path=tmp_path / "memory-index.json")
+    index.refresh(_memory_files(corpus))
+    vectors = SectionVectorIndex(HashingEmbedder(), "hashing", directory=tmp_path)
+    vectors.sync(index)
+
+    results = benchmark(vectors.search, QUERY, 10)
+    assert len(results) == 10
+
+
+@pytest.mark.benchmark(group="memory-index-load")
+def test_index_load_from_disk(benchmark, corpus, tmp_path):
+    """重启后从磁盘加载索引"""
+    index_path = tmp_path / "memory-index.json"
+    MemoryIndex(corpus, index_path=index_path).refresh(_memory_files(corpus))
+
+    index = benchmark(MemoryIndex, corpus, index_path=index_path)
+    assert len(index) == FILES * SECTIONS_PER_FILE
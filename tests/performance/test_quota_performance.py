@@ -0,0 +1,80 @@
+"""配额速率限制性能测试
+
+测试内容：
+- 10k 租户、每租户 1k 次/秒调用规模下的限流检查开销
+- 滑动窗口计数器的固定内存占用
+"""
+
+import asyncio
+
+import pytest
+
+from lurkbot.tenants import Tenant, TenantQuota
+from lurkbot.tenants.quota import QuotaManager
+from lurkbot.tenants.ratelimit import MemoryRateLimitBackend
+
+TENANTS = 10_000
+CALLS_PER_TENANT = 1_000
+
+
+def _tenants() -> list[Tenant]:
+    return [
+        Tenant(
+            id=f"tenant-{i}",
+            name=f"tenant-{i}",
+            display_name=f"Tenant {i}",
+            quota=TenantQuota(max_api_calls_per_minute=120_000),
+        )
+        for i in range(TENANTS)
+    ]
+
+
+@pytest.fixture(scope="module")
+def loaded_manager() -> tuple[QuotaManager, MemoryRateLimitBackend, list[Tenant]]:
+    """每个租户已记录 1k 次调用的配额管理器"""
+    backend = MemoryRateLimitBackend()
+    manager = QuotaManager(rate_limit_backend=backend)
+    tenants = _tenants()
+
+    async def warm_up():
+        for tenant in tenants:
+            await manager.record_api_call(tenant.id, CALLS_PER_TENANT)
+
+    asyncio.run(warm_up())
+    return manager, backend, tenants
+
+
+@pytest.mark.benchmark(group="quota-rate-limit")
+def test_rate_limit_10k_tenants(benchmark, loaded_manager):
+    """测试 10k 租户各一次 check + record 的耗时（ops = 1e4 / mean）"""
+    manager, backend, tenants = loaded_manager
+
+    def run():
+        async def _run():
+            for tenant in tenants:
+                await manager.check_rate_limit(tenant)
+                await manager.record_api_call(tenant.id)
+
+        asyncio.run(_run())
+
+    benchmark(run)
+
+    # 内存与调用次数无关：每个租户一个计数器
+    assert len(backend) == TENANTS
+
+
+@pytest.mark.benchmark(group="quota-rate-limit")
+def test_rate_limit_single_hot_tenant(benchmark, loaded_manager):
+    """测试单个热点租户 1k 次 check + record 的耗时"""
+    manager, _, tenants = loaded_manager
+    tenant = tenants[0]
+
+    def run():
+        async def _run():
+            for _ in range(CALLS_PER_TENANT):
+                await manager.check_rate_limit(tenant)
+                await manager.record_api_call(tenant.id)
+
+        asyncio.run(_run())
+
+    benchmark(run)
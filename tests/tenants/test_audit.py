@@ -23,7 +23,7 @@ from lurkbot.tenants.audit.models import (
 )
 from lurkbot.tenants.audit.policy_tracker import PolicyTracker
 from lurkbot.tenants.audit.reports import ReportGenerator
-from lurkbot.tenants.audit.storage import MemoryAuditStorage
+from lurkbot.tenants.audit.storage import MemoryAuditStorage, SQLiteAuditStorage
 
 
 # ============================================================================
@@ -269,6 +269,246 @@ class TestMemoryAuditStorage:
         assert len(evaluations) == 3
 
 
+class TestSQLiteAuditStorage:
+    """SQLite 审计存储测试"""
+
+    @pytest.fixture
+    def sqlite_storage(self, tmp_path):
+        storage = SQLiteAuditStorage(tmp_path / "audit.db")
+        yield storage
+        storage.close()
+
+    @pytest.mark.asyncio
+    async def test_events_persist_across_reopen(self, tmp_path):
+        """测试事件在重新打开数据库后仍然存在"""
+        db_path = tmp_path / "audit.db"
+        storage = SQLiteAuditStorage(db_path)
+        await storage.save_events([
+            AuditEvent(
+                event_id=f"event-{i}",
+                event_type=AuditEventType.API_CALL,
+                action=f"action_{i}",
+                tenant_id="tenant-1",
+            )
+            for i in range(3)
+        ])
+        storage.close()
+
+        reopened = SQLiteAuditStorage(db_path)
+        try:
+            assert reopened.event_count == 3
+            event = await reopened.get_event("event-1")
+            assert event is not None
+            assert event.action == "action_1"
+            assert event.event_type == AuditEventType.API_CALL
+        finally:
+            reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_query_filters_and_ordering(self, sqlite_storage):
+        """测试过滤、排序和分页"""
+        now = datetime.now()
+        await sqlite_storage.save_events([
+            AuditEvent(
+                event_id="e1",
+                timestamp=now - timedelta(minutes=3),
+                event_type=AuditEventType.API_CALL,
+                severity=AuditSeverity.INFO,
+                action="Read_Document",
+                tenant_id="tenant-1",
+            ),
+            AuditEvent(
+                event_id="e2",
+                timestamp=now - timedelta(minutes=2),
+                event_type=AuditEventType.AUTH_FAILURE,
+                severity=AuditSeverity.ERROR,
+                action="login",
+                error_message="Bad Password",
+                tenant_id="tenant-1",
+            ),
+            AuditEvent(
+                event_id="e3",
+                timestamp=now - timedelta(minutes=1),
+                event_type=AuditEventType.API_CALL,
+                severity=AuditSeverity.WARNING,
+                action="write_document",
+                tenant_id="tenant-2",
+            ),
+        ])
+
+        events = await sqlite_storage.query_events(AuditQuery(tenant_ids=["tenant-1"]))
+        assert [e.event_id for e in events] == ["e2", "e1"]
+
+        events = await sqlite_storage.query_events(AuditQuery(action_pattern="DOCUMENT"))
+        assert {e.event_id for e in events} == {"e1", "e3"}
+
+        events = await sqlite_storage.query_events(AuditQuery(keyword="password"))
+        assert [e.event_id for e in events] == ["e2"]
+
+        events = await sqlite_storage.query_events(
+            AuditQuery(order_by="severity", order_desc=True, limit=2)
+        )
+        assert [e.event_id for e in events] == ["e2", "e3"]
+
+        events = await sqlite_storage.query_events(AuditQuery(order_desc=False, offset=1))
+        assert [e.event_id for e in events] == ["e2", "e3"]
+
+        count = await sqlite_storage.count_events(
+            AuditQuery(event_types=[AuditEventType.API_CALL], start_time=now - timedelta(minutes=2))
+        )
+        assert count == 1
+
+    @pytest.mark.asyncio
+    async def test_event_stats(self, sqlite_storage):
+        """测试 SQL 聚合统计"""
+        await sqlite_storage.save_events([
+            AuditEvent(
+                event_id="e1",
+                event_type=AuditEventType.API_CALL,
+                action="api_call",
+                user_id="u1",
+                session_id="s1",
+                resource_type=ResourceType.AGENT,
+            ),
+            AuditEvent(
+                event_id="e2",
+                event_type=AuditEventType.AUTH_FAILURE,
+                action="login",
+                result=AuditResult.FAILURE,
+                user_id="u2",
+            ),
+            AuditEvent(
+                event_id="e3",
+                event_type=AuditEventType.ACCESS_DENIED,
+                action="read",
+                result=AuditResult.DENIED,
+                user_id="u1",
+            ),
+            AuditEvent(
+                event_id="e4",
+                event_type=AuditEventType.CONFIG_UPDATE,
+                action="update",
+                tenant_id="tenant-2",
+            ),
+        ])
+
+        stats = await sqlite_storage.get_event_stats()
+
+        assert stats.total_events == 4
+        assert stats.success_events == 2
+        assert stats.failure_events == 1
+        assert stats.denied_events == 1
+        assert stats.security_events == 2
+        assert stats.auth_failures == 1
+        assert stats.access_denials == 1
+        assert stats.config_changes == 1
+        assert stats.unique_users == 2
+        assert stats.unique_sessions == 1
+        assert stats.by_event_type["api_call"] == 1
+        assert stats.by_resource_type == {ResourceType.AGENT.value: 1}
+        assert stats.by_result == {"success": 2, "failure": 1, "denied": 1}
+
+        tenant_stats = await sqlite_storage.get_event_stats(tenant_id="tenant-2")
+        assert tenant_stats.total_events == 1
+
+    @pytest.mark.asyncio
+    async def test_retention_deletes_old_partitions(self, sqlite_storage):
+        """测试保留期清理删除过期分区"""
+        now = datetime.now()
+        await sqlite_storage.save_events([
+            AuditEvent(
+                event_id=f"event-{days}",
+                timestamp=now - timedelta(days=days),
+                event_type=AuditEventType.API_CALL,
+                action="api_call",
+            )
+            for days in (0, 10, 40, 100)
+        ])
+        await sqlite_storage.save_policy_evaluations([
+            PolicyEvaluation(
+                evaluation_id="old",
+                timestamp=now - timedelta(days=45),
+                tenant_id="tenant-1",
+                action="read",
+                resource_type="document",
+                result=PolicyEvaluationResult.ALLOW,
+                matched_policies=["p1"],
+            ),
+        ])
+
+        events_deleted, evaluations_deleted = await sqlite_storage.cleanup_expired()
+
+        assert (events_deleted, evaluations_deleted) == (2, 1)
+        assert sqlite_storage.event_count == 2
+        assert sqlite_storage.evaluation_count == 0
+
+        deleted = await sqlite_storage.delete_events_before(now - timedelta(days=10, seconds=-1))
+        assert deleted == 1
+        assert await sqlite_storage.get_event("event-0") is not None
+
+    @pytest.mark.asyncio
+    async def test_policy_evaluation_stats(self, sqlite_storage):
+        """测试策略评估查询和统计"""
+        await sqlite_storage.save_policy_evaluations([
+            PolicyEvaluation(
+                evaluation_id="eval-1",
+                tenant_id="tenant-1",
+                action="read",
+                resource_type="document",
+                result=PolicyEvaluationResult.ALLOW,
+                matched_policies=["p1", "p2"],
+                evaluation_time_ms=2.0,
+            ),
+            PolicyEvaluation(
+                evaluation_id="eval-2",
+                tenant_id="tenant-1",
+                action="write",
+                resource_type="document",
+                result=PolicyEvaluationResult.DENY,
+                matched_policies=["p2"],
+                denial_code="FORBIDDEN",
+                evaluation_time_ms=4.0,
+            ),
+            PolicyEvaluation(
+                evaluation_id="eval-3",
+                tenant_id="tenant-1",
+                action="read",
+                resource_type="agent",
+                result=PolicyEvaluationResult.NOT_APPLICABLE,
+            ),
+        ])
+
+        evaluations = await sqlite_storage.query_policy_evaluations(
+            PolicyEvaluationQuery(policy_ids=["p2"], order_desc=False)
+        )
+        assert [e.evaluation_id for e in evaluations] == ["eval-1", "eval-2"]
+        assert evaluations[0].matched_policies == ["p1", "p2"]
+
+        stats = await sqlite_storage.get_policy_evaluation_stats(tenant_id="tenant-1")
+        assert stats.total_evaluations == 3
+        assert stats.allow_count == 1
+        assert stats.deny_count == 1
+        assert stats.not_applicable_count == 1
+        assert stats.by_policy == {"p1": 1, "p2": 2}
+        assert stats.by_action == {"read": 2, "write": 1}
+        assert stats.denial_reasons == {"FORBIDDEN": 1}
+        assert stats.avg_evaluation_time_ms == 3.0
+        assert stats.max_evaluation_time_ms == 4.0
+        assert stats.min_evaluation_time_ms == 2.0
+
+    @pytest.mark.asyncio
+    async def test_logger_flushes_batch(self, sqlite_storage):
+        """测试记录器批量写入"""
+        audit_logger = AuditLogger(storage=sqlite_storage, async_mode=True, batch_size=100)
+        for i in range(5):
+            await audit_logger.log_api_call(tenant_id="tenant-1", action=f"action_{i}")
+
+        assert sqlite_storage.event_count == 0
+        await audit_logger._flush()
+
+        assert sqlite_storage.event_count == 5
+
+
 # ============================================================================
 # 记录器测试
 # ============================================================================
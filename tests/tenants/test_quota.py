@@ -14,6 +14,7 @@ from lurkbot.tenants.quota import (
     QuotaManager,
     QuotaType,
 )
+from lurkbot.tenants.ratelimit import MemoryRateLimitBackend, RedisRateLimitBackend
 
 
 # ============================================================================
@@ -270,3 +271,137 @@ class TestUsageSummary:
         assert summary["agents"]["current"] == 2
         assert summary["agents"]["limit"] == 5
         assert summary["agents"]["percentage"] == 0.4
+
+
+# ============================================================================
+# 滑动窗口速率限制测试
+# ============================================================================
+
+
+class FakeClock:
+    """可手动推进的时钟"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """最小的 Redis 兼容异步客户端（仅实现速率限制用到的命令）"""
+
+    def __init__(self):
+        self.data: dict[str, int] = {}
+        self.ttls: dict[str, int] = {}
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+    async def mget(self, *keys):
+        return [str(self.data[k]).encode() if k in self.data else None for k in keys]
+
+    async def scan_iter(self, match: str):
+        prefix = match.rstrip("*")
+        for key in list(self.data):
+            if key.startswith(prefix):
+                yield key
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def incrby(self, key, amount):
+        self.ops.append(("incrby", key, amount))
+
+    def expire(self, key, ttl):
+        self.ops.append(("expire", key, ttl))
+
+    async def execute(self):
+        for op, key, value in self.ops:
+            if op == "incrby":
+                self.redis.data[key] = self.redis.data.get(key, 0) + value
+            else:
+                self.redis.ttls[key] = value
+        self.ops = []
+
+
+class TestSlidingWindowRateLimit:
+    """滑动窗口速率限制测试"""
+
+    @pytest.mark.asyncio
+    async def test_previous_window_decays(self, sample_tenant):
+        """测试上一窗口的调用随时间线性衰减"""
+        clock = FakeClock()
+        manager = QuotaManager(rate_limit_backend=MemoryRateLimitBackend(clock=clock))
+
+        for _ in range(30):
+            await manager.record_api_call("tenant-1")
+        assert (await manager.check_rate_limit(sample_tenant)).result == QuotaCheckResult.EXCEEDED
+
+        # 进入下一窗口的一半：上一窗口计 50%
+        clock.now += 90
+        result = await manager.check_rate_limit(sample_tenant)
+        assert result.current == 15
+        assert result.result == QuotaCheckResult.OK
+
+        # 两个窗口之后全部过期
+        clock.now += 60
+        assert (await manager.check_rate_limit(sample_tenant)).current == 0
+
+    @pytest.mark.asyncio
+    async def test_tenants_are_isolated(self, sample_tenant):
+        """测试租户计数互不影响"""
+        manager = QuotaManager()
+        for _ in range(5):
+            await manager.record_api_call("other-tenant")
+
+        assert (await manager.check_rate_limit(sample_tenant)).current == 0
+        summary = await manager.get_usage_summary(sample_tenant)
+        assert summary["api_calls_per_minute"]["current"] == 0
+
+    @pytest.mark.asyncio
+    async def test_memory_is_fixed_per_tenant(self):
+        """测试每个租户只占用一个计数器"""
+        backend = MemoryRateLimitBackend()
+        manager = QuotaManager(rate_limit_backend=backend)
+        for _ in range(1000):
+            await manager.record_api_call("tenant-1")
+
+        assert len(backend) == 1
+        await backend.reset("tenant-1")
+        assert len(backend) == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_backend_shared_between_managers(self, sample_tenant):
+        """测试 Redis 后端在多个副本间共享限额"""
+        redis = FakeRedis()
+        clock = FakeClock(now=6000.0)
+        replica_a = QuotaManager(rate_limit_backend=RedisRateLimitBackend(redis, clock=clock))
+        replica_b = QuotaManager(rate_limit_backend=RedisRateLimitBackend(redis, clock=clock))
+
+        for _ in range(20):
+            await replica_a.record_api_call("tenant-1")
+        for _ in range(10):
+            await replica_b.record_api_call("tenant-1")
+
+        assert (await replica_a.check_rate_limit(sample_tenant)).result == QuotaCheckResult.EXCEEDED
+        assert all(ttl == 120 for ttl in redis.ttls.values())
+
+        clock.now += 90
+        assert (await replica_b.check_rate_limit(sample_tenant)).current == 15
+
+        await replica_a._rate_limiter.reset("tenant-1")
+        assert redis.data == {}
@@ -581,3 +581,110 @@ class TestFileTenantStorage:
         events = await storage2.get_events(sample_tenant.id)
         assert len(events) == 1
         assert events[0].event_type == TenantEventType.TIER_CHANGED
+
+    @pytest.mark.asyncio
+    async def test_record_appends_single_line(self, tmp_path, sample_tenant):
+        """测试记录事件只追加一行，不重写历史"""
+        storage = FileTenantStorage(tmp_path)
+        await storage.create(sample_tenant)
+        for i in range(5):
+            await storage.record_event(
+                TenantEvent(
+                    tenant_id=sample_tenant.id,
+                    event_type=TenantEventType.UPDATED,
+                    message=f"event {i}",
+                )
+            )
+        await storage.close()
+
+        log_file = tmp_path / "events" / sample_tenant.id / "log.0.jsonl"
+        assert len(log_file.read_bytes().splitlines()) == 5
+        assert not (tmp_path / "events.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_compaction_into_snapshot(self, tmp_path, sample_tenant):
+        """测试日志超过阈值后压缩为快照"""
+        storage = FileTenantStorage(tmp_path, compact_threshold_bytes=1024)
+        await storage.create(sample_tenant)
+        for i in range(20):
+            await storage.record_event(
+                TenantEvent(
+                    tenant_id=sample_tenant.id,
+                    event_type=TenantEventType.UPDATED,
+                    message=f"event {i}",
+                )
+            )
+        await storage.close()
+
+        tenant_dir = tmp_path / "events" / sample_tenant.id
+        snapshots = sorted(p.name for p in tenant_dir.glob("snapshot.*.json"))
+        assert len(snapshots) == 1
+        assert len(list(tenant_dir.glob("log.*.jsonl"))) <= 1
+
+        reopened = FileTenantStorage(tmp_path)
+        events = await reopened.get_events(sample_tenant.id, limit=100)
+        assert len(events) == 20
+        assert {e.message for e in events} == {f"event {i}" for i in range(20)}
+
+    @pytest.mark.asyncio
+    async def test_usage_loaded_lazily_per_tenant(self, tmp_path, sample_tenant, sample_tenant_2):
+        """测试使用统计按租户懒加载"""
+        now = datetime.now()
+        storage1 = FileTenantStorage(tmp_path)
+        for tenant in (sample_tenant, sample_tenant_2):
+            await storage1.create(tenant)
+            await storage1.record_usage(
+                TenantUsage(
+                    tenant_id=tenant.id,
+                    period="daily",
+                    period_start=now,
+                    period_end=now + timedelta(days=1),
+                    total_tokens=100,
+                )
+            )
+        await storage1.close()
+
+        storage2 = FileTenantStorage(tmp_path)
+        await storage2.get(sample_tenant.id)
+        assert all(log.items is None for log in storage2._usage.values())
+
+        await storage2.get_usage(sample_tenant.id)
+        assert storage2._usage[sample_tenant.id].items is not None
+        assert sample_tenant_2.id not in storage2._usage
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_logs(self, tmp_path, sample_tenant):
+        """测试删除租户时删除日志"""
+        storage = FileTenantStorage(tmp_path, fsync_interval=0)
+        await storage.create(sample_tenant)
+        await storage.record_event(
+            TenantEvent(tenant_id=sample_tenant.id, event_type=TenantEventType.CREATED)
+        )
+
+        await storage.delete(sample_tenant.id)
+
+        assert not (tmp_path / "events" / sample_tenant.id).exists()
+        assert await storage.get_events(sample_tenant.id) == []
+
+    @pytest.mark.asyncio
+    async def test_migrates_legacy_files(self, tmp_path, sample_tenant):
+        """测试迁移旧版 usage.json / events.json"""
+        import json
+
+        event = TenantEvent(
+            tenant_id=sample_tenant.id,
+            event_type=TenantEventType.TIER_CHANGED,
+            old_value="free",
+            new_value="basic",
+        )
+        (tmp_path / "tenants.json").write_text(json.dumps([sample_tenant.model_dump(mode="json")]))
+        (tmp_path / "events.json").write_text(
+            json.dumps({sample_tenant.id: [event.model_dump(mode="json")]}, indent=2)
+        )
+
+        storage = FileTenantStorage(tmp_path)
+        events = await storage.get_events(sample_tenant.id)
+
+        assert [e.new_value for e in events] == ["basic"]
+        assert (tmp_path / "events.json.migrated").exists()
+        assert not (tmp_path / "events.json").exists()
@@ -0,0 +1,80 @@
+"""Tests for the reusable agent pool."""
+
+import pytest
+from pydantic_ai.messages import ModelMessage, ModelResponse, SystemPromptPart, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from lurkbot.agents import AgentContext, AgentDependencies, AgentPool
+
+
+@pytest.fixture(autouse=True)
+def api_keys(monkeypatch):
+    monkeypatch.setenv("DEEPSEEK_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+
+class TestAgentPool:
+    """Tests for AgentPool."""
+
+    def test_reuses_agent_for_same_key(self):
+        """The same provider/model returns the pooled agent."""
+        pool = AgentPool(max_size=4)
+
+        first = pool.get_agent("deepseek", "deepseek-chat")
+        second = pool.get_agent("DeepSeek", "deepseek-chat")
+
+        assert first is second
+        assert pool.stats.hits == 1
+        assert pool.stats.misses == 1
+        assert len(pool) == 1
+
+    def test_shares_provider_across_models(self):
+        """Models on the same endpoint share one provider and HTTP client."""
+        pool = AgentPool(max_size=4)
+
+        chat = pool.get_agent("deepseek", "deepseek-chat")
+        reasoner = pool.get_agent("deepseek", "deepseek-reasoner")
+
+        assert chat is not reasoner
+        assert chat.model.client is reasoner.model.client
+        assert pool.get_stats()["providers"] == 1
+
+    def test_lru_eviction(self):
+        """The least recently used agent is evicted past max_size."""
+        pool = AgentPool(max_size=2)
+
+        a = pool.get_agent("openai", "gpt-4o")
+        pool.get_agent("openai", "gpt-4o-mini")
+        pool.get_agent("openai", "gpt-4o")  # touch a
+        pool.get_agent("openai", "gpt-4-turbo")  # evicts gpt-4o-mini
+
+        assert len(pool) == 2
+        assert pool.stats.evictions == 1
+        assert pool.get_agent("openai", "gpt-4o") is a
+        pool.get_agent("openai", "gpt-4o-mini")
+        assert pool.stats.misses == 4
+
+    def test_invalid_size(self):
+        """max_size must be positive."""
+        with pytest.raises(ValueError):
+            AgentPool(max_size=0)
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_from_deps(self):
+        """Each run uses the system prompt passed in its dependencies."""
+        pool = AgentPool()
+        agent = pool.get_agent("openai", "gpt-4o")
+        seen: list[str] = []
+
+        def respond(messages: list[ModelMessage], _info: AgentInfo) -> ModelResponse:
+            for part in messages[0].parts:
+                if isinstance(part, SystemPromptPart):
+                    seen.append(part.content)
+            return ModelResponse(parts=[TextPart("ok")])
+
+        context = AgentContext(session_id="s1")
+        with agent.override(model=FunctionModel(respond)):
+            await agent.run("hi", deps=AgentDependencies(context=context, system_prompt="A"))
+            await agent.run("hi", deps=AgentDependencies(context=context, system_prompt="B"))
+
+        assert seen == ["A", "B"]
@@ -654,6 +654,52 @@ Another section about JavaScript.
         assert len(results) > 0
         assert any("notes.md" in r.path for r in results)
 
+    @pytest.mark.asyncio
+    async def test_search_index_tracks_file_changes(self, tmp_path: Path) -> None:
+        memory_file = tmp_path / "MEMORY.md"
+        memory_file.write_text("Deploy checklist for the gateway")
+
+        config = MemorySearchConfig(root_dir=str(tmp_path))
+        manager = MemoryManager(config)
+        assert (await manager.search("gateway"))[0].path == "MEMORY.md"
+
+        memory_file.write_text("Rotate database credentials monthly\n\n部署网关服务")
+        assert await manager.search("gateway") == []
+        results = await manager.search("网关")
+        assert results[0].line_start == 3
+
+        # A new manager loads the persisted index
+        assert (tmp_path / ".lurkbot" / "memory-index.json").exists()
+        reloaded = MemoryManager(MemorySearchConfig(root_dir=str(tmp_path)))
+        assert (await reloaded.search("credentials"))[0].line_start == 1
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search(self, tmp_path: Path) -> None:
+        from lurkbot.memory import HashingEmbedder
+
+        calls: list[list[str]] = []
+        hashing = HashingEmbedder(dim=64)
+
+        def embedder(texts: list[str]):
+            calls.append(texts)
+            return hashing(texts)
+
+        (tmp_path / "MEMORY.md").write_text(
+            "Deploy checklist for the gateway\n\nQuarterly budget review\n\n部署网关服务"
+        )
+        manager = MemoryManager(MemorySearchConfig(root_dir=str(tmp_path)), embedder=embedder)
+        assert manager.status()["mode"] == "hybrid"
+
+        results = await manager.search("gateway deploy")
+        assert results[0].content == "Deploy checklist for the gateway"
+        assert 0 < results[0].score <= 1.0
+        assert (tmp_path / ".lurkbot" / "memory-vectors.f32").exists()
+
+        # Unchanged sections are not re-embedded; only the query is
+        calls.clear()
+        await manager.search("budget")
+        assert calls == [["budget"]]
+
     @pytest.mark.asyncio
     async def test_read_file_success(self, tmp_path: Path) -> None:
         memory_file = tmp_path / "MEMORY.md"
@@ -756,8 +802,13 @@ class TestMemoryGetTool:
 # Tests for web_tools.py
 # =============================================================================
 
+import httpx
+
+from lurkbot.tools.builtin import web_tools
 from lurkbot.tools.builtin.web_tools import (
     SearchResult,
+    SingleFlight,
+    WebCache,
     WebFetchConfig,
     WebSearchConfig,
     _search_mock,
@@ -799,6 +850,69 @@ class TestCaching:
         assert result is None
 
 
+class TestWebCache:
+    """Tests for the bounded web cache."""
+
+    def test_lru_eviction_by_bytes(self) -> None:
+        entry_size = len(web_tools.json_utils.dumps_bytes({"v": "x" * 100}))
+        cache = WebCache(max_bytes=entry_size * 2)
+        cache.put("a", {"v": "x" * 100}, ttl_seconds=60)
+        cache.put("b", {"v": "x" * 100}, ttl_seconds=60)
+        assert cache.get("a") is not None  # touch a
+        cache.put("c", {"v": "x" * 100}, ttl_seconds=60)  # evicts b
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.total_bytes <= cache.max_bytes
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_stale_entries(self) -> None:
+        cache = WebCache()
+        cache.put("plain", {"v": 1}, ttl_seconds=-1)
+        cache.put("validated", {"v": 2}, ttl_seconds=-1, etag='"abc"')
+
+        assert cache.get("plain") is None
+        assert len(cache) == 1  # expired entry without validators is dropped
+        assert cache.get("validated") is None
+        entry = cache.get_entry("validated")
+        assert entry is not None and entry.etag == '"abc"'
+
+        cache.refresh("validated", entry, ttl_seconds=60)
+        assert cache.get("validated") == {"v": 2}
+
+    def test_disk_tier(self, tmp_path: Path) -> None:
+        cache = WebCache(disk_dir=tmp_path)
+        cache.put("k", {"content": "persisted"}, ttl_seconds=60, last_modified="Mon")
+
+        reopened = WebCache(disk_dir=tmp_path)
+        assert reopened.get("k") == {"content": "persisted"}
+        assert reopened.get_entry("k").last_modified == "Mon"
+
+        reopened.clear()
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self) -> None:
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def work() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 42
+
+        tasks = [asyncio.create_task(flight.do("k", work)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert len(flight) == 1
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [42] * 5
+        assert calls == 1
+        assert len(flight) == 0
+
+
 class TestHtmlToMarkdown:
     """Tests for HTML to Markdown conversion."""
 
@@ -942,6 +1056,41 @@ class TestWebFetchTool:
         result = await web_fetch_tool({"url": "not a url"})
         assert "error" in result.details
 
+    @pytest.mark.asyncio
+    async def test_fetch_revalidates_with_etag(self, monkeypatch) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/html", "etag": '"v1"'},
+                text="<p>Hello</p>",
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(web_tools, "_get_http_client", lambda *args: client)
+        monkeypatch.setattr(web_tools, "_fetch_cache", WebCache())
+        config = WebFetchConfig(cache_ttl_minutes=0)
+
+        # Concurrent fetches of one URL share a single request
+        first, second = await asyncio.gather(
+            web_fetch_tool({"url": "https://example.com/page"}, config=config),
+            web_fetch_tool({"url": "https://example.com/page"}, config=config),
+        )
+        assert len(requests) == 1
+        assert first.details["content"] == second.details["content"] == "Hello"
+
+        # The entry is already stale (TTL 0) and is revalidated with a 304
+        revalidated = await web_fetch_tool({"url": "https://example.com/page"}, config=config)
+        assert len(requests) == 2
+        assert requests[1].headers["if-none-match"] == '"v1"'
+        assert revalidated.details["revalidated"] is True
+        assert revalidated.details["content"] == "Hello"
+        await client.aclose()
+
 
 # =============================================================================
 # Tests for message_tool.py
@@ -0,0 +1,162 @@
+"""Tests for the non-blocking context storage layer."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from lurkbot.agents.context.async_storage import AsyncContextStorage
+
+
+class FakeStorage:
+    """Synchronous stand-in for ContextStorage that records calls."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batches: list[list[dict]] = []
+        self.threads: set[str] = set()
+        self.fail = False
+
+    def save_contexts_batch(self, contexts):
+        self.threads.add(threading.current_thread().name)
+        if self.fail:
+            raise RuntimeError("storage down")
+        time.sleep(self.delay)
+        self.batches.append(list(contexts))
+
+    def query_raw(self, query_texts=None, query_embeddings=None, n_results=5, where=None):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return {"documents": [[]], "metadatas": [[]], "distances": [[]]}
+
+    def delete_session_contexts(self, session_id):
+        pass
+
+
+def _ctx(i: int, session_id: str = "s1") -> dict:
+    return {
+        "context_id": f"ctx_{i}",
+        "text": f"message {i}",
+        "metadata": {"session_id": session_id, "user_id": "u1"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_query_does_not_block_event_loop():
+    """Blocking queries run in the thread pool while the loop keeps ticking."""
+    storage = FakeStorage(delay=0.2)
+    async_storage = AsyncContextStorage(storage, max_workers=2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    await asyncio.gather(
+        async_storage.query_raw(query_texts=["a"]),
+        async_storage.query_raw(query_texts=["b"]),
+    )
+    task.cancel()
+    await async_storage.close()
+
+    assert ticks >= 10
+    assert all(name.startswith("context-storage") for name in storage.threads)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_coalesces_into_one_batch():
+    """Many queued interactions are written with a single batch call."""
+    storage = FakeStorage()
+    async_storage = AsyncContextStorage(storage, flush_interval=0.05)
+
+    for i in range(10):
+        await async_storage.enqueue([_ctx(2 * i), _ctx(2 * i + 1)])
+
+    assert async_storage.queue_depth == 20
+    await asyncio.sleep(0.15)
+
+    assert len(storage.batches) == 1
+    assert len(storage.batches[0]) == 20
+    metrics = async_storage.get_metrics()
+    assert metrics["queue_depth"] == 0
+    assert metrics["max_queue_depth"] == 20
+    assert metrics["flush_count"] == 1
+    assert metrics["avg_batch_size"] == 20
+    await async_storage.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_size_triggers_early_flush():
+    """Reaching max_batch_size wakes the writer before the interval."""
+    storage = FakeStorage()
+    async_storage = AsyncContextStorage(storage, flush_interval=10, max_batch_size=4)
+
+    await async_storage.enqueue([_ctx(i) for i in range(4)])
+    await asyncio.sleep(0.05)
+
+    assert len(storage.batches) == 1
+    await async_storage.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_flushes_inline():
+    """Producers flush inline once max_queue_size is reached."""
+    storage = FakeStorage()
+    async_storage = AsyncContextStorage(
+        storage, flush_interval=10, max_batch_size=100, max_queue_size=3
+    )
+
+    await async_storage.enqueue([_ctx(i) for i in range(3)])
+
+    assert len(storage.batches) == 1
+    assert async_storage.queue_depth == 0
+    await async_storage.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_retried():
+    """A failed batch is kept and written by the next flush."""
+    storage = FakeStorage()
+    storage.fail = True
+    async_storage = AsyncContextStorage(storage, flush_interval=10)
+
+    await async_storage.enqueue([_ctx(1)])
+    with pytest.raises(RuntimeError):
+        await async_storage.flush()
+    assert async_storage.queue_depth == 1
+    assert async_storage.stats.failed_flushes == 1
+
+    storage.fail = False
+    assert await async_storage.flush() == 1
+    await async_storage.close()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_writes():
+    """Closing writes everything still queued."""
+    storage = FakeStorage()
+    async_storage = AsyncContextStorage(storage, flush_interval=10)
+
+    await async_storage.enqueue([_ctx(1), _ctx(2)])
+    await async_storage.close()
+
+    assert [len(b) for b in storage.batches] == [2]
+    with pytest.raises(RuntimeError):
+        await async_storage.enqueue([_ctx(3)])
+
+
+@pytest.mark.asyncio
+async def test_delete_session_drops_queued_writes():
+    """Deleting a session also removes its queued contexts."""
+    storage = FakeStorage()
+    async_storage = AsyncContextStorage(storage, flush_interval=10)
+
+    await async_storage.enqueue([_ctx(1, "s1"), _ctx(2, "s2")])
+    await async_storage.delete_session_contexts("s1")
+    await async_storage.close()
+
+    assert [c["context_id"] for c in storage.batches[0]] == ["ctx_2"]
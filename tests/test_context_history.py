@@ -0,0 +1,169 @@
+"""Tests for the chronological context history index."""
+
+import pytest
+
+from lurkbot.agents.context.history import ContextHistoryIndex
+from lurkbot.agents.context.retrieval import MAX_TIME_RANGE_IDS, ContextRetrieval
+
+
+def _meta(context_id: str, session_id: str, user_id: str, timestamp: float, **extra) -> dict:
+    return {
+        "context_id": context_id,
+        "session_id": session_id,
+        "user_id": user_id,
+        "timestamp": timestamp,
+        "context_type": extra.get("context_type", "user_message"),
+        "message_role": "user",
+        "has_tool_call": bool(extra.get("tool_names")),
+        "tool_names": extra.get("tool_names", ""),
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ContextHistoryIndex(tmp_path / "history.db")
+    index.add_many(
+        (f"text {i}", _meta(f"c{i}", f"s{i % 2}", "u1", 100.0 + i)) for i in range(10)
+    )
+    index.add("other user", _meta("x1", "s9", "u2", 50.0, tool_names="exec,read"))
+    yield index
+    index.close()
+
+
+class FakeStorage:
+    """Storage stub that records the filters passed to ChromaDB."""
+
+    def __init__(self, history: ContextHistoryIndex):
+        self.history = history
+        self.queries: list[dict] = []
+
+    def query_raw(self, query_texts=None, query_embeddings=None, n_results=5, where=None):
+        self.queries.append({"query_texts": query_texts, "where": where})
+        return {"documents": [[]], "metadatas": [[]], "distances": [[]]}
+
+
+class TestContextHistoryIndex:
+    """Tests for ContextHistoryIndex."""
+
+    def test_recent_for_session_newest_first(self, index):
+        """Session history returns the newest records, not the nearest."""
+        records = index.recent_for_session("s0", limit=3)
+
+        assert [r.context_id for r in records] == ["c8", "c6", "c4"]
+        assert records[0].text == "text 8"
+
+    def test_recent_for_user_with_time_range(self, index):
+        """User lookups filter by time range inside the index."""
+        records = index.recent_for_user("u1", limit=20, time_range=(102.0, 105.0))
+
+        assert [r.context_id for r in records] == ["c5", "c4", "c3", "c2"]
+
+    def test_tool_names_round_trip(self, index):
+        """Tool names are restored as a list."""
+        (record,) = index.recent_for_user("u2")
+
+        assert record.has_tool_call
+        assert record.tool_names == ["exec", "read"]
+
+    def test_ids_in_range(self, index):
+        """ID lookups combine time range and metadata filters."""
+        ids = index.ids_in_range((100.0, 104.0), user_id="u1", session_id="s1")
+
+        assert ids == ["c3", "c1"]
+        assert index.ids_in_range((0.0, 1.0)) == []
+
+    def test_upsert_and_delete(self, index):
+        """Re-adding an ID replaces it; deletes remove records."""
+        index.add("updated", _meta("c9", "s1", "u1", 200.0))
+        assert index.recent_for_session("s1", limit=1)[0].text == "updated"
+        assert index.count() == 11
+
+        index.delete(["c9"])
+        index.delete_session("s0")
+        index.delete_user("u2")
+
+        assert index.count() == 4
+
+    def test_persistence(self, tmp_path):
+        """The index survives reopening."""
+        path = tmp_path / "persist.db"
+        first = ContextHistoryIndex(path)
+        first.add("hello", _meta("c1", "s1", "u1", 1.0))
+        first.close()
+
+        second = ContextHistoryIndex(path)
+        assert [r.text for r in second.recent_for_session("s1")] == ["hello"]
+        second.close()
+
+
+class TestRetrievalUsesIndex:
+    """ContextRetrieval recency and time-range lookups go through the index."""
+
+    def test_session_history_skips_vector_search(self, index):
+        """Session history never queries ChromaDB."""
+        storage = FakeStorage(index)
+        retrieval = ContextRetrieval(storage)
+
+        history = retrieval.get_session_history("s1", limit=2)
+
+        assert [r.context_id for r in history] == ["c9", "c7"]
+        assert storage.queries == []
+
+    def test_user_contexts_skip_vector_search(self, index):
+        """User context lookups never query ChromaDB."""
+        storage = FakeStorage(index)
+        retrieval = ContextRetrieval(storage)
+
+        records = retrieval.get_user_contexts("u1", limit=2, time_range=(100.0, 101.0))
+
+        assert [r.context_id for r in records] == ["c1", "c0"]
+        assert storage.queries == []
+
+    def test_time_range_becomes_id_filter(self, index):
+        """Time ranges are resolved to candidate IDs before the ANN query."""
+        storage = FakeStorage(index)
+        retrieval = ContextRetrieval(storage)
+
+        retrieval.find_relevant_contexts("q", user_id="u1", time_range=(108.0, 200.0))
+
+        assert storage.queries[0]["where"] == {"context_id": {"$in": ["c9", "c8"]}}
+
+    def test_empty_time_range_skips_query(self, index):
+        """An empty time range returns without querying ChromaDB."""
+        storage = FakeStorage(index)
+        retrieval = ContextRetrieval(storage)
+
+        assert retrieval.find_relevant_contexts("q", time_range=(0.0, 1.0)) == []
+        assert storage.queries == []
+
+    def test_wide_time_range_uses_metadata_filter(self, tmp_path):
+        """Ranges with too many candidates fall back to a timestamp filter."""
+        index = ContextHistoryIndex(tmp_path / "wide.db")
+        index.add_many(
+            (f"t{i}", _meta(f"c{i}", "s1", "u1", float(i)))
+            for i in range(MAX_TIME_RANGE_IDS + 5)
+        )
+        storage = FakeStorage(index)
+        retrieval = ContextRetrieval(storage)
+
+        retrieval.find_relevant_contexts("q", user_id="u1", time_range=(0.0, 1e9))
+
+        assert storage.queries[0]["where"] == {
+            "$and": [
+                {"user_id": "u1"},
+                {"timestamp": {"$gte": 0.0}},
+                {"timestamp": {"$lte": 1e9}},
+            ]
+        }
+        index.close()
+
+    def test_multiple_filters_are_combined(self, index):
+        """Several metadata filters are combined with $and."""
+        storage = FakeStorage(index)
+        retrieval = ContextRetrieval(storage)
+
+        retrieval.find_relevant_contexts("q", user_id="u1", session_id="s1")
+
+        assert storage.queries[0]["where"] == {
+            "$and": [{"user_id": "u1"}, {"session_id": "s1"}]
+        }
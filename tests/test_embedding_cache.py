@@ -0,0 +1,174 @@
+"""Tests for the content-hash keyed embedding cache."""
+
+import zlib
+
+import numpy as np
+import pytest
+
+from lurkbot.agents.context.storage import ContextStorage
+from lurkbot.memory import EmbeddingCache
+
+DIM = 16
+
+
+class CountingEmbedder:
+    """Deterministic bag-of-words embedder that counts embedded texts."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        vectors = []
+        for text in texts:
+            vec = np.zeros(DIM, dtype=np.float32)
+            for word in text.lower().split():
+                vec[zlib.crc32(word.encode()) % DIM] += 1.0
+            vec[0] += 0.01  # never all-zero
+            vectors.append(vec.tolist())
+        return vectors
+
+    @property
+    def embedded(self) -> int:
+        return sum(len(call) for call in self.calls)
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_repeated_texts_hit_cache(self):
+        """Repeated content is embedded once, even within one batch."""
+        embedder = CountingEmbedder()
+        cache = EmbeddingCache(embedder)
+
+        first = cache.embed(["hello world", "foo", "hello world"])
+        second = cache.embed(["foo"])
+
+        assert embedder.calls == [["hello world", "foo"]]
+        assert np.array_equal(first[0], first[2])
+        assert np.array_equal(first[1], second[0])
+        assert first[0].dtype == np.float32
+        stats = cache.get_stats()
+        assert stats["misses"] == 2
+        assert stats["hits"] == 1
+        assert stats["memory_bytes"] == 2 * DIM * 4
+
+    def test_namespace_is_part_of_key(self):
+        """Different embedders never share vectors."""
+        embedder = CountingEmbedder()
+        a = EmbeddingCache(embedder, namespace="a")
+        b = EmbeddingCache(embedder, namespace="b", cache_dir=None)
+
+        a.embed(["x"])
+        b.embed(["x"])
+
+        assert embedder.embedded == 2
+
+    def test_lru_eviction(self):
+        """The least recently used vector is evicted first."""
+        embedder = CountingEmbedder()
+        cache = EmbeddingCache(embedder, max_entries=2)
+
+        cache.embed(["a"])
+        cache.embed(["b"])
+        cache.embed(["a"])  # touch a
+        cache.embed(["c"])  # evicts b
+        cache.embed(["a"])
+
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+        assert embedder.embedded == 3
+        assert cache.stats.memory_bytes == 2 * DIM * 4
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Vectors written to disk are reused by a new cache instance."""
+        embedder = CountingEmbedder()
+        cache = EmbeddingCache(embedder, namespace="m", cache_dir=tmp_path)
+        original = cache.embed(["persist me", "and me"])
+        cache.close()
+
+        reopened = EmbeddingCache(embedder, namespace="m", cache_dir=tmp_path)
+        restored = reopened.embed(["and me", "persist me"])
+
+        assert embedder.embedded == 2
+        assert np.array_equal(restored[1], original[0])
+        assert reopened.stats.disk_hits == 2
+        assert reopened.get_stats()["disk_bytes"] == 2 * DIM * 4
+
+        # New vectors are appended and readable after further writes
+        reopened.embed(["third"])
+        reopened.clear()
+        assert np.array_equal(reopened.embed(["and me"])[0], original[1])
+
+    def test_disk_tier_resets_for_other_namespace(self, tmp_path):
+        """A store written by another embedder is discarded."""
+        embedder = CountingEmbedder()
+        EmbeddingCache(embedder, namespace="old", cache_dir=tmp_path).embed(["x"])
+
+        cache = EmbeddingCache(embedder, namespace="new", cache_dir=tmp_path)
+
+        assert cache.get_stats()["disk_bytes"] == 0
+        cache.embed(["x"])
+        assert embedder.embedded == 2
+
+    def test_torn_write_is_ignored(self, tmp_path):
+        """A partially written trailing row is dropped on load."""
+        embedder = CountingEmbedder()
+        EmbeddingCache(embedder, namespace="m", cache_dir=tmp_path).embed(["a", "b"])
+        with open(tmp_path / "vectors.f32", "ab") as f:
+            f.write(b"\x00" * 10)
+
+        cache = EmbeddingCache(embedder, namespace="m", cache_dir=tmp_path)
+        cache.embed(["c"])
+        cache.clear()
+
+        assert len(cache.embed(["a", "b", "c"])) == 3
+        assert embedder.embedded == 3
+
+
+class TestContextStorageEmbeddingCache:
+    """ContextStorage embeds through the cache."""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        embedder = CountingEmbedder()
+        storage = ContextStorage(
+            str(tmp_path / "chroma"), embedding_cache=EmbeddingCache(embedder, namespace="test")
+        )
+        return storage, embedder
+
+    def test_save_after_query_reuses_vector(self, storage):
+        """Saving a text that was just used as a query does not re-embed it."""
+        storage, embedder = storage
+        prompt = "what is the weather in paris"
+
+        storage.query_raw(query_texts=[prompt], n_results=1)
+        storage.save_contexts_batch(
+            [
+                {
+                    "context_id": "c1",
+                    "text": prompt,
+                    "metadata": {"context_id": "c1", "session_id": "s1", "user_id": "u1"},
+                },
+                {
+                    "context_id": "c2",
+                    "text": "it is sunny",
+                    "metadata": {"context_id": "c2", "session_id": "s1", "user_id": "u1"},
+                },
+            ]
+        )
+
+        assert embedder.calls == [[prompt], ["it is sunny"]]
+        assert storage.embedding_cache.stats.hits == 1
+
+    def test_query_finds_saved_context(self, storage):
+        """Cached embeddings are used for both documents and queries."""
+        storage, _ = storage
+        storage.save_context(
+            "c1", "python programming language", {"session_id": "s1", "user_id": "u1"}
+        )
+        storage.save_context("c2", "cooking pasta recipe", {"session_id": "s1", "user_id": "u1"})
+
+        results = storage.query_raw(query_texts=["python programming"], n_results=1)
+
+        assert results["documents"][0] == ["python programming language"]
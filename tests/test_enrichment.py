@@ -0,0 +1,102 @@
+"""Tests for the pre-LLM enrichment pipeline."""
+
+import asyncio
+import time
+
+import pytest
+
+from lurkbot.agents import EnrichmentPipeline
+
+
+async def _sleep_then(value, delay: float):
+    await asyncio.sleep(delay)
+    return value
+
+
+class TestEnrichmentPipeline:
+    """Tests for EnrichmentPipeline."""
+
+    @pytest.mark.asyncio
+    async def test_stages_run_concurrently(self):
+        """Total wall time is bounded by the slowest stage, not the sum."""
+        pipeline = EnrichmentPipeline(budget_ms=2000)
+        pipeline.add_stage("a", lambda: _sleep_then("A", 0.1))
+        pipeline.add_stage("b", lambda: _sleep_then("B", 0.1))
+        pipeline.add_stage("c", lambda: _sleep_then("C", 0.1))
+
+        start = time.perf_counter()
+        outcome = await pipeline.run()
+        elapsed = time.perf_counter() - start
+
+        assert outcome.results == {"a": "A", "b": "B", "c": "C"}
+        assert elapsed < 0.25
+        assert [t.name for t in outcome.timings] == ["a", "b", "c"]
+        assert all(t.status == "ok" for t in outcome.timings)
+        assert all(t.duration_ms >= 90 for t in outcome.timings)
+
+    @pytest.mark.asyncio
+    async def test_slow_stage_is_cancelled(self):
+        """Stages missing the budget are cancelled and skipped."""
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        pipeline = EnrichmentPipeline(budget_ms=50)
+        pipeline.add_stage("fast", lambda: _sleep_then("ok", 0))
+        pipeline.add_stage("slow", slow)
+
+        start = time.perf_counter()
+        outcome = await pipeline.run()
+
+        assert time.perf_counter() - start < 1
+        assert cancelled.is_set()
+        assert outcome.get("fast") == "ok"
+        assert outcome.get("slow") is None
+        assert outcome.skipped == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_failed_stage_is_reported(self):
+        """A failing stage does not affect the others."""
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        pipeline = EnrichmentPipeline(budget_ms=1000)
+        pipeline.add_stage("boom", boom)
+        pipeline.add_stage("ok", lambda: _sleep_then(1, 0))
+
+        outcome = await pipeline.run()
+
+        assert outcome.results == {"ok": 1}
+        timing = outcome.timings[0]
+        assert timing.status == "error"
+        assert timing.error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_dependency(self):
+        """A stage can await another stage's result."""
+        pipeline = EnrichmentPipeline(budget_ms=1000)
+
+        async def dependent():
+            upstream = await pipeline.wait_for("upstream")
+            missing = await pipeline.wait_for("missing")
+            return (upstream, missing)
+
+        pipeline.add_stage("upstream", lambda: _sleep_then("value", 0.05))
+        pipeline.add_stage("dependent", dependent)
+
+        outcome = await pipeline.run()
+
+        assert outcome.get("dependent") == ("value", None)
+
+    def test_duplicate_stage_rejected(self):
+        """Stage names must be unique."""
+        pipeline = EnrichmentPipeline()
+        pipeline.add_stage("a", lambda: _sleep_then(1, 0))
+        with pytest.raises(ValueError):
+            pipeline.add_stage("a", lambda: _sleep_then(2, 0))
@@ -0,0 +1,119 @@
+"""Tests for the BM25 memory section index."""
+
+import os
+
+from lurkbot.memory import MemoryIndex, split_sections, tokenize
+
+
+def _write(path, text, mtime_ns=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _files(root):
+    return sorted((root / "memory").glob("**/*.md"))
+
+
+class TestTokenize:
+    """Tests for CJK-aware tokenization."""
+
+    def test_words_are_lowercased(self):
+        assert tokenize("Deploy the API-Gateway v2") == ["deploy", "the", "api", "gateway", "v2"]
+
+    def test_cjk_runs_become_bigrams(self):
+        assert tokenize("项目进度") == ["项目", "目进", "进度"]
+        assert tokenize("猫 and 狗") == ["猫", "and", "狗"]
+
+    def test_mixed_script(self):
+        assert tokenize("部署Gateway服务") == ["部署", "gateway", "服务"]
+
+
+def test_split_sections_line_numbers():
+    lines = ["# Title", "", "first para", "continued", "", "", "last"]
+
+    assert split_sections(lines) == [
+        (1, 1, "# Title"),
+        (3, 4, "first para\ncontinued"),
+        (7, 7, "last"),
+    ]
+
+
+class TestMemoryIndex:
+    """Tests for MemoryIndex."""
+
+    def test_bm25_ranks_rarer_terms_higher(self, tmp_path):
+        _write(
+            tmp_path / "memory" / "a.md",
+            "deploy the gateway\n\ndeploy the worker\n\nrotate the database password",
+        )
+        index = MemoryIndex(tmp_path)
+        index.refresh(_files(tmp_path))
+
+        results = index.search("deploy database", limit=3)
+
+        assert [s.content for s, _ in results][0] == "rotate the database password"
+        assert len(results) == 3
+        assert all(0 < score <= 1 for _, score in results)
+        assert results[0][0].line_start == 5
+
+    def test_chinese_search(self, tmp_path):
+        _write(tmp_path / "memory" / "notes.md", "周一开会讨论项目进度\n\n周五提交报告")
+        index = MemoryIndex(tmp_path)
+        index.refresh(_files(tmp_path))
+
+        results = index.search("项目进度", limit=5)
+
+        assert [s.content for s, _ in results] == ["周一开会讨论项目进度"]
+
+    def test_refresh_only_rereads_changed_files(self, tmp_path):
+        _write(tmp_path / "memory" / "a.md", "alpha notes", mtime_ns=1_000_000_000)
+        _write(tmp_path / "memory" / "b.md", "beta notes", mtime_ns=1_000_000_000)
+        index = MemoryIndex(tmp_path)
+
+        assert index.refresh(_files(tmp_path)) is True
+        assert index.refresh(_files(tmp_path)) is False
+
+        _write(tmp_path / "memory" / "a.md", "gamma notes", mtime_ns=2_000_000_000)
+        (tmp_path / "memory" / "b.md").unlink()
+        assert index.refresh(_files(tmp_path)) is True
+
+        assert index.search("alpha") == []
+        assert index.search("beta") == []
+        assert [s.path for s, _ in index.search("gamma")] == [os.path.join("memory", "a.md")]
+        assert index.get_stats()["files"] == 1
+        assert len(index) == 1
+
+    def test_section_ids_are_compacted(self, tmp_path):
+        path = tmp_path / "memory" / "a.md"
+        index = MemoryIndex(tmp_path)
+        for i in range(40):
+            _write(path, "\n\n".join(f"note {i} {j}" for j in range(50)), mtime_ns=i * 10**9)
+            index.refresh(_files(tmp_path))
+
+        assert len(index) == 50
+        assert index._next_id <= 2 * len(index) + 1024
+        assert index.search("39")[0][0].content.startswith("note 39")
+
+    def test_index_is_persisted(self, tmp_path):
+        index_path = tmp_path / ".lurkbot" / "memory-index.json"
+        _write(tmp_path / "memory" / "a.md", "persisted memory about kubernetes")
+        MemoryIndex(tmp_path, index_path=index_path).refresh(_files(tmp_path))
+
+        reopened = MemoryIndex(tmp_path, index_path=index_path)
+
+        assert len(reopened) == 1
+        assert reopened.refresh(_files(tmp_path)) is False
+        assert reopened.search("kubernetes")[0][0].content == "persisted memory about kubernetes"
+
+    def test_corrupt_index_is_rebuilt(self, tmp_path):
+        index_path = tmp_path / "index.json"
+        index_path.write_text("{not json")
+        _write(tmp_path / "memory" / "a.md", "recoverable")
+
+        index = MemoryIndex(tmp_path, index_path=index_path)
+
+        assert len(index) == 0
+        assert index.refresh(_files(tmp_path)) is True
+        assert MemoryIndex(tmp_path, index_path=index_path).search("recoverable")
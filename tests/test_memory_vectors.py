@@ -0,0 +1,124 @@
+"""Tests for the section embedding index used by hybrid memory search."""
+
+import numpy as np
+
+from lurkbot.memory import (
+    HashingEmbedder,
+    MemoryIndex,
+    SectionVectorIndex,
+    reciprocal_rank_fusion,
+)
+
+
+class CountingEmbedder:
+    """Hashing embedder that records every embedded text."""
+
+    def __init__(self):
+        self.embedder = HashingEmbedder(dim=64)
+        self.texts: list[str] = []
+
+    def __call__(self, texts: list[str]) -> list[np.ndarray]:
+        self.texts.extend(texts)
+        return self.embedder(texts)
+
+
+def _index(root, files: dict[str, str]) -> MemoryIndex:
+    index = MemoryIndex(root)
+    _update(index, files)
+    return index
+
+
+def _update(index: MemoryIndex, files: dict[str, str]) -> None:
+    memory_dir = index.root / "memory"
+    memory_dir.mkdir(parents=True, exist_ok=True)
+    for path in memory_dir.glob("*.md"):
+        if path.name not in files:
+            path.unlink()
+    for name, text in files.items():
+        (memory_dir / name).write_text(text, encoding="utf-8")
+    index.refresh(sorted(memory_dir.glob("*.md")))
+
+
+def test_hashing_embedder_is_deterministic():
+    embedder = HashingEmbedder(dim=32)
+
+    a, b, c = embedder(["部署网关", "部署网关", "rotate keys"])
+
+    assert a.dtype == np.float32
+    assert np.array_equal(a, b)
+    assert not np.array_equal(a, c)
+
+
+def test_reciprocal_rank_fusion():
+    fused = dict(reciprocal_rank_fusion([["a", "b", "c"], ["b", "a"]], k=60))
+
+    assert fused["a"] == fused["b"]
+    assert fused["a"] > fused["c"]
+    assert dict(reciprocal_rank_fusion([["x"], ["x"]]))["x"] == 1.0
+
+
+class TestSectionVectorIndex:
+    """Tests for SectionVectorIndex."""
+
+    def test_search_ranks_by_cosine(self, tmp_path):
+        index = _index(
+            tmp_path,
+            {"a.md": "deploy the gateway service\n\nquarterly budget review\n\n部署网关服务"},
+        )
+        vectors = SectionVectorIndex(HashingEmbedder(dim=128))
+        vectors.sync(index)
+
+        results = vectors.search("gateway deploy", limit=2)
+
+        assert results[0][0].content == "deploy the gateway service"
+        assert results[0][1] > results[1][1]
+        assert vectors.search("部署网关", limit=1)[0][0].content == "部署网关服务"
+
+    def test_only_changed_sections_are_embedded(self, tmp_path):
+        embedder = CountingEmbedder()
+        index = _index(tmp_path, {"a.md": "alpha\n\nbeta", "b.md": "gamma"})
+        vectors = SectionVectorIndex(embedder)
+
+        assert vectors.sync(index) == 3
+        assert vectors.sync(index) == 0
+
+        # a.md is rewritten: its sections get new ids but "alpha" is unchanged
+        _update(index, {"a.md": "alpha\n\ndelta", "b.md": "gamma"})
+        assert vectors.sync(index) == 1
+
+        assert embedder.texts == ["alpha", "beta", "gamma", "delta"]
+        assert {s.content for s, _ in vectors.search("delta", limit=10)} == {
+            "alpha",
+            "delta",
+            "gamma",
+        }
+        assert vectors.search("delta", limit=1)[0][0].content == "delta"
+
+    def test_memory_mapped_matrix_survives_restart(self, tmp_path):
+        index_path = tmp_path / ".lurkbot" / "memory-index.json"
+        (tmp_path / "memory").mkdir()
+        (tmp_path / "memory" / "a.md").write_text("persistent vectors\n\nsecond section")
+        files = sorted((tmp_path / "memory").glob("*.md"))
+
+        index = MemoryIndex(tmp_path, index_path=index_path)
+        index.refresh(files)
+        vectors = SectionVectorIndex(CountingEmbedder(), "test", directory=index_path.parent)
+        vectors.sync(index)
+        vectors.close()
+
+        reopened_index = MemoryIndex(tmp_path, index_path=index_path)
+        reopened_index.refresh(files)
+        embedder = CountingEmbedder()
+        reopened = SectionVectorIndex(embedder, "test", directory=index_path.parent)
+
+        assert reopened.sync(reopened_index) == 0
+        assert embedder.texts == []
+        assert reopened.search("persistent", limit=1)[0][0].content == "persistent vectors"
+        assert reopened.get_stats()["rows"] == 2
+
+    def test_other_namespace_discards_vectors(self, tmp_path):
+        index = _index(tmp_path, {"a.md": "text"})
+        SectionVectorIndex(CountingEmbedder(), "old", directory=tmp_path / "vec").sync(index)
+
+        embedder = CountingEmbedder()
+        assert SectionVectorIndex(embedder, "new", directory=tmp_path / "vec").sync(index) == 1
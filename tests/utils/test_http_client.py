@@ -0,0 +1,179 @@
+"""共享 HTTP 客户端模块测试
+
+测试内容：
+- 连接池按基础 URL 划分并在客户端之间共享
+- 关闭客户端不影响共享连接池
+- 按主机的请求统计
+- 连接池数量上限与淘汰
+"""
+
+import httpx
+import pytest
+
+from lurkbot.utils.http_client import (
+    HTTPClientRegistry,
+    base_url_of,
+    get_http_client_registry,
+    set_http_client_registry,
+)
+
+
+class RecordingTransport(httpx.MockTransport):
+    """记录请求并跟踪关闭状态的 MockTransport"""
+
+    def __init__(self, base_url: str, log: list[tuple[str, str]]):
+        self.base_url = base_url
+        self.closed = False
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            log.append((base_url, request.url.path))
+            if request.url.path == "/redirect":
+                return httpx.Response(302, headers={"location": "https://other.example.com/landed"})
+            if request.url.path == "/fail":
+                return httpx.Response(503)
+            if request.url.path == "/boom":
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200, json={"host": base_url})
+
+        super().__init__(handler)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def transports() -> dict[str, RecordingTransport]:
+    return {}
+
+
+@pytest.fixture
+def log() -> list[tuple[str, str]]:
+    return []
+
+
+@pytest.fixture
+def registry(transports, log) -> HTTPClientRegistry:
+    def factory(base_url: str, limits: httpx.Limits) -> httpx.AsyncBaseTransport:
+        transport = RecordingTransport(base_url, log)
+        transports[base_url] = transport
+        return transport
+
+    return HTTPClientRegistry(max_connections_per_host=5, transport_factory=factory)
+
+
+def test_base_url_of():
+    """测试基础 URL 规范化"""
+    assert base_url_of("https://api.example.com/v1/items?q=1") == "https://api.example.com:443"
+    assert base_url_of("http://localhost:8848/nacos") == "http://localhost:8848"
+    assert base_url_of("HTTP://Example.com") == "http://example.com:80"
+
+
+class TestHTTPClientRegistry:
+    """测试 HTTP 客户端注册表"""
+
+    @pytest.mark.asyncio
+    async def test_pools_shared_per_host(self, registry, transports):
+        """测试同一主机的请求共享连接池"""
+        shared = registry.get_client()
+        own = registry.create_client(headers={"X-Token": "t"})
+
+        await shared.get("https://a.example.com/one")
+        await own.get("https://a.example.com/two")
+        await own.get("https://b.example.com/three")
+
+        assert set(transports) == {"https://a.example.com:443", "https://b.example.com:443"}
+        assert registry.get_client() is shared
+        assert registry.get_client("https://a.example.com") is not shared
+
+    @pytest.mark.asyncio
+    async def test_closing_client_keeps_pool(self, registry, transports):
+        """测试关闭客户端不会关闭共享连接池，注册表关闭时才关闭"""
+        client = registry.create_client()
+        await client.get("https://a.example.com/")
+        await client.aclose()
+
+        transport = transports["https://a.example.com:443"]
+        assert client.is_closed
+        assert not transport.closed
+
+        await registry.aclose()
+        assert transport.closed
+
+        # 关闭后再次请求会重新创建连接池
+        await registry.get_client().get("https://a.example.com/")
+        assert transports["https://a.example.com:443"] is not transport
+
+    @pytest.mark.asyncio
+    async def test_redirect_routed_to_target_pool(self, registry, log):
+        """测试跨主机重定向使用目标主机的连接池"""
+        client = registry.create_client(follow_redirects=True)
+
+        response = await client.get("https://a.example.com/redirect")
+
+        assert response.json() == {"host": "https://other.example.com:443"}
+        assert log == [
+            ("https://a.example.com:443", "/redirect"),
+            ("https://other.example.com:443", "/landed"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_per_host_stats(self, registry):
+        """测试按主机统计请求数、错误数和延迟"""
+        client = registry.get_client()
+        await client.get("https://a.example.com/ok")
+        await client.get("https://a.example.com/fail")
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://a.example.com/boom")
+        await client.get("https://b.example.com/ok")
+
+        stats = registry.get_stats()
+
+        a = stats["https://a.example.com:443"]
+        assert a["requests"] == 3
+        assert a["errors"] == 2
+        assert a["in_flight"] == 0
+        assert a["max_connections"] == 5
+        assert a["utilization"] == 0.0
+        assert a["max_latency_ms"] >= a["p95_latency_ms"] > 0
+        assert stats["https://b.example.com:443"]["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_pools_evicted_over_limit(self, transports):
+        """测试超过连接池上限时淘汰最久未使用的连接池"""
+
+        def factory(base_url: str, limits: httpx.Limits) -> httpx.AsyncBaseTransport:
+            transports[base_url] = RecordingTransport(base_url, [])
+            return transports[base_url]
+
+        registry = HTTPClientRegistry(max_hosts=2, transport_factory=factory)
+        client = registry.get_client()
+        for host in ("a", "b", "a", "c"):
+            await client.get(f"https://{host}.example.com/")
+
+        assert transports["https://b.example.com:443"].closed
+        assert not transports["https://a.example.com:443"].closed
+        assert registry.get_stats()["https://b.example.com:443"]["pools"] == 0
+
+    @pytest.mark.asyncio
+    async def test_host_limits_override(self):
+        """测试按主机覆盖连接数限制"""
+        registry = HTTPClientRegistry(
+            host_limits={"https://slow.example.com": httpx.Limits(max_connections=2)},
+            transport_factory=lambda base_url, limits: httpx.MockTransport(
+                lambda request: httpx.Response(200)
+            ),
+        )
+        await registry.get_client().get("https://slow.example.com/")
+
+        assert registry.get_stats()["https://slow.example.com:443"]["max_connections"] == 2
+
+
+def test_global_registry():
+    """测试替换全局注册表"""
+    registry = HTTPClientRegistry()
+    set_http_client_registry(registry)
+    try:
+        assert get_http_client_registry() is registry
+    finally:
+        set_http_client_registry(None)
+    assert get_http_client_registry() is not registry